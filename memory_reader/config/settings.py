@@ -13,6 +13,8 @@ MAX_SCAN_SIZE = 10 * 1024 * 1024  # 10 MB max per scan
 
 # Configurazioni pattern scanner
 PATTERN_SCAN_TIMEOUT = 30  # secondi
+SIGNATURE_CACHE_FILE = "cache/signatures.json"  # RVA delle firme già trovate (None = nessuna cache)
+SKIP_PAGED_OUT = False  # Windows: salta le pagine fuori dal working set (più veloce, ma perde quelle su disco)
 
 # Configurazioni processo
 AUTO_ATTACH = False  # Attacca automaticamente al primo processo trovato
@@ -21,7 +23,9 @@ REQUIRE_ADMIN = True  # Richiedi privilegi amministrativi
 # Configurazioni visualizzazione
 HEX_DUMP_WIDTH = 16  # Bytes per riga nel hex dump
 SHOW_ASCII = True  # Mostra ASCII nel hex dump
+HEX_DUMP_FILE_THRESHOLD = 64 * 1024  # Oltre questa dimensione il dump viene proposto su file
 
 # Configurazioni avanzate
-CACHE_ADDRESSES = True  # Cache degli indirizzi trovati
-MAX_CACHE_SIZE = 1000  # Numero massimo di indirizzi in cache
+CACHE_ADDRESSES = True  # Cache a pagine delle letture di MemoryReader
+MAX_CACHE_SIZE = 1000  # Numero massimo di pagine (4 KB) in cache
+CACHE_TTL = 0.5  # Secondi di validità di una pagina in cache (None = fino a invalidate_cache)
@@ -0,0 +1,86 @@
+"""
+Benchmark AOB - Confronto tra il vecchio loop per-byte e CompiledPattern
+Misura i MB/s di entrambi i metodi su un buffer sintetico (non serve un processo)
+
+Uso:
+    python examples/benchmark_aob.py [MB] [pattern]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scanners.aob import CompiledPattern
+from utils.helpers import print_header
+
+
+DEFAULT_PATTERN = "48 8B 05 ?? ?? ?? ?? 48 85 C0 74 ?? 48 8B 40"
+
+
+def legacy_search(data: bytes, pattern: str) -> int:
+    """Il vecchio algoritmo di MemoryScanner.search_pattern (loop i/j in Python)"""
+    pattern_bytes = bytearray()
+    mask = bytearray()
+    for part in pattern.split():
+        if part == "??":
+            pattern_bytes.append(0)
+            mask.append(0)
+        else:
+            pattern_bytes.append(int(part, 16))
+            mask.append(0xFF)
+
+    for i in range(len(data) - len(pattern_bytes) + 1):
+        match = True
+        for j in range(len(pattern_bytes)):
+            if mask[j] != 0 and data[i + j] != pattern_bytes[j]:
+                match = False
+                break
+        if match:
+            return i
+    return -1
+
+
+def build_buffer(size: int, pattern: str) -> bytes:
+    """Buffer casuale con un 25% di zeri e il pattern piazzato in fondo"""
+    data = bytearray(os.urandom(size))
+    data[::4] = bytes(len(data[::4]))
+
+    match = bytes(0x90 if part == "??" else int(part, 16) for part in pattern.split())
+    data[-len(match):] = match
+    return bytes(data)
+
+
+def measure(label: str, func, data: bytes, pattern: str) -> float:
+    """Esegue la ricerca e stampa throughput e offset trovato"""
+    start = time.perf_counter()
+    offset = func(data, pattern)
+    elapsed = time.perf_counter() - start
+
+    mb_per_s = len(data) / (1024 * 1024) / elapsed
+    print(f"  {label:18} {elapsed:8.3f} s  {mb_per_s:10.1f} MB/s  (offset {offset})")
+    return mb_per_s
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    pattern = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATTERN
+
+    print_header("Benchmark AOB")
+    print(f"\n📦 Buffer: {size_mb} MB - Pattern: {pattern}\n")
+
+    data = build_buffer(size_mb * 1024 * 1024, pattern)
+    compiled = CompiledPattern(pattern)
+
+    legacy = measure("Loop per-byte", legacy_search, data, pattern)
+    fast = measure("CompiledPattern", lambda d, _: compiled.find(d), data, pattern)
+    fast_view = measure("CompiledPattern (mv)", lambda d, _: compiled.find(memoryview(d)), data, pattern)
+
+    print(f"\n🚀 Speedup: {fast / legacy:.0f}x (bytes), {fast_view / legacy:.0f}x (memoryview)")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,13 +11,19 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from core.process_manager import ProcessManager
 from core.memory_reader import MemoryReader
+from core.memory_browser import MemoryBrowser
 from scanners.pattern_scanner import PatternScanner
+from scanners.signature_cache import SignatureCache
+from utils.hexdump import HexDumper
 from utils.helpers import (
     format_address, print_header, print_separator, 
     safe_int_input, confirm_action
 )
 from utils.logger import setup_logger
-import pymem.process
+from config.settings import (
+    CACHE_ADDRESSES, CACHE_TTL, MAX_CACHE_SIZE, SIGNATURE_CACHE_FILE, SKIP_PAGED_OUT,
+    HEX_DUMP_WIDTH, SHOW_ASCII, HEX_DUMP_FILE_THRESHOLD
+)
 
 
 class MenuManager:
@@ -94,13 +100,13 @@ class MenuManager:
         print_header("Connetti a un Processo")
         
         print("\n📋 Ultimi 15 processi:")
-        processes = self.process_manager.list_processes()
+        processes = self.process_manager.list_processes(limit=15)
         
-        for i, proc in enumerate(processes[:15], 1):
+        for i, proc in enumerate(processes, 1):
             print(f"  {i:2}. {proc['name']:30} (PID: {proc['pid']})")
         
         print_separator()
-        process_name = input("\n👉 Nome del processo (es: notepad.exe): ").strip()
+        process_name = input("\n👉 Nome del processo o PID (es: notepad.exe, 1234): ").strip()
         
         if not process_name:
             print("❌ Nome processo vuoto!")
@@ -108,23 +114,34 @@ class MenuManager:
             return
         
         print(f"\n🔄 Connessione a {process_name}...")
-        process = self.process_manager.attach_to_process(process_name)
+        if process_name.isdigit():
+            process = self.process_manager.attach_to_pid(int(process_name))
+            process_name = self.process_manager.process_name or process_name
+        else:
+            process = self.process_manager.attach_to_process(process_name)
         
         if process:
             self.current_process = process
             self.process_name = process_name
-            self.reader = MemoryReader(process)
-            self.scanner = PatternScanner(process)
+            self.reader = MemoryReader(
+                process,
+                cache_pages=MAX_CACHE_SIZE if CACHE_ADDRESSES else 0,
+                cache_ttl=CACHE_TTL
+            )
+            self.scanner = PatternScanner(
+                process,
+                signature_cache=SignatureCache(
+                    str(Path(__file__).parent / SIGNATURE_CACHE_FILE)
+                ) if SIGNATURE_CACHE_FILE else None,
+                skip_paged_out=SKIP_PAGED_OUT
+            )
             
             print(f"\n✅ Connesso con successo!")
             print(f"   PID: {process.process_id}")
             
             try:
-                main_module = pymem.process.module_from_name(
-                    process.process_handle, 
-                    process_name
-                )
-                print(f"   Base Address: {format_address(main_module.lpBaseOfDll)}")
+                main_module = self._find_module(process_name)
+                print(f"   Base Address: {format_address(main_module.base)}")
             except:
                 pass
             
@@ -138,15 +155,16 @@ class MenuManager:
         """Lista tutti i processi"""
         print_header("Lista Processi Attivi")
         
-        processes = self.process_manager.list_processes()
+        count = self.process_manager.process_count()
+        processes = self.process_manager.list_processes(limit=50)
         
-        print(f"\n📊 Trovati {len(processes)} processi\n")
+        print(f"\n📊 Trovati {count} processi\n")
         
-        for i, proc in enumerate(processes[:50], 1):
+        for i, proc in enumerate(processes, 1):
             print(f"{i:3}. {proc['name']:35} (PID: {proc['pid']:6})")
         
-        if len(processes) > 50:
-            print(f"\n... e altri {len(processes) - 50} processi")
+        if count > 50:
+            print(f"\n... e altri {count - 50} processi")
         
         input("\nPremi INVIO per continuare...")
     
@@ -174,7 +192,7 @@ class MenuManager:
         
         type_choice = input("\n👉 Seleziona tipo: ").strip()
         
-        print(f"\n🔍 Lettura da {format_address(address)}...")
+        print(f"\n🔍 Lettura da {format_address(address, self.scanner.modules)}...")
         
         if type_choice == "1":
             value = self.reader.read_int(address)
@@ -275,7 +293,7 @@ class MenuManager:
                 if addresses:
                     print(f"\n✅ Trovato in {len(addresses)} posizioni:")
                     for i, addr in enumerate(addresses[:10], 1):
-                        print(f"  {i}. {format_address(addr)}")
+                        print(f"  {i}. {format_address(addr, self.scanner.modules)}")
                     
                     if len(addresses) > 10:
                         print(f"  ... e altre {len(addresses) - 10} posizioni")
@@ -293,7 +311,7 @@ class MenuManager:
                 if addresses:
                     print(f"\n✅ Trovato in {len(addresses)} posizioni:")
                     for i, addr in enumerate(addresses[:10], 1):
-                        print(f"  {i}. {format_address(addr)}")
+                        print(f"  {i}. {format_address(addr, self.scanner.modules)}")
                 else:
                     print("❌ Stringa non trovata!")
         else:
@@ -317,15 +335,76 @@ class MenuManager:
         
         size = safe_int_input("Numero di bytes (default 256): ", 256)
         
-        print(f"\n🔄 Dump in corso...")
-        dump = self.reader.dump_memory(address, size)
-        
-        if dump:
-            print(dump)
-        else:
-            print("❌ Impossibile fare il dump!")
+        if size > HEX_DUMP_FILE_THRESHOLD:
+            default_path = f"dump_0x{address:X}_{size}.txt"
+            path = input(f"File di destinazione (default {default_path}): ").strip() or default_path
+            
+            print(f"\n🔄 Dump di {size:,} bytes su file in corso...")
+            written = self.reader.dump_to_file(address, size, path,
+                                               width=HEX_DUMP_WIDTH, ascii=SHOW_ASCII)
+            if written is not None:
+                print(f"✅ Dump salvato in {path} ({written:,} caratteri)")
+            
+            input("\nPremi INVIO per continuare...")
+            return
         
-        input("\nPremi INVIO per continuare...")
+        self._browse_memory(address, size)
+    
+    def _browse_memory(self, address: int, page_size: int):
+        """Vista a pagine della memoria (le pagine vicine vengono lette in background)"""
+        width = HEX_DUMP_WIDTH
+        page_size = max(width, page_size - page_size % width)
+        dumper = HexDumper(width, ascii=SHOW_ASCII)
+        
+        with MemoryBrowser(self.current_process, address, page_size) as browser:
+            while True:
+                data = browser.page()
+                
+                print_header(f"Memoria @ {format_address(browser.address, self.scanner.modules)}", 78)
+                if data is None:
+                    print("❌ Pagina illeggibile")
+                else:
+                    cursor_row = browser.cursor // width
+                    for row, line in enumerate(dumper.format(data, browser.address).split("\n")):
+                        print(("▶ " if row == cursor_row else "  ") + line)
+                    
+                    pointer = browser.pointer_at_cursor()
+                    target = format_address(pointer, self.scanner.modules) if pointer is not None else "??"
+                    print(f"\n📍 Cursore: {format_address(browser.cursor_address, self.scanner.modules)}"
+                          f" -> {target}")
+                
+                print_separator("─", 78)
+                print("  INVIO/n: avanti  p: indietro  g <ind>: vai a  c <off>: cursore  +N/-N: sposta cursore")
+                print("  f: segui puntatore  b: torna  r: aggiorna  q: esci")
+                command = input("\n👉 ").strip().lower()
+                
+                try:
+                    if command in ("", "n"):
+                        browser.next_page()
+                    elif command == "p":
+                        browser.previous_page()
+                    elif command.startswith("g "):
+                        browser.goto(int(command[2:].strip(), 16))
+                    elif command.startswith("c "):
+                        browser.set_cursor(int(command[2:].strip(), 16))
+                    elif command[:1] in ("+", "-"):
+                        browser.move_cursor(int(command, 0))
+                    elif command == "f":
+                        if browser.follow() is None:
+                            print("❌ Puntatore nullo o illeggibile!")
+                            input("\nPremi INVIO per continuare...")
+                    elif command == "b":
+                        browser.back()
+                    elif command == "r":
+                        browser.refresh()
+                    elif command == "q":
+                        break
+                    else:
+                        print("❌ Comando non valido!")
+                        input("\nPremi INVIO per continuare...")
+                except ValueError as e:
+                    print(f"❌ Valore non valido: {e}")
+                    input("\nPremi INVIO per continuare...")
     
     def show_modules(self):
         """Mostra i moduli caricati dal processo"""
@@ -372,7 +451,7 @@ class MenuManager:
         address = self.scanner.pattern_scan(pattern)
         
         if address:
-            print(f"\n✅ Pattern trovato a: {format_address(address)}")
+            print(f"\n✅ Pattern trovato a: {format_address(address, self.scanner.modules)}")
         else:
             print("❌ Pattern non trovato!")
         
@@ -396,11 +475,8 @@ class MenuManager:
             
             # Info aggiuntive
             try:
-                main_module = pymem.process.module_from_name(
-                    self.current_process.process_handle,
-                    self.process_name
-                )
-                print(f"  Module Size: {main_module.SizeOfImage:,} bytes")
+                main_module = self._find_module(self.process_name)
+                print(f"  Module Size: {main_module.size:,} bytes")
             except:
                 pass
         else:
@@ -408,6 +484,13 @@ class MenuManager:
         
         input("\nPremi INVIO per continuare...")
     
+    def _find_module(self, module_name):
+        """Modulo caricato con questo nome (dall'indice dei moduli dello scanner)"""
+        module = self.scanner.modules.get(module_name)
+        if module is None:
+            raise ValueError(f"Modulo non trovato: {module_name}")
+        return module
+    
     def _check_connection(self):
         """Verifica se c'è una connessione attiva"""
         if not self.current_process:
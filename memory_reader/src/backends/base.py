@@ -0,0 +1,168 @@
+"""
+Process Backend - Interfaccia comune per le sorgenti di memoria
+Un backend espone gli stessi metodi di pymem.Pymem usati da MemoryReader,
+MemoryScanner e PatternScanner (read_int, read_bytes, write_bytes, ...),
+più la mappa delle regioni e dei moduli, così gli stessi strumenti
+funzionano su un processo vivo, su uno snapshot o su un altro sistema.
+Le sottoclassi implementano read_bytes, enum_regions e enum_modules.
+"""
+
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from core.regions import MemoryRegion, ModuleInfo
+
+
+class ProcessBackend:
+    """
+    Sorgente di memoria compatibile con pymem.Pymem
+    """
+
+    process_id: Optional[int] = None
+    process_handle = None
+    process_name: Optional[str] = None
+
+    def read_bytes(self, address: int, length: int) -> bytes:
+        """
+        Legge length bytes dall'indirizzo
+
+        Raises:
+            OSError: Se il range non è leggibile
+        """
+        raise NotImplementedError
+
+    def write_bytes(self, address: int, value: bytes, length: int):
+        """
+        Scrive length bytes all'indirizzo
+
+        Raises:
+            OSError: Se il range non è scrivibile
+        """
+        raise OSError("Backend in sola lettura")
+
+    def enum_regions(self) -> List[MemoryRegion]:
+        """Regioni di memoria (usato da core.regions.enumerate_regions)"""
+        raise NotImplementedError
+
+    def enum_modules(self) -> List[ModuleInfo]:
+        """Moduli caricati (usato da core.regions.enumerate_modules)"""
+        return []
+
+    def resident_regions(self, regions: List[MemoryRegion]) -> Optional[List[MemoryRegion]]:
+        """
+        Regioni tagliate alle pagine residenti (usato da core.residency)
+
+        Returns:
+            None se il backend non lo sa: tutte le pagine vanno lette
+        """
+        return None
+
+    def readinto(self, address: int, buffer) -> int:
+        """Legge direttamente in un buffer scrivibile (default: read_bytes + copia)"""
+        view = memoryview(buffer).cast("B")
+        view[:] = self.read_bytes(address, len(view))
+        return len(view)
+
+    def read_many(self, requests: Sequence[Tuple[int, int]]) -> List[Optional[bytes]]:
+        """
+        Legge molti range (usato da core.batch_read); None per quelli illeggibili
+
+        Le sottoclassi con letture scatter-gather lo ridefiniscono per
+        leggere tutti i range con una sola chiamata.
+        """
+        results = []
+        for address, length in requests:
+            try:
+                results.append(self.read_bytes(address, length))
+            except OSError:
+                results.append(None)
+        return results
+
+    def close(self):
+        """Rilascia le risorse del backend"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # Metodi tipizzati come in pymem.Pymem
+
+    def _read(self, address: int, fmt: str):
+        return struct.unpack(fmt, self.read_bytes(address, struct.calcsize(fmt)))[0]
+
+    def _write(self, address: int, fmt: str, value):
+        data = struct.pack(fmt, value)
+        self.write_bytes(address, data, len(data))
+
+    def read_bool(self, address: int) -> bool:
+        return self._read(address, "<?")
+
+    def read_char(self, address: int) -> str:
+        return self.read_bytes(address, 1).decode("latin-1")
+
+    def read_uchar(self, address: int) -> int:
+        return self._read(address, "<B")
+
+    def read_short(self, address: int) -> int:
+        return self._read(address, "<h")
+
+    def read_ushort(self, address: int) -> int:
+        return self._read(address, "<H")
+
+    def read_int(self, address: int) -> int:
+        return self._read(address, "<i")
+
+    def read_uint(self, address: int) -> int:
+        return self._read(address, "<I")
+
+    def read_long(self, address: int) -> int:
+        return self._read(address, "<l")
+
+    def read_ulong(self, address: int) -> int:
+        return self._read(address, "<L")
+
+    def read_longlong(self, address: int) -> int:
+        return self._read(address, "<q")
+
+    def read_ulonglong(self, address: int) -> int:
+        return self._read(address, "<Q")
+
+    def read_float(self, address: int) -> float:
+        return self._read(address, "<f")
+
+    def read_double(self, address: int) -> float:
+        return self._read(address, "<d")
+
+    def read_string(self, address: int, byte: int = 50, encoding: str = "UTF-8") -> str:
+        data = self.read_bytes(address, byte)
+        return data.split(b"\0", 1)[0].decode(encoding)
+
+    def write_bool(self, address: int, value: bool):
+        self._write(address, "<?", value)
+
+    def write_short(self, address: int, value: int):
+        self._write(address, "<h", value)
+
+    def write_int(self, address: int, value: int):
+        self._write(address, "<i", value)
+
+    def write_uint(self, address: int, value: int):
+        self._write(address, "<I", value)
+
+    def write_longlong(self, address: int, value: int):
+        self._write(address, "<q", value)
+
+    def write_ulonglong(self, address: int, value: int):
+        self._write(address, "<Q", value)
+
+    def write_float(self, address: int, value: float):
+        self._write(address, "<f", value)
+
+    def write_double(self, address: int, value: float):
+        self._write(address, "<d", value)
+
+    def write_string(self, address: int, value: str):
+        data = value.encode("UTF-8")
+        self.write_bytes(address, data, len(data))
@@ -0,0 +1,290 @@
+"""
+Linux Backend - Accesso alla memoria di un processo Linux
+Legge con process_vm_readv (molti range per syscall, senza copie intermedie)
+e scrive con process_vm_writev; se le syscall non sono disponibili, o una
+scrittura tocca pagine protette, usa /proc/<pid>/mem. Regioni e moduli
+arrivano da /proc/<pid>/maps, le pagine residenti da /proc/<pid>/pagemap.
+"""
+
+import ctypes
+import errno
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from backends.base import ProcessBackend
+from core.regions import MemoryRegion, ModuleInfo, _enumerate_linux, _modules_linux
+from core.residency import resident_linux
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+# Numero massimo di iovec per syscall (UIO_MAXIOV)
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+# Errori che indicano syscall non utilizzabili (kernel vecchio, seccomp, ...)
+_UNSUPPORTED = (errno.ENOSYS, errno.EPERM)
+
+
+def _load_libc():
+    """Funzioni process_vm_readv/process_vm_writev della libc (None se assenti)"""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        functions = libc.process_vm_readv, libc.process_vm_writev
+    except (OSError, AttributeError):
+        return None
+
+    for function in functions:
+        function.argtypes = [ctypes.c_int, ctypes.POINTER(_IOVec), ctypes.c_ulong,
+                             ctypes.POINTER(_IOVec), ctypes.c_ulong, ctypes.c_ulong]
+        function.restype = ctypes.c_ssize_t
+    return functions
+
+
+_VM_FUNCTIONS = _load_libc()
+
+
+class LinuxBackend(ProcessBackend):
+    """
+    Processo Linux compatibile con pymem.Pymem
+
+    Esempio:
+        process = LinuxBackend(1234)
+        reader = MemoryReader(process)
+        hp = reader.read_int(0x7F1A2B3C40)
+        values = process.read_many([(0x7F1A2B3C40, 4), (0x7F1A2B5000, 8)])  # una syscall
+    """
+
+    def __init__(self, pid: int):
+        """
+        Si collega a un processo
+
+        Args:
+            pid: Process ID
+
+        Raises:
+            ProcessLookupError: Se il processo non esiste
+            PermissionError: Se la memoria del processo non è accessibile
+                (serve lo stesso utente con ptrace_scope 0, CAP_SYS_PTRACE o root)
+        """
+        if not os.path.exists(f"/proc/{pid}"):
+            raise ProcessLookupError(f"Processo {pid} non trovato")
+
+        self.process_id = pid
+        self.process_name = self._read_name(pid)
+        self._fd: Optional[int] = None
+        self._fd_writable = False
+        self._use_vm = _VM_FUNCTIONS is not None
+
+        self._check_access()
+
+    def read_bytes(self, address: int, length: int) -> bytes:
+        """
+        Legge length bytes dall'indirizzo
+
+        Raises:
+            OSError: Se il range non è leggibile
+        """
+        buffer = bytearray(length)
+        self.readinto(address, buffer)
+        return bytes(buffer)
+
+    def readinto(self, address: int, buffer) -> int:
+        """
+        Legge direttamente nel buffer del chiamante
+
+        Raises:
+            OSError: Se il range non è leggibile
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) and not self._transfer([(address, view)], write=False)[0]:
+            raise OSError(errno.EFAULT, f"Impossibile leggere 0x{address:X}+{len(view)}")
+        return len(view)
+
+    def read_many(self, requests: Sequence[Tuple[int, int]]) -> List[Optional[bytes]]:
+        """
+        Legge molti range con una sola process_vm_readv (fino a IOV_MAX range)
+
+        Un range illeggibile non fa fallire gli altri: la lettura riprende
+        dal range successivo.
+
+        Args:
+            requests: Sequenza di (indirizzo, lunghezza)
+
+        Returns:
+            Bytes di ogni range (None se illeggibile), nell'ordine di requests
+        """
+        buffer = bytearray(sum(length for _, length in requests))
+        view = memoryview(buffer)
+
+        segments = []
+        offset = 0
+        for address, length in requests:
+            segments.append((address, view[offset:offset + length]))
+            offset += length
+
+        results = []
+        for (_, segment), ok in zip(segments, self._transfer(segments, write=False)):
+            results.append(segment.tobytes() if ok else None)
+        return results
+
+    def write_bytes(self, address: int, value: bytes, length: int):
+        """
+        Scrive length bytes all'indirizzo
+
+        process_vm_writev rispetta le protezioni delle pagine: le scritture
+        su pagine di sola lettura (es. codice) passano da /proc/<pid>/mem.
+
+        Raises:
+            OSError: Se il range non è scrivibile
+        """
+        data = memoryview(bytes(value[:length]))
+        if not len(data):
+            return
+        if self._use_vm and self._transfer([(address, data)], write=True)[0]:
+            return
+
+        fd = self._mem_fd(write=True)
+        if os.pwrite(fd, data, address) != len(data):
+            raise OSError(errno.EFAULT, f"Impossibile scrivere 0x{address:X}+{len(data)}")
+
+    def enum_regions(self) -> List[MemoryRegion]:
+        return _enumerate_linux(self.process_id)
+
+    def enum_modules(self) -> List[ModuleInfo]:
+        return _modules_linux(self.enum_regions())
+
+    def resident_regions(self, regions: List[MemoryRegion]) -> List[MemoryRegion]:
+        return resident_linux(self.process_id, regions)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def close_process(self):
+        """Alias di close (come pymem.Pymem)"""
+        self.close()
+
+    @staticmethod
+    def _read_name(pid: int) -> Optional[str]:
+        """Nome del processo da /proc/<pid>/comm"""
+        try:
+            with open(f"/proc/{pid}/comm") as comm:
+                return comm.read().strip()
+        except OSError:
+            return None
+
+    def _check_access(self):
+        """Prova a leggere la prima regione leggibile per verificare i permessi"""
+        for region in self.enum_regions():
+            if region.readable:
+                try:
+                    self.read_bytes(region.base, 1)
+                except PermissionError:
+                    raise
+                except OSError:
+                    continue
+                return
+
+    def _transfer(self, segments: List[Tuple[int, memoryview]], write: bool) -> List[bool]:
+        """
+        Trasferisce i segmenti (indirizzo remoto, buffer locale)
+
+        Returns:
+            Esito di ogni segmento
+        """
+        ok = [False] * len(segments)
+        index = 0
+        while index < len(segments):
+            if not self._use_vm:
+                if write:
+                    break
+                self._transfer_mem(segments, index, ok)
+                break
+
+            batch = segments[index:index + IOV_MAX]
+            try:
+                done = self._vm_call(batch, write)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED:
+                    raise
+                # Syscall non utilizzabili: da qui in poi si usa /proc/<pid>/mem
+                self._use_vm = False
+                continue
+
+            for i in range(index, index + done):
+                ok[i] = True
+            # Il segmento dopo quelli completati è illeggibile: si riparte dal successivo
+            index += done if done == len(batch) else done + 1
+
+        return ok
+
+    def _vm_call(self, batch: List[Tuple[int, memoryview]], write: bool) -> int:
+        """
+        Una process_vm_readv/process_vm_writev per tutto il batch
+
+        Returns:
+            Numero di segmenti iniziali trasferiti per intero
+        """
+        count = len(batch)
+        local = (_IOVec * count)()
+        remote = (_IOVec * count)()
+        keep = []
+        for i, (address, view) in enumerate(batch):
+            if view.readonly:
+                target = ctypes.create_string_buffer(view.tobytes(), len(view))
+            else:
+                target = (ctypes.c_char * len(view)).from_buffer(view) if len(view) else None
+            keep.append(target)
+            local[i].iov_base = ctypes.addressof(target) if target is not None else None
+            local[i].iov_len = len(view)
+            remote[i].iov_base = address
+            remote[i].iov_len = len(view)
+
+        function = _VM_FUNCTIONS[1] if write else _VM_FUNCTIONS[0]
+        transferred = function(self.process_id, local, count, remote, count, 0)
+        if transferred < 0:
+            code = ctypes.get_errno()
+            if code == errno.EFAULT:
+                return 0  # il primo segmento non è accessibile
+            raise OSError(code, os.strerror(code))
+
+        done = 0
+        for _, view in batch:
+            if transferred < len(view):
+                break
+            transferred -= len(view)
+            done += 1
+        return done
+
+    def _transfer_mem(self, segments: List[Tuple[int, memoryview]], index: int, ok: List[bool]):
+        """Legge i segmenti da /proc/<pid>/mem (un pread per segmento)"""
+        fd = self._mem_fd(write=False)
+        for i in range(index, len(segments)):
+            address, view = segments[i]
+            try:
+                ok[i] = os.preadv(fd, [view], address) == len(view)
+            except OSError:
+                ok[i] = False
+
+    def _mem_fd(self, write: bool) -> int:
+        """Descrittore di /proc/<pid>/mem (riaperto in scrittura se serve)"""
+        if self._fd is not None and (self._fd_writable or not write):
+            return self._fd
+
+        self.close()
+        path = f"/proc/{self.process_id}/mem"
+        try:
+            self._fd = os.open(path, os.O_RDWR)
+            self._fd_writable = True
+        except PermissionError:
+            if write:
+                raise
+            self._fd = os.open(path, os.O_RDONLY)
+            self._fd_writable = False
+        return self._fd
@@ -0,0 +1,106 @@
+"""
+Snapshot Backend - Processo "finto" letto da uno snapshot su disco
+Permette di usare MemoryReader, MemoryScanner e PatternScanner su una copia
+delle regioni di un processo: le scansioni pesanti girano offline, in
+parallelo e ripetutamente, anche su Linux, senza toccare il processo vero.
+"""
+
+from typing import List, Optional
+
+from backends.base import ProcessBackend
+from core.regions import DEFAULT_CHUNK_SIZE, MemoryRegion, ModuleInfo, enumerate_regions
+from core.snapshot import MemorySnapshot
+
+
+class SnapshotBackend(ProcessBackend):
+    """
+    Backend basato su un file di MemorySnapshot
+
+    Esempio:
+        SnapshotBackend.capture(process, "game.snap")   # sulla macchina con il processo
+        ...
+        with SnapshotBackend("game.snap") as backend:   # ovunque, anche offline
+            scanner = MemoryScanner(backend)
+            scanner.search_integer(100)
+    """
+
+    def __init__(self, path: str, writable: bool = False):
+        """
+        Apre uno snapshot come backend
+
+        Args:
+            path: File dello snapshot
+            writable: Permetti le scritture (modificano il file)
+
+        Raises:
+            ValueError: Se il file non è uno snapshot valido
+        """
+        self.snapshot = MemorySnapshot(path, writable)
+        self.writable = writable
+        self.process_id = self.snapshot.index.get("pid")
+        self.process_name = self.snapshot.index.get("process_name")
+        self._modules = self.snapshot.modules
+
+    @classmethod
+    def capture(cls, process, path: str, regions: Optional[List[MemoryRegion]] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> "SnapshotBackend":
+        """
+        Copia tutte le regioni leggibili (e la lista dei moduli) in un nuovo snapshot
+
+        Args:
+            process: Oggetto Pymem (o altro backend) da copiare
+            path: File da creare (sovrascritto se esiste)
+            regions: Regioni da copiare (default: tutte le regioni leggibili)
+            chunk_size: Dimensione massima di ogni lettura
+
+        Returns:
+            SnapshotBackend aperto in sola lettura
+        """
+        if regions is None:
+            regions = enumerate_regions(process)
+        MemorySnapshot.capture(process, path, regions, chunk_size).close()
+        return cls(path)
+
+    def read_bytes(self, address: int, length: int) -> bytes:
+        """
+        Legge dallo snapshot; il range può attraversare regioni contigue
+
+        Raises:
+            OSError: Se una parte del range non è nello snapshot
+        """
+        if length <= 0:
+            return b""
+
+        parts = []
+        current, end = address, address + length
+        while current < end:
+            index = self.snapshot.find_region(current)
+            if index is None:
+                raise OSError(f"Indirizzo 0x{current:X} non presente nello snapshot")
+            chunk = min(end, self.snapshot.regions[index].end) - current
+            parts.append(self.snapshot.read(current, chunk, index))
+            current += chunk
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def write_bytes(self, address: int, value: bytes, length: int):
+        """
+        Scrive nello snapshot (solo se aperto con writable=True)
+
+        Raises:
+            OSError: Se lo snapshot è in sola lettura o il range non è nello snapshot
+        """
+        if not self.writable:
+            raise OSError("Snapshot aperto in sola lettura")
+        index = self.snapshot.find_region(address)
+        if index is None or address + length > self.snapshot.regions[index].end:
+            raise OSError(f"Range 0x{address:X}+{length} non presente nello snapshot")
+        self.snapshot.write(address, value[:length], index)
+
+    def enum_regions(self) -> List[MemoryRegion]:
+        return list(self.snapshot.regions)
+
+    def enum_modules(self) -> List[ModuleInfo]:
+        return list(self._modules)
+
+    def close(self):
+        self.snapshot.close()
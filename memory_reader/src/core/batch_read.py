@@ -0,0 +1,200 @@
+"""
+Batch Read - Letture raggruppate di molti valori
+Ordina gli indirizzi e unisce quelli vicini in poche read_bytes contigue:
+read_many restituisce i bytes di ogni richiesta, read_values decodifica
+tutti i valori in una volta con NumPy. Se il processo espone read_many
+(es. backends.linux_backend) le letture contigue partono tutte insieme.
+"""
+
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: richiesto solo da read_values
+    np = None
+
+from core.regions import DEFAULT_CHUNK_SIZE, read_chunk, read_pages
+
+
+# Indirizzi distanti meno di così vengono letti con un'unica read_bytes
+SPAN_GAP = 4096
+
+
+class Span(NamedTuple):
+    """Lettura contigua che copre una o più richieste"""
+
+    address: int
+    length: int
+    requests: List[int]  # indici delle richieste coperte
+
+    @property
+    def end(self) -> int:
+        return self.address + self.length
+
+
+def coalesce(requests: Sequence[Tuple[int, int]], gap: int = SPAN_GAP,
+             max_size: int = DEFAULT_CHUNK_SIZE) -> List[Span]:
+    """
+    Raggruppa le richieste (indirizzo, lunghezza) in letture contigue
+
+    Due richieste finiscono nella stessa lettura se il buco tra loro è al
+    massimo gap bytes e la lettura non supera max_size bytes.
+
+    Args:
+        requests: Sequenza di (indirizzo, lunghezza)
+        gap: Buco massimo tra due richieste della stessa lettura
+        max_size: Dimensione massima di una lettura
+
+    Returns:
+        Lista di Span ordinate per indirizzo
+    """
+    spans = []
+    order = sorted(range(len(requests)), key=lambda i: requests[i][0])
+
+    for i in order:
+        address, length = requests[i]
+        if spans:
+            last = spans[-1]
+            end = max(last.end, address + length)
+            if address <= last.end + gap and end - last.address <= max_size:
+                spans[-1] = last._replace(length=end - last.address)
+                last.requests.append(i)
+                continue
+        spans.append(Span(address, length, [i]))
+
+    return spans
+
+
+def read_many(process, requests: Sequence[Tuple[int, int]], gap: int = SPAN_GAP,
+              max_size: int = DEFAULT_CHUNK_SIZE) -> List[Optional[bytes]]:
+    """
+    Legge molte richieste (indirizzo, lunghezza) con il minimo di read_bytes
+
+    Se una lettura raggruppata fallisce (es. il buco tocca una pagina non
+    mappata) le sue richieste vengono rilette una per una.
+
+    Args:
+        process: Oggetto Pymem (o compatibile)
+        requests: Sequenza di (indirizzo, lunghezza)
+        gap: Buco massimo tra due richieste della stessa lettura
+        max_size: Dimensione massima di una lettura
+
+    Returns:
+        Bytes di ogni richiesta (None se illeggibile), nell'ordine di requests
+    """
+    results: List[Optional[bytes]] = [None] * len(requests)
+    retry = []
+
+    spans = coalesce(requests, gap, max_size)
+    reads = _read_spans(process, [(span.address, span.length) for span in spans], max_size)
+    for span, data in zip(spans, reads):
+        for i in span.requests:
+            address, length = requests[i]
+            if data is not None:
+                start = address - span.address
+                results[i] = data[start:start + length]
+            elif len(span.requests) > 1:
+                retry.append(i)
+
+    if retry:
+        for i, data in zip(retry, _read_spans(process, [requests[i] for i in retry], max_size)):
+            results[i] = data
+    return results
+
+
+def read_values(process, addresses, dtype, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                gap: int = SPAN_GAP) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Legge un valore del tipo indicato a ogni indirizzo, con poche letture
+
+    Args:
+        process: Oggetto Pymem (o compatibile)
+        addresses: Array di indirizzi (uint64, anche non ordinati o ripetuti)
+        dtype: dtype NumPy dei valori (es. "<i4", "<u8")
+        chunk_size: Dimensione massima di una singola lettura
+        gap: Distanza massima tra due indirizzi letti insieme
+
+    Returns:
+        Tuple (valori, maschera degli indirizzi letti con successo), nell'ordine di addresses
+    """
+    dtype = np.dtype(dtype)
+    addresses = np.asarray(addresses, dtype=np.uint64)
+    values = np.zeros(len(addresses), dtype=dtype)
+    valid = np.ones(len(addresses), dtype=bool)
+    if len(addresses) == 0:
+        return values, valid
+
+    # Gli indirizzi non ordinati si leggono ordinati e si rimettono al loro posto
+    order = None
+    if np.any(addresses[1:] < addresses[:-1]):
+        order = np.argsort(addresses, kind="stable")
+        addresses = addresses[order]
+
+    size = dtype.itemsize
+    sorted_values = values if order is None else np.zeros(len(addresses), dtype=dtype)
+    sorted_valid = valid if order is None else np.ones(len(addresses), dtype=bool)
+
+    # Gruppi di indirizzi vicini: si spezza dove il salto supera gap
+    breaks = np.flatnonzero(np.diff(addresses) > gap) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(addresses)]))
+    columns = np.arange(size)
+
+    groups = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        while start < end:
+            # Limita anche la dimensione di ogni singola lettura
+            first = int(addresses[start])
+            stop = start + int(np.searchsorted(addresses[start:end], first + chunk_size))
+            groups.append((start, stop, first, int(addresses[stop - 1]) + size - first))
+            start = stop
+
+    spans = [(first, length) for _, _, first, length in groups]
+    for (start, stop, first, length), data in zip(groups, _read_spans(process, spans, chunk_size)):
+        group = addresses[start:stop]
+        if data is None:
+            # Pagine illeggibili nel gruppo (es. guard page): solo i valori che
+            # le toccano restano non validi
+            bulk = read_pages(process, first, length)
+            data = bulk.data
+            pages = np.frombuffer(bulk.valid, dtype=np.uint8).astype(bool)
+            first_page = first // bulk.page_size
+            head = (group // np.uint64(bulk.page_size)).astype(np.intp) - first_page
+            tail = ((group + np.uint64(size - 1)) // np.uint64(bulk.page_size)).astype(np.intp) - first_page
+            sorted_valid[start:stop] = pages[head] & pages[tail]
+
+        offsets = (group - np.uint64(first)).astype(np.intp)
+        raw = np.frombuffer(data, dtype=np.uint8)[offsets[:, None] + columns]
+        sorted_values[start:stop] = raw.view(dtype).ravel()
+
+    if order is not None:
+        values[order] = sorted_values
+        valid[order] = sorted_valid
+    return values, valid
+
+
+def _read_spans(process, spans: Sequence[Tuple[int, int]],
+                max_bytes: int = DEFAULT_CHUNK_SIZE) -> Iterator[Optional[bytes]]:
+    """
+    Legge le letture contigue (indirizzo, lunghezza), nell'ordine
+
+    Con process.read_many le letture vengono passate in gruppi di al massimo
+    max_bytes bytes (una chiamata per gruppo), altrimenti una read_bytes ciascuna.
+
+    Yields:
+        Bytes di ogni lettura (None se illeggibile)
+    """
+    if not hasattr(process, "read_many"):
+        for address, length in spans:
+            yield read_chunk(process, address, length)
+        return
+
+    batch, total = [], 0
+    for address, length in spans:
+        if batch and total + length > max_bytes:
+            yield from process.read_many(batch)
+            batch, total = [], 0
+        batch.append((address, length))
+        total += length
+    if batch:
+        yield from process.read_many(batch)
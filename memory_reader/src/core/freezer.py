@@ -0,0 +1,196 @@
+"""
+Freezer - Blocco di valori in memoria
+Un thread in background riscrive i valori congelati: una lettura raggruppata
+controlla quali sono cambiati, le voci adiacenti da riscrivere diventano
+un'unica write_bytes e gli errori finiscono in contatori per voce
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from core.batch_read import read_many
+from core.memory_reader import MemoryReader
+from utils.value_types import get_value_type
+
+
+class FreezeEntry:
+    """Valore congelato con i suoi contatori"""
+
+    def __init__(self, address: int, value_type: str, value):
+        self.address = address
+        self.value_type = value_type
+        self.value = value
+        if value_type == "bytes":
+            self.data = bytes(value)
+        else:
+            self.data = get_value_type(value_type).pack(value)
+
+        self.writes = 0     # riscritture riuscite
+        self.skipped = 0    # controlli in cui il valore era già corretto
+        self.failures = 0   # riscritture fallite
+        self.last_error: Optional[str] = None
+
+    @property
+    def end(self) -> int:
+        return self.address + len(self.data)
+
+    def stats(self) -> dict:
+        """Contatori della voce"""
+        return {
+            'value': self.value,
+            'type': self.value_type,
+            'writes': self.writes,
+            'skipped': self.skipped,
+            'failures': self.failures,
+            'last_error': self.last_error,
+        }
+
+
+class ValueFreezer:
+    """
+    Servizio che mantiene fissi dei valori in memoria
+
+    Esempio:
+        freezer = ValueFreezer(reader)
+        freezer.freeze(0x1A2B3C40, 999, "int")
+        freezer.freeze(0x1A2B3C44, 100.0, "float")
+        freezer.start()
+        ...
+        print(freezer.stats())
+        freezer.stop()
+    """
+
+    def __init__(self, reader, interval: float = 0.05):
+        """
+        Inizializza il servizio
+
+        Args:
+            reader: MemoryReader (o oggetto Pymem compatibile)
+            interval: Secondi tra due controlli in modalità continua (start)
+        """
+        self.process = reader.process if isinstance(reader, MemoryReader) else reader
+        # Le scritture vanno al processo: la cache a pagine del reader va invalidata
+        self.reader = reader if isinstance(reader, MemoryReader) else None
+        self.interval = interval
+
+        self._entries: Dict[int, FreezeEntry] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def freeze(self, address: int, value, value_type: str = "int"):
+        """
+        Congela (o aggiorna) il valore a un indirizzo
+
+        Args:
+            address: Indirizzo di memoria
+            value: Valore da mantenere
+            value_type: "int", "long", "float", "double", ... oppure "bytes"
+
+        Raises:
+            ValueError: Se il tipo non è supportato
+        """
+        entry = FreezeEntry(address, value_type, value)
+        with self._lock:
+            self._entries[address] = entry
+
+    def unfreeze(self, address: int):
+        """Smette di mantenere il valore a un indirizzo"""
+        with self._lock:
+            self._entries.pop(address, None)
+
+    def clear(self):
+        """Rimuove tutti i valori congelati"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[int, dict]:
+        """Contatori di ogni voce (indirizzo -> dizionario)"""
+        with self._lock:
+            return {address: entry.stats() for address, entry in self._entries.items()}
+
+    def apply(self) -> int:
+        """
+        Un passaggio: legge tutti i valori e riscrive solo quelli cambiati
+
+        Returns:
+            Numero di write_bytes eseguite
+        """
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda entry: entry.address)
+            current = read_many(self.process, [(entry.address, len(entry.data)) for entry in entries])
+
+            dirty = []
+            for entry, data in zip(entries, current):
+                if data == entry.data:
+                    entry.skipped += 1
+                else:
+                    dirty.append(entry)
+
+            groups = self._group(dirty)
+            for group in groups:
+                self._write(group)
+            return len(groups)
+
+    def start(self):
+        """Avvia il servizio in un thread in background"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ValueFreezer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ferma il servizio (i valori restano quelli scritti per ultimi)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @staticmethod
+    def _group(entries: List[FreezeEntry]) -> List[List[FreezeEntry]]:
+        """Raggruppa le voci contigue (ordinate per indirizzo) in un'unica scrittura"""
+        groups = []
+        for entry in entries:
+            if groups and groups[-1][-1].end == entry.address:
+                groups[-1].append(entry)
+            else:
+                groups.append([entry])
+        return groups
+
+    def _write(self, group: List[FreezeEntry]):
+        """Scrive un gruppo di voci contigue con una sola write_bytes"""
+        data = b"".join(entry.data for entry in group)
+        try:
+            self.process.write_bytes(group[0].address, data, len(data))
+        except Exception as e:
+            for entry in group:
+                entry.failures += 1
+                entry.last_error = str(e)
+        else:
+            for entry in group:
+                entry.writes += 1
+        finally:
+            # Anche una scrittura fallita può aver modificato parte del range
+            if self.reader is not None:
+                self.reader.invalidate_cache(group[0].address, len(data))
+
+    def _run(self):
+        """Ciclo del thread: apply ogni interval secondi"""
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                self.apply()
+            except Exception as e:
+                print(f"❌ Errore nel blocco dei valori: {e}")
+            self._stop.wait(max(0.0, self.interval - (time.perf_counter() - started)))
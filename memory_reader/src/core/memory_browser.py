@@ -0,0 +1,263 @@
+"""
+Memory Browser - Vista a pagine della memoria con prefetch
+Mostra la memoria una pagina alla volta (avanti/indietro, salto a un
+indirizzo, segui il puntatore sotto il cursore). Le pagine vicine a quella
+corrente vengono lette in background da un thread e tenute in una piccola
+cache LRU, così lo scorrimento non attende una lettura per ogni pagina.
+"""
+
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from core.regions import read_chunk
+
+
+# Pagine lette in anticipo da ogni lato della pagina corrente
+DEFAULT_PREFETCH = 2
+
+# Pagine tenute in cache (correnti + prefetch + qualche pagina già vista)
+DEFAULT_MAX_PAGES = 16
+
+
+class MemoryBrowser:
+    """
+    Navigazione a pagine nella memoria di un processo
+
+    Esempio:
+        browser = MemoryBrowser(process, 0x1A2B3C40, page_size=256)
+        data = browser.page()          # pagina corrente (le vicine in background)
+        browser.next_page()
+        browser.move_cursor(0x18)
+        browser.follow()               # salta all'indirizzo puntato
+        browser.back()
+        browser.close()
+    """
+
+    def __init__(self, process, address: int, page_size: int = 256, pointer_size: int = 8,
+                 prefetch: int = DEFAULT_PREFETCH, max_pages: int = DEFAULT_MAX_PAGES,
+                 ttl: Optional[float] = 2.0):
+        """
+        Inizializza il browser
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            address: Indirizzo della prima pagina mostrata
+            page_size: Bytes per pagina
+            pointer_size: Dimensione dei puntatori (8 = 64 bit, 4 = 32 bit)
+            prefetch: Pagine lette in anticipo prima e dopo quella corrente (0 = nessuna)
+            max_pages: Pagine tenute in cache
+            ttl: Secondi di validità di una pagina in cache (None = fino a refresh)
+
+        Raises:
+            ValueError: Se page_size o pointer_size non sono validi
+        """
+        if page_size <= 0:
+            raise ValueError(f"Dimensione pagina non valida: {page_size}")
+        if pointer_size not in (4, 8):
+            raise ValueError(f"Dimensione puntatore non valida: {pointer_size}")
+
+        self.process = process
+        self.page_size = page_size
+        self.pointer_size = pointer_size
+        self.prefetch = max(0, prefetch)
+        self.max_pages = max(1 + 2 * self.prefetch, max_pages)
+        self.ttl = ttl
+
+        self.address = address
+        self.cursor = 0
+        self.history: List[Tuple[int, int]] = []
+
+        # indirizzo pagina -> (dati o None se illeggibile, istante di lettura)
+        self._pages: "OrderedDict[int, tuple]" = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-prefetch")
+
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def cursor_address(self) -> int:
+        """Indirizzo sotto il cursore"""
+        return self.address + self.cursor
+
+    def page(self) -> Optional[bytes]:
+        """
+        Dati della pagina corrente (dalla cache, dal prefetch o con una lettura)
+
+        Dopo ogni chiamata le pagine vicine vengono lette in background.
+
+        Returns:
+            Bytes della pagina o None se illeggibile
+        """
+        data = self._get(self.address)
+        self._schedule_prefetch()
+        return data
+
+    def next_page(self):
+        """Passa alla pagina successiva"""
+        self.address += self.page_size
+
+    def previous_page(self):
+        """Passa alla pagina precedente"""
+        self.address = max(0, self.address - self.page_size)
+
+    def goto(self, address: int, remember: bool = True):
+        """
+        Salta a un indirizzo (diventa l'inizio della pagina, cursore a 0)
+
+        Args:
+            address: Nuovo indirizzo
+            remember: Salva la posizione attuale nella cronologia (per back)
+        """
+        if remember:
+            self.history.append((self.address, self.cursor))
+        self.address = address
+        self.cursor = 0
+
+    def back(self) -> bool:
+        """
+        Torna alla posizione precedente a goto/follow
+
+        Returns:
+            False se la cronologia è vuota
+        """
+        if not self.history:
+            return False
+        self.address, self.cursor = self.history.pop()
+        return True
+
+    def move_cursor(self, delta: int):
+        """
+        Sposta il cursore (se esce dalla pagina, cambia pagina)
+
+        Args:
+            delta: Bytes di spostamento (negativo = indietro)
+        """
+        position = max(0, self.cursor_address + delta)
+        while position < self.address:
+            self.previous_page()
+        while position >= self.address + self.page_size:
+            self.next_page()
+        self.cursor = position - self.address
+
+    def set_cursor(self, offset: int):
+        """
+        Posiziona il cursore a un offset dall'inizio della pagina
+
+        Raises:
+            ValueError: Se l'offset è fuori dalla pagina
+        """
+        if not 0 <= offset < self.page_size:
+            raise ValueError(f"Offset fuori dalla pagina: 0x{offset:X}")
+        self.cursor = offset
+
+    def pointer_at_cursor(self) -> Optional[int]:
+        """
+        Valore del puntatore sotto il cursore
+
+        Returns:
+            Indirizzo letto o None se illeggibile
+        """
+        end = self.cursor + self.pointer_size
+        data = self.page()
+        if data is not None and end <= len(data):
+            raw = data[self.cursor:end]
+        else:
+            # Il puntatore è a cavallo con la pagina successiva
+            raw = read_chunk(self.process, self.cursor_address, self.pointer_size)
+            if raw is None:
+                return None
+        return struct.unpack("<Q" if self.pointer_size == 8 else "<I", raw)[0]
+
+    def follow(self) -> Optional[int]:
+        """
+        Salta all'indirizzo contenuto nel puntatore sotto il cursore
+
+        Returns:
+            Nuovo indirizzo o None se il puntatore è illeggibile o nullo
+        """
+        target = self.pointer_at_cursor()
+        if not target:
+            return None
+        self.goto(target)
+        return target
+
+    def refresh(self):
+        """Scarta le pagine in cache (la memoria del processo può essere cambiata)"""
+        with self._lock:
+            self._pages.clear()
+
+    def close(self):
+        """Ferma il thread di prefetch"""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        self._executor.shutdown(wait=False)
+
+    def _get(self, address: int) -> Optional[bytes]:
+        """Pagina dalla cache; se manca attende il prefetch in corso o la legge subito"""
+        with self._lock:
+            cached = self._cached(address)
+            if cached is not None:
+                self.hits += 1
+                return cached[0]
+            pending: Optional[Future] = self._pending.get(address)
+
+        self.misses += 1
+        if pending is not None and not pending.cancel():
+            # Lettura già in corso nel thread di prefetch: basta attenderla
+            return pending.result()
+        # Non ancora iniziata (o nessun prefetch): la pagina corrente non fa la coda
+        return self._load(address)
+
+    def _cached(self, address: int, touch: bool = True) -> Optional[tuple]:
+        """Voce della cache se presente e non scaduta (chiamare con il lock)"""
+        entry = self._pages.get(address)
+        if entry is None:
+            return None
+        if self.ttl is not None and time.monotonic() - entry[1] > self.ttl:
+            del self._pages[address]
+            return None
+        if touch:
+            self._pages.move_to_end(address)
+        return entry
+
+    def _load(self, address: int) -> Optional[bytes]:
+        """Legge una pagina e la mette in cache"""
+        data = read_chunk(self.process, address, self.page_size)
+        with self._lock:
+            self._pages[address] = (data, time.monotonic())
+            self._pages.move_to_end(address)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            self._pending.pop(address, None)
+        return data
+
+    def _schedule_prefetch(self):
+        """Accoda in background la lettura delle pagine vicine non ancora in cache"""
+        if not self.prefetch:
+            return
+
+        # Prima le pagine successive (lo scorrimento più comune), poi le precedenti
+        offsets = list(range(1, self.prefetch + 1)) + list(range(-1, -self.prefetch - 1, -1))
+        with self._lock:
+            for offset in offsets:
+                address = self.address + offset * self.page_size
+                if address < 0 or address in self._pending or self._cached(address, False):
+                    continue
+                try:
+                    self._pending[address] = self._executor.submit(self._load, address)
+                except RuntimeError:  # executor chiuso
+                    return
@@ -3,9 +3,18 @@ Memory Reader - Lettura della memoria
 Fornisce metodi per leggere diversi tipi di dati dalla memoria
 """
 
-import pymem
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple, Union
 import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: read_array restituisce un memoryview
+    np = None
+
+from core.page_cache import PageCache
+from utils.hexdump import HexDumper
+from utils.value_types import VALUE_TYPES, get_value_type
 
 
 class MemoryReader:
@@ -13,14 +22,38 @@ class MemoryReader:
     Classe per leggere dati dalla memoria di un processo
     """
     
-    def __init__(self, process: pymem.Pymem):
+    def __init__(self, process, cache_pages: int = 0, cache_ttl: Optional[float] = None):
         """
         Inizializza il Memory Reader
         
         Args:
-            process: Oggetto Pymem connesso a un processo
+            process: Oggetto Pymem (o backend compatibile) connesso a un processo
+            cache_pages: Pagine da 4 KB da tenere in cache (0 = nessuna cache)
+            cache_ttl: Secondi di validità di una pagina in cache (None = fino a invalidate_cache)
         """
         self.process = process
+        self.cache = PageCache(process, cache_pages, cache_ttl) if cache_pages > 0 else None
+    
+    def invalidate_cache(self, address: Optional[int] = None, length: int = 1):
+        """
+        Scarta le pagine in cache (tutte o solo quelle di un range)
+        
+        Args:
+            address: Indirizzo iniziale del range (None = tutta la cache)
+            length: Lunghezza del range
+        """
+        if self.cache is not None:
+            self.cache.invalidate(address, length)
+    
+    def _read(self, address: int, length: int) -> bytes:
+        """Legge bytes (dalla cache se attiva), sollevando eccezioni"""
+        if self.cache is not None:
+            return self.cache.read(address, length)
+        return self.process.read_bytes(address, length)
+    
+    def _read_cached(self, address: int, fmt: str):
+        """Legge e decodifica un valore dalla cache a pagine"""
+        return struct.unpack(fmt, self.cache.read(address, struct.calcsize(fmt)))[0]
         
     def read_int(self, address: int) -> Optional[int]:
         """
@@ -33,6 +66,8 @@ class MemoryReader:
             Valore intero o None se errore
         """
         try:
+            if self.cache is not None:
+                return self._read_cached(address, '<i')
             return self.process.read_int(address)
         except Exception as e:
             print(f"❌ Errore lettura int a 0x{address:X}: {e}")
@@ -49,6 +84,8 @@ class MemoryReader:
             Valore long o None se errore
         """
         try:
+            if self.cache is not None:
+                return self._read_cached(address, '<q')
             return self.process.read_longlong(address)
         except Exception as e:
             print(f"❌ Errore lettura long a 0x{address:X}: {e}")
@@ -65,6 +102,8 @@ class MemoryReader:
             Valore float o None se errore
         """
         try:
+            if self.cache is not None:
+                return self._read_cached(address, '<f')
             return self.process.read_float(address)
         except Exception as e:
             print(f"❌ Errore lettura float a 0x{address:X}: {e}")
@@ -81,6 +120,8 @@ class MemoryReader:
             Valore double o None se errore
         """
         try:
+            if self.cache is not None:
+                return self._read_cached(address, '<d')
             return self.process.read_double(address)
         except Exception as e:
             print(f"❌ Errore lettura double a 0x{address:X}: {e}")
@@ -98,11 +139,93 @@ class MemoryReader:
             Bytes letti o None se errore
         """
         try:
-            return self.process.read_bytes(address, length)
+            return self._read(address, length)
         except Exception as e:
             print(f"❌ Errore lettura bytes a 0x{address:X}: {e}")
             return None
     
+    def read_struct(self, address: int, layout: Union[str, struct.Struct, Dict[str, Tuple[int, str]]]):
+        """
+        Legge una struttura con una sola lettura
+        
+        Args:
+            address: Indirizzo della struttura
+            layout: Formato struct (es. "<iif") o struct.Struct, oppure
+                    dizionario nome -> (offset, tipo) (es. {"hp": (0x10, "int")})
+            
+        Returns:
+            Tupla di valori (formato) o dizionario nome -> valore (layout), None se errore
+        """
+        try:
+            if isinstance(layout, dict):
+                fields = [(name, offset, get_value_type(value_type)) for name, (offset, value_type) in layout.items()]
+                data = self._read(address, max(offset + vtype.size for _, offset, vtype in fields))
+                return {name: struct.unpack_from(vtype.fmt, data, offset)[0] for name, offset, vtype in fields}
+            
+            compiled = layout if isinstance(layout, struct.Struct) else struct.Struct(layout)
+            return compiled.unpack(self._read(address, compiled.size))
+        except Exception as e:
+            print(f"❌ Errore lettura struttura a 0x{address:X}: {e}")
+            return None
+    
+    def read_array(self, address: int, dtype: str, count: int, out=None):
+        """
+        Legge un array di valori con una sola lettura
+        
+        Args:
+            address: Indirizzo del primo elemento
+            dtype: Tipo degli elementi ("int", "float", ... o un dtype NumPy)
+            count: Numero di elementi
+            out: Array NumPy preallocato da riempire (evita allocazioni nei cicli)
+            
+        Returns:
+            Array NumPy (o memoryview tipizzato se NumPy non è installato), None se errore
+        """
+        try:
+            value_type = VALUE_TYPES.get(dtype) if isinstance(dtype, str) else None
+            
+            if np is None:
+                if value_type is None:
+                    raise ValueError(f"Senza NumPy il tipo deve essere uno di {', '.join(VALUE_TYPES)}")
+                buffer = bytearray(count * value_type.size)
+                if self.readinto(address, buffer) is None:
+                    return None
+                return memoryview(buffer).cast(value_type.typecode)
+            
+            array = out if out is not None else np.empty(count, dtype=value_type.dtype if value_type else dtype)
+            if self.readinto(address, array) is None:
+                return None
+            return array
+        except Exception as e:
+            print(f"❌ Errore lettura array a 0x{address:X}: {e}")
+            return None
+    
+    def readinto(self, address: int, buffer) -> Optional[int]:
+        """
+        Legge direttamente in un buffer preallocato dal chiamante
+        
+        Args:
+            address: Indirizzo di memoria
+            buffer: Oggetto scrivibile (bytearray, memoryview, array NumPy contiguo)
+            
+        Returns:
+            Numero di bytes letti o None se errore
+        """
+        try:
+            view = memoryview(buffer).cast("B")
+            if self.cache is not None:
+                view[:] = self.cache.read(address, len(view))
+            elif hasattr(self.process, "readinto"):
+                self.process.readinto(address, view)
+            elif sys.platform == "win32":
+                _read_process_memory(self.process.process_handle, address, view)
+            else:
+                view[:] = self.process.read_bytes(address, len(view))
+            return len(view)
+        except Exception as e:
+            print(f"❌ Errore lettura a 0x{address:X}: {e}")
+            return None
+    
     def read_string(self, address: int, max_length: int = 256) -> Optional[str]:
         """
         Legge una stringa ASCII
@@ -115,6 +238,9 @@ class MemoryReader:
             Stringa letta o None se errore
         """
         try:
+            if self.cache is not None:
+                data = self.cache.read(address, max_length)
+                return data.split(b"\0", 1)[0].decode("utf-8")
             return self.process.read_string(address, max_length)
         except Exception as e:
             print(f"❌ Errore lettura stringa a 0x{address:X}: {e}")
@@ -136,24 +262,30 @@ class MemoryReader:
             
             if offsets:
                 for offset in offsets[:-1]:
-                    current_address = self.process.read_longlong(current_address)
+                    current_address = self._read_pointer_value(current_address)
                     if current_address:
                         current_address += offset
                     else:
                         return None
                 
                 # Ultimo offset
-                current_address = self.process.read_longlong(current_address)
+                current_address = self._read_pointer_value(current_address)
                 if current_address and offsets:
                     current_address += offsets[-1]
             else:
-                current_address = self.process.read_longlong(current_address)
+                current_address = self._read_pointer_value(current_address)
                 
             return current_address
         except Exception as e:
             print(f"❌ Errore lettura pointer a 0x{address:X}: {e}")
             return None
     
+    def _read_pointer_value(self, address: int) -> int:
+        """Legge un puntatore a 64 bit (dalla cache se attiva)"""
+        if self.cache is not None:
+            return self._read_cached(address, '<q')
+        return self.process.read_longlong(address)
+    
     def write_int(self, address: int, value: int) -> bool:
         """
         Scrive un intero a 32 bit
@@ -167,6 +299,7 @@ class MemoryReader:
         """
         try:
             self.process.write_int(address, value)
+            self.invalidate_cache(address, 4)
             return True
         except Exception as e:
             print(f"❌ Errore scrittura int a 0x{address:X}: {e}")
@@ -185,6 +318,7 @@ class MemoryReader:
         """
         try:
             self.process.write_float(address, value)
+            self.invalidate_cache(address, 4)
             return True
         except Exception as e:
             print(f"❌ Errore scrittura float a 0x{address:X}: {e}")
@@ -203,6 +337,7 @@ class MemoryReader:
         """
         try:
             self.process.write_bytes(address, value, len(value))
+            self.invalidate_cache(address, len(value))
             return True
         except Exception as e:
             print(f"❌ Errore scrittura bytes a 0x{address:X}: {e}")
@@ -224,27 +359,43 @@ class MemoryReader:
             if not data:
                 return None
                 
-            result = []
-            result.append(f"\nMemory Dump @ 0x{address:X} ({size} bytes):")
-            result.append("=" * 60)
-            
-            for i in range(0, len(data), 16):
-                chunk = data[i:i+16]
-                
-                # Indirizzo
-                hex_str = f"{address + i:08X}  "
-                
-                # Bytes in hex
-                hex_bytes = " ".join(f"{b:02X}" for b in chunk)
-                hex_str += f"{hex_bytes:<48}  "
-                
-                # ASCII rappresentation
-                ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-                hex_str += ascii_str
-                
-                result.append(hex_str)
-            
-            return "\n".join(result)
+            header = f"\nMemory Dump @ 0x{address:X} ({size} bytes):\n" + "=" * 60
+            # 3 spazi prima della colonna ASCII, come il formato storico del dump
+            return header + "\n" + HexDumper(ascii_gap=3).format(data, address)
         except Exception as e:
             print(f"❌ Errore dump memoria: {e}")
             return None
+    
+    def dump_to_file(self, address: int, size: int, path: str, collapse: bool = True,
+                     width: int = 16, ascii: bool = True) -> Optional[int]:
+        """
+        Scrive l'hex dump di un range (anche centinaia di MB) direttamente su file
+        
+        Args:
+            address: Indirizzo di inizio
+            size: Numero di bytes da dumpare
+            path: File di destinazione
+            collapse: Righe uguali alla precedente sostituite da "*"
+            width: Bytes per riga
+            ascii: Includi la colonna ASCII
+            
+        Returns:
+            Numero di caratteri scritti o None se errore
+        """
+        try:
+            return HexDumper(width, ascii=ascii, collapse=collapse).write(self.process, address, size, path)
+        except Exception as e:
+            print(f"❌ Errore dump su file: {e}")
+            return None
+
+
+def _read_process_memory(handle, address: int, view: memoryview):
+    """ReadProcessMemory direttamente nel buffer del chiamante (Windows)"""
+    import ctypes
+    
+    target = (ctypes.c_char * len(view)).from_buffer(view)
+    read = ctypes.c_size_t()
+    if not ctypes.windll.kernel32.ReadProcessMemory(
+        ctypes.c_void_p(handle), ctypes.c_void_p(address), target, len(view), ctypes.byref(read)
+    ) or read.value != len(view):
+        raise OSError(f"ReadProcessMemory fallita ({ctypes.GetLastError()})")
@@ -0,0 +1,149 @@
+"""
+Module Index - Indice dei moduli caricati
+Enumera i moduli una volta per collegamento e li indicizza per nome
+(dizionario) e per indirizzo (basi ordinate + ricerca binaria), così ogni
+indirizzo si può mostrare come "modulo+0xOFFSET" senza rienumerare.
+L'indice si aggiorna su richiesta o quando cambia il numero di moduli.
+"""
+
+import sys
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from core.regions import ModuleInfo, enumerate_modules
+
+
+class ModuleIndex:
+    """
+    Moduli di un processo indicizzati per nome e per indirizzo
+
+    Esempio:
+        modules = ModuleIndex(process)
+        game = modules.get("game.exe")
+        module, offset = modules.find(0x7FF6A1B21234)
+        print(modules.format_address(0x7FF6A1B21234))  # "game.exe+0x1234"
+    """
+
+    def __init__(self, process, auto_refresh: bool = True):
+        """
+        Inizializza l'indice (la prima enumerazione avviene al primo uso)
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            auto_refresh: Se un nome non si trova, riverifica il numero di moduli
+                e ricostruisce l'indice se è cambiato (es. DLL caricata dopo)
+        """
+        self.process = process
+        self.auto_refresh = auto_refresh
+
+        self._modules: Optional[List[ModuleInfo]] = None
+        self._by_name: Dict[str, ModuleInfo] = {}
+        self._bases: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def __iter__(self):
+        return iter(self.modules)
+
+    @property
+    def modules(self) -> List[ModuleInfo]:
+        """Moduli ordinati per indirizzo base"""
+        if self._modules is None:
+            self.refresh()
+        return self._modules
+
+    def refresh(self):
+        """Rienumera i moduli e ricostruisce l'indice"""
+        modules = sorted(enumerate_modules(self.process), key=lambda module: module.base)
+
+        by_name = {}
+        for module in modules:
+            # A parità di nome vince il primo modulo (quello con base più bassa)
+            by_name.setdefault(module.name.lower(), module)
+
+        self._modules = modules
+        self._by_name = by_name
+        self._bases = [module.base for module in modules]
+
+    def changed(self) -> bool:
+        """
+        Verifica se il numero di moduli del processo è cambiato
+
+        Su Windows conta solo gli handle (EnumProcessModulesEx), senza
+        leggere nome e informazioni di ogni modulo.
+        """
+        if self._modules is None:
+            return True
+        if sys.platform == "win32" and not hasattr(self.process, "enum_modules"):
+            count = _count_modules_windows(self.process.process_handle)
+        else:
+            count = len(enumerate_modules(self.process))
+        return count != len(self._modules)
+
+    def refresh_if_changed(self) -> bool:
+        """
+        Ricostruisce l'indice solo se il numero di moduli è cambiato
+
+        Returns:
+            True se l'indice è stato ricostruito
+        """
+        if self.changed():
+            self.refresh()
+            return True
+        return False
+
+    def get(self, name: str) -> Optional[ModuleInfo]:
+        """
+        Modulo per nome (senza distinzione tra maiuscole e minuscole)
+
+        Returns:
+            ModuleInfo o None se il modulo non è caricato
+        """
+        key = name.lower()
+        if self._modules is None:
+            self.refresh()
+        module = self._by_name.get(key)
+        if module is None and self.auto_refresh and self.refresh_if_changed():
+            module = self._by_name.get(key)
+        return module
+
+    def find(self, address: int) -> Optional[Tuple[ModuleInfo, int]]:
+        """
+        Modulo che contiene l'indirizzo (ricerca binaria sulle basi)
+
+        Returns:
+            Tuple (modulo, offset dalla base) o None se l'indirizzo è fuori dai moduli
+        """
+        modules = self.modules
+        index = bisect_right(self._bases, address) - 1
+        if index < 0:
+            return None
+        module = modules[index]
+        if address >= module.end:
+            return None
+        return module, address - module.base
+
+    def format_address(self, address: int) -> str:
+        """
+        Indirizzo come "modulo+0xOFFSET" (o "0xINDIRIZZO" fuori dai moduli)
+        """
+        found = self.find(address)
+        if found is None:
+            return f"0x{address:X}"
+        module, offset = found
+        return f"{module.name}+0x{offset:X}"
+
+
+def _count_modules_windows(handle) -> int:
+    """Numero di moduli caricati (EnumProcessModulesEx chiamata solo per la dimensione)"""
+    import ctypes
+    from ctypes import wintypes
+
+    LIST_MODULES_ALL = 0x03
+    needed = wintypes.DWORD()
+    if not ctypes.windll.psapi.EnumProcessModulesEx(
+        wintypes.HANDLE(handle), None, 0, ctypes.byref(needed), LIST_MODULES_ALL
+    ):
+        raise OSError(f"EnumProcessModulesEx fallita ({ctypes.GetLastError()})")
+    return needed.value // ctypes.sizeof(ctypes.c_void_p)
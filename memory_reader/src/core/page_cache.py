@@ -0,0 +1,151 @@
+"""
+Page Cache - Cache a pagine delle letture di memoria
+Tiene in memoria le pagine da 4 KB lette di recente (LRU con limite di
+dimensione); una pagina scade dopo il TTL o quando la generazione viene
+incrementata con invalidate(). Le pagine mancanti contigue vengono lette
+con un'unica read_bytes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+PAGE_SIZE = 4096
+
+
+class PageCache:
+    """
+    Cache LRU di pagine di memoria di un processo
+
+    Esempio:
+        cache = PageCache(process, max_pages=1000, ttl=0.5)
+        data = cache.read(0x1A2B3C40, 4)
+        cache.invalidate()  # es. dopo aver fatto avanzare il processo
+    """
+
+    def __init__(self, process, max_pages: int = 1000, ttl: Optional[float] = None,
+                 page_size: int = PAGE_SIZE):
+        """
+        Inizializza la cache
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            max_pages: Numero massimo di pagine in cache
+            ttl: Secondi di validità di una pagina (None = fino a invalidate)
+            page_size: Dimensione di una pagina
+        """
+        self.process = process
+        self.max_pages = max(1, max_pages)
+        self.ttl = ttl
+        self.page_size = page_size
+
+        # pagina -> (dati, generazione, istante di lettura)
+        self._pages: "OrderedDict[int, tuple]" = OrderedDict()
+        self.generation = 0
+        self._lock = threading.Lock()  # invalidate può arrivare da altri thread (es. ValueFreezer)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def read(self, address: int, length: int) -> bytes:
+        """
+        Legge un range di memoria passando dalla cache
+
+        Args:
+            address: Indirizzo iniziale
+            length: Numero di bytes
+
+        Returns:
+            Bytes letti
+
+        Raises:
+            Exception: L'errore di read_bytes se una pagina non è leggibile
+        """
+        if length <= 0:
+            return b""
+        with self._lock:
+            return self._read(address, length)
+
+    def _read(self, address: int, length: int) -> bytes:
+        """Corpo di read (chiamare con il lock)"""
+        first = address - address % self.page_size
+        last = address + length - 1
+        last -= last % self.page_size
+
+        pages = []
+        missing_start = None
+        page = first
+        while page <= last:
+            data = self._get(page)
+            if data is None:
+                if missing_start is None:
+                    missing_start = page
+            else:
+                if missing_start is not None:
+                    pages.extend(self._fetch(missing_start, page))
+                    missing_start = None
+                pages.append(data)
+            page += self.page_size
+        if missing_start is not None:
+            pages.extend(self._fetch(missing_start, page))
+
+        start = address - first
+        if len(pages) == 1:
+            return pages[0][start:start + length]
+        return b"".join(pages)[start:start + length]
+
+    def invalidate(self, address: Optional[int] = None, length: int = 1):
+        """
+        Invalida la cache
+
+        Args:
+            address: Invalida solo le pagine di questo range (None = tutta la cache)
+            length: Lunghezza del range
+        """
+        with self._lock:
+            if address is None:
+                # Le pagine delle generazioni precedenti scadono alla prossima lettura
+                self.generation += 1
+                return
+
+            page = address - address % self.page_size
+            while page < address + length:
+                self._pages.pop(page, None)
+                page += self.page_size
+
+    def _get(self, page: int) -> Optional[bytes]:
+        """Pagina in cache se ancora valida"""
+        entry = self._pages.get(page)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        data, generation, read_at = entry
+        if generation != self.generation or (self.ttl is not None and time.monotonic() - read_at > self.ttl):
+            del self._pages[page]
+            self.misses += 1
+            return None
+
+        self._pages.move_to_end(page)
+        self.hits += 1
+        return data
+
+    def _fetch(self, start: int, end: int):
+        """Legge le pagine [start, end) con una sola read_bytes e le mette in cache"""
+        data = self.process.read_bytes(start, end - start)
+        now = time.monotonic()
+
+        pages = []
+        for offset in range(0, end - start, self.page_size):
+            page_data = data[offset:offset + self.page_size]
+            self._pages[start + offset] = (page_data, self.generation, now)
+            self._pages.move_to_end(start + offset)
+            pages.append(page_data)
+
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return pages
@@ -0,0 +1,150 @@
+"""
+Pagemap - Lettura dei flag per pagina di /proc/<pid>/pagemap (solo Linux)
+Ogni pagina virtuale ha una voce da 8 bytes: bit 63 = presente in RAM,
+bit 62 = nello swap, bit 55 = soft-dirty, bit 0-54 = PFN (visibile solo
+con CAP_SYS_ADMIN). Le voci si leggono a blocchi e le pagine con i flag
+richiesti vengono unite in range contigui.
+"""
+
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: senza NumPy le voci si decodificano con struct
+    np = None
+
+
+PAGE_SIZE = mmap.PAGESIZE
+
+# Flag di una voce di pagemap
+PM_SOFT_DIRTY = 1 << 55
+PM_SWAPPED = 1 << 62
+PM_PRESENT = 1 << 63
+PM_PFN_MASK = (1 << 55) - 1
+
+# Voci lette per chiamata (8 bytes ciascuna)
+PAGEMAP_BATCH = 64 * 1024
+
+_zero_pfn: Optional[int] = None
+
+
+def pagemap_ranges(path: str, regions, flags: int, exclude_pfn: int = 0) -> List[Tuple[int, int]]:
+    """
+    Pagine con almeno uno dei flag indicati, unite in range contigui
+
+    I range non attraversano mai il confine tra due regioni.
+
+    Args:
+        path: File pagemap (es. "/proc/1234/pagemap")
+        regions: Regioni (oggetti con base e size, es. MemoryRegion)
+        flags: Maschera di flag (es. PM_PRESENT | PM_SWAPPED)
+        exclude_pfn: Escludi le pagine presenti con questo PFN (0 = nessuna)
+
+    Returns:
+        Lista ordinata di tuple (indirizzo, lunghezza)
+
+    Raises:
+        OSError: Se il file non si può leggere
+    """
+    ranges = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        for region in sorted(regions, key=lambda r: r.base):
+            first = region.base // PAGE_SIZE
+            last = (region.base + region.size + PAGE_SIZE - 1) // PAGE_SIZE
+            for start in range(first, last, PAGEMAP_BATCH):
+                count = min(PAGEMAP_BATCH, last - start)
+                data = os.pread(fd, count * 8, start * 8)
+                for page, pages in flag_runs(data, flags, exclude_pfn):
+                    address = max((start + page) * PAGE_SIZE, region.base)
+                    end = min((start + page + pages) * PAGE_SIZE, region.base + region.size)
+                    if ranges and ranges[-1][0] + ranges[-1][1] == address > region.base:
+                        ranges[-1] = (ranges[-1][0], end - ranges[-1][0])
+                    else:
+                        ranges.append((address, end - address))
+    finally:
+        os.close(fd)
+    return ranges
+
+
+def flag_runs(data: bytes, flags: int, exclude_pfn: int = 0) -> List[Tuple[int, int]]:
+    """
+    Sequenze di pagine con almeno uno dei flag in un blocco di voci di pagemap
+
+    Args:
+        data: Voci di pagemap
+        flags: Maschera di flag
+        exclude_pfn: Escludi le pagine presenti con questo PFN (0 = nessuna)
+
+    Returns:
+        Lista di tuple (indice prima pagina, numero di pagine)
+    """
+    count = len(data) // 8
+    excluded = PM_PRESENT | exclude_pfn
+    if np is not None:
+        entries = np.frombuffer(data, dtype="<u8", count=count)
+        marked = (entries & np.uint64(flags)) != 0
+        if exclude_pfn:
+            marked &= (entries & np.uint64(PM_PRESENT | PM_PFN_MASK)) != np.uint64(excluded)
+        marked = marked.astype(np.int8)
+        edges = np.flatnonzero(np.diff(marked, prepend=np.int8(0), append=np.int8(0)))
+        return list(zip(edges[0::2].tolist(), (edges[1::2] - edges[0::2]).tolist()))
+
+    runs = []
+    start = None
+    for page, (entry,) in enumerate(struct.iter_unpack("<Q", data[:count * 8])):
+        if entry & flags and not (exclude_pfn and entry & (PM_PRESENT | PM_PFN_MASK) == excluded):
+            if start is None:
+                start = page
+        elif start is not None:
+            runs.append((start, page - start))
+            start = None
+    if start is not None:
+        runs.append((start, count - start))
+    return runs
+
+
+def zero_pfn() -> int:
+    """
+    PFN della pagina zero condivisa del kernel (calcolato una volta)
+
+    Una pagina anonima mai scritta ma già letta (es. da una scansione
+    precedente) è "presente" ma mappata sulla pagina zero: con il suo PFN
+    si riconosce come vuota.
+
+    Returns:
+        PFN o 0 se non disponibile (PFN visibili solo con CAP_SYS_ADMIN)
+    """
+    global _zero_pfn
+    if _zero_pfn is None:
+        _zero_pfn = 0
+        try:
+            page = mmap.mmap(-1, PAGE_SIZE, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+            try:
+                page[0]  # una lettura mappa la pagina zero, senza allocare
+                address = buffer_address(page)
+                fd = os.open("/proc/self/pagemap", os.O_RDONLY)
+                try:
+                    entry = struct.unpack("<Q", os.pread(fd, 8, address // PAGE_SIZE * 8))[0]
+                finally:
+                    os.close(fd)
+            finally:
+                page.close()
+            if entry & PM_PRESENT:
+                _zero_pfn = entry & PM_PFN_MASK
+        except (OSError, ValueError, AttributeError, struct.error):
+            pass
+    return _zero_pfn
+
+
+def buffer_address(buffer) -> int:
+    """Indirizzo di un buffer scrivibile (es. mmap) nel processo corrente"""
+    import ctypes
+    view = ctypes.c_char.from_buffer(buffer)
+    try:
+        return ctypes.addressof(view)
+    finally:
+        del view  # rilascia il buffer (altrimenti mmap.close fallisce)
@@ -0,0 +1,183 @@
+"""
+Pointer Resolver - Risoluzione in blocco di molte catene di puntatori
+Compila le catene in un albero dei prefissi: i prefissi comuni vengono
+letti una sola volta e ogni livello dell'albero si risolve con un'unica
+lettura raggruppata (read_many). I puntatori intermedi restano in cache
+fino al tick successivo.
+"""
+
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from core.batch_read import read_many
+
+
+_POINTER = struct.Struct("<Q")
+
+
+class _Node(NamedTuple):
+    """Nodo dell'albero: indirizzo del nodo padre letto come puntatore + offset"""
+
+    parent: Optional[int]  # None per le radici (offset = indirizzo base)
+    offset: int
+    level: int
+
+
+class PointerChainResolver:
+    """
+    Risolve molte catene di puntatori con poche letture
+
+    Le catene seguono la semantica di MemoryReader.read_pointer: a ogni
+    livello si legge il puntatore e si somma l'offset; un puntatore nullo
+    o illeggibile rende None.
+
+    Esempio:
+        resolver = PointerChainResolver(process)
+        resolver.add("hp", base + 0x10, [0x48, 0x20])
+        resolver.add("mp", base + 0x10, [0x48, 0x24])
+        while True:
+            resolver.tick()
+            addresses = resolver.resolve_all()
+    """
+
+    def __init__(self, process, chains: Optional[Dict[str, Tuple[int, List[int]]]] = None):
+        """
+        Inizializza il resolver
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            chains: Dizionario nome -> (indirizzo base, offsets) (opzionale)
+        """
+        self.process = process
+
+        self._nodes: List[_Node] = []
+        self._node_ids: Dict[Tuple[Optional[int], int], int] = {}
+        self._levels: List[List[int]] = []
+        self._chains: Dict[str, int] = {}
+
+        # Cache del tick corrente: indirizzo -> puntatore letto (None = illeggibile)
+        self._pointers: Dict[int, Optional[int]] = {}
+
+        for name, (address, offsets) in (chains or {}).items():
+            self.add(name, address, offsets)
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+    def add(self, name: str, address: int, offsets: Optional[List[int]] = None):
+        """
+        Aggiunge (o sostituisce) una catena
+
+        Args:
+            name: Nome della catena
+            address: Indirizzo base
+            offsets: Offsets da seguire (vuoto = legge solo il puntatore base)
+        """
+        # read_pointer(address, []) legge il puntatore base: equivale all'offset 0
+        offsets = list(offsets) if offsets else [0]
+
+        replaced = name in self._chains
+        node = self._node(None, address, 0)
+        for level, offset in enumerate(offsets, 1):
+            node = self._node(node, offset, level)
+        self._chains[name] = node
+        if replaced:
+            self._rebuild()
+
+    def remove(self, name: str):
+        """Rimuove una catena e i nodi non più usati da altre catene"""
+        if self._chains.pop(name, None) is not None:
+            self._rebuild()
+
+    def tick(self):
+        """Svuota la cache dei puntatori: il prossimo resolve rilegge la memoria"""
+        self._pointers.clear()
+
+    def resolve(self, name: str) -> Optional[int]:
+        """
+        Risolve una catena, usando i puntatori già letti in questo tick
+
+        Returns:
+            Indirizzo finale o None se la catena non esiste o si interrompe
+        """
+        node = self._chains.get(name)
+        if node is None:
+            return None
+
+        path = self._path(node)
+        address = self._nodes[path[0]].offset
+        for node in path[1:]:
+            missing = [] if address in self._pointers else [address]
+            self._read_pointers(missing)
+            pointer = self._pointers[address]
+            if not pointer:
+                return None
+            address = pointer + self._nodes[node].offset
+        return address
+
+    def resolve_all(self) -> Dict[str, Optional[int]]:
+        """
+        Risolve tutte le catene: una lettura raggruppata per livello dell'albero
+
+        Returns:
+            Dizionario nome -> indirizzo finale (None se la catena si interrompe)
+        """
+        addresses: Dict[int, Optional[int]] = {}
+        for level, nodes in enumerate(self._levels):
+            if level == 0:
+                for node in nodes:
+                    addresses[node] = self._nodes[node].offset
+                continue
+
+            parents = {addresses[self._nodes[node].parent] for node in nodes}
+            parents.discard(None)
+            self._read_pointers([address for address in parents if address not in self._pointers])
+
+            for node in nodes:
+                parent = addresses[self._nodes[node].parent]
+                pointer = self._pointers.get(parent) if parent is not None else None
+                addresses[node] = pointer + self._nodes[node].offset if pointer else None
+
+        return {name: addresses[node] for name, node in self._chains.items()}
+
+    def _node(self, parent: Optional[int], offset: int, level: int) -> int:
+        """Id del nodo (parent, offset), creato se non esiste"""
+        key = (parent, offset)
+        node = self._node_ids.get(key)
+        if node is None:
+            node = len(self._nodes)
+            self._nodes.append(_Node(parent, offset, level))
+            self._node_ids[key] = node
+            if level == len(self._levels):
+                self._levels.append([])
+            self._levels[level].append(node)
+        return node
+
+    def _path(self, node: int) -> List[int]:
+        """Nodi dalla radice fino al nodo indicato"""
+        path = []
+        while node is not None:
+            path.append(node)
+            node = self._nodes[node].parent
+        path.reverse()
+        return path
+
+    def _rebuild(self):
+        """Ricostruisce l'albero dalle sole catene rimaste (scarta i nodi orfani)"""
+        chains = {}
+        for name, node in self._chains.items():
+            path = [self._nodes[node].offset for node in self._path(node)]
+            chains[name] = (path[0], path[1:])
+
+        self._nodes, self._node_ids, self._levels, self._chains = [], {}, [], {}
+        for name, (address, offsets) in chains.items():
+            self.add(name, address, offsets)
+
+    def _read_pointers(self, addresses: List[int]):
+        """Legge i puntatori mancanti con un'unica lettura raggruppata"""
+        if not addresses:
+            return
+
+        results = read_many(self.process, [(address, _POINTER.size) for address in addresses])
+        for address, data in zip(addresses, results):
+            self._pointers[address] = _POINTER.unpack(data)[0] if data else None
@@ -1,13 +1,23 @@
 """
 Process Manager - Gestione dei processi
 Gestisce l'attacco e la gestione dei processi in esecuzione
+(pymem su Windows, backends.linux_backend su Linux)
 """
 
-import pymem
-import pymem.process
+import heapq
+import sys
 from typing import Optional, List, Dict
 import psutil
 
+try:
+    import pymem
+    import pymem.process
+except ImportError:  # solo Windows: su Linux si usa LinuxBackend
+    pymem = None
+
+from backends.base import ProcessBackend
+from core.regions import enumerate_modules
+
 
 class ProcessManager:
     """
@@ -16,32 +26,60 @@ class ProcessManager:
     
     def __init__(self):
         """Inizializza il Process Manager"""
-        self.current_process: Optional[pymem.Pymem] = None
+        self.current_process: Optional["pymem.Pymem"] = None
         self.process_name: Optional[str] = None
         
-    def list_processes(self) -> List[Dict[str, any]]:
+        # Cache dei nomi tra una lista e l'altra: PID -> nome
+        self._names: Dict[int, str] = {}
+        
+    def list_processes(self, name_prefix: Optional[str] = None, limit: Optional[int] = None,
+                       top_memory: Optional[int] = None, with_memory: bool = False,
+                       refresh: bool = False) -> List[Dict[str, any]]:
         """
-        Restituisce una lista di tutti i processi attivi
+        Restituisce i processi attivi, ordinati per nome
         
+        I nomi restano in cache tra una chiamata e l'altra: si interrogano solo
+        i PID nuovi e si scartano quelli terminati. La memoria (RSS) viene letta
+        solo se richiesta e solo per i processi selezionati.
+        
+        Args:
+            name_prefix: Solo i processi il cui nome inizia così (senza maiuscole)
+            limit: Numero massimo di processi (i primi in ordine di nome)
+            top_memory: Solo gli N processi con più memoria, ordinati per RSS decrescente
+            with_memory: Aggiungi la chiave 'memory' (RSS in bytes)
+            refresh: Rileggi i nomi di tutti i processi, non solo dei nuovi
+            
         Returns:
-            Lista di dizionari con informazioni sui processi
+            Lista di dizionari {'pid', 'name'[, 'memory']}
         """
-        processes = []
+        names = self._update_names(refresh)
         
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-            try:
-                info = proc.info
-                processes.append({
-                    'pid': info['pid'],
-                    'name': info['name'],
-                    'memory': info['memory_info'].rss if info['memory_info'] else 0
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-                
-        return sorted(processes, key=lambda x: x['name'].lower())
+        processes = [{'pid': pid, 'name': name} for pid, name in names.items()]
+        if name_prefix:
+            prefix = name_prefix.lower()
+            processes = [proc for proc in processes if proc['name'].lower().startswith(prefix)]
+        
+        if top_memory is not None:
+            for proc in processes:
+                proc['memory'] = self._memory(proc['pid'])
+            return heapq.nlargest(top_memory, processes, key=lambda x: x['memory'])
+        
+        key = lambda x: (x['name'].lower(), x['pid'])
+        if limit is not None:
+            processes = heapq.nsmallest(limit, processes, key=key)
+        else:
+            processes.sort(key=key)
+        
+        if with_memory:
+            for proc in processes:
+                proc['memory'] = self._memory(proc['pid'])
+        return processes
     
-    def attach_to_process(self, process_name: str) -> Optional[pymem.Pymem]:
+    def process_count(self) -> int:
+        """Numero di processi attivi (dalla cache aggiornata dei nomi)"""
+        return len(self._update_names())
+    
+    def attach_to_process(self, process_name: str) -> Optional["pymem.Pymem"]:
         """
         Si attacca a un processo specifico per nome
         
@@ -49,8 +87,15 @@ class ProcessManager:
             process_name: Nome del processo (es. "notepad.exe")
             
         Returns:
-            Oggetto Pymem se successo, None altrimenti
+            Oggetto Pymem (LinuxBackend su Linux) se successo, None altrimenti
         """
+        if sys.platform != "win32":
+            pid = self._find_pid(process_name)
+            if pid is None:
+                print(f"❌ Processo '{process_name}' non trovato")
+                return None
+            return self._attach_linux(pid, process_name)
+        
         try:
             self.current_process = pymem.Pymem(process_name)
             self.process_name = process_name
@@ -65,7 +110,7 @@ class ProcessManager:
             print(f"❌ Errore durante l'attacco al processo: {e}")
             return None
     
-    def attach_to_pid(self, pid: int) -> Optional[pymem.Pymem]:
+    def attach_to_pid(self, pid: int) -> Optional["pymem.Pymem"]:
         """
         Si attacca a un processo specifico per PID
         
@@ -73,11 +118,25 @@ class ProcessManager:
             pid: Process ID
             
         Returns:
-            Oggetto Pymem se successo, None altrimenti
+            Oggetto Pymem (LinuxBackend su Linux) se successo, None altrimenti
         """
+        if sys.platform != "win32":
+            return self._attach_linux(pid)
+        
         try:
-            process_name = pymem.process.process_from_id(pid).name
-            return self.attach_to_process(process_name)
+            process = pymem.Pymem()
+            process.open_process_from_id(pid)
+            process_name = self._update_names().get(pid) or pymem.process.process_from_id(pid).name
+            process.process_name = process_name
+            self.current_process = process
+            self.process_name = process_name
+            return self.current_process
+        except pymem.exception.ProcessNotFound:
+            print(f"❌ Processo con PID {pid} non trovato")
+            return None
+        except pymem.exception.CouldNotOpenProcess:
+            print(f"❌ Impossibile aprire il PID {pid} - Privilegi amministrativi necessari")
+            return None
         except Exception as e:
             print(f"❌ Errore durante l'attacco al PID {pid}: {e}")
             return None
@@ -93,16 +152,82 @@ class ProcessManager:
             return None
             
         try:
+            if isinstance(self.current_process, ProcessBackend):
+                base_address = self._main_module_base()
+            else:
+                base_address = self.current_process.process_base.base_address
             return {
                 'name': self.process_name,
                 'pid': self.current_process.process_id,
-                'base_address': self.current_process.process_base.base_address,
+                'base_address': base_address,
                 'handle': self.current_process.process_handle
             }
         except Exception as e:
             print(f"❌ Errore nel recupero informazioni: {e}")
             return None
     
+    def _find_pid(self, process_name: str) -> Optional[int]:
+        """PID del primo processo con questo nome (None se non esiste)"""
+        pids = [pid for pid, name in self._update_names().items() if name == process_name]
+        return min(pids) if pids else None
+    
+    def _update_names(self, refresh: bool = False) -> Dict[int, str]:
+        """
+        Aggiorna la cache dei nomi: interroga solo i PID nuovi, scarta quelli terminati
+        
+        Un PID riusato da un nuovo processo mantiene il nome vecchio fino a refresh=True.
+        """
+        pids = psutil.pids()
+        if refresh:
+            self._names.clear()
+        else:
+            alive = set(pids)
+            for pid in [pid for pid in self._names if pid not in alive]:
+                del self._names[pid]
+        
+        for pid in pids:
+            if pid not in self._names:
+                try:
+                    self._names[pid] = psutil.Process(pid).name()
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    pass
+        return self._names
+    
+    @staticmethod
+    def _memory(pid: int) -> int:
+        """RSS del processo in bytes (0 se non accessibile)"""
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return 0
+    
+    def _attach_linux(self, pid: int, process_name: Optional[str] = None) -> Optional[ProcessBackend]:
+        """Si collega con LinuxBackend (process_vm_readv / /proc/<pid>/mem)"""
+        from backends.linux_backend import LinuxBackend
+        
+        try:
+            self.current_process = LinuxBackend(pid)
+            self.process_name = process_name or self.current_process.process_name
+            return self.current_process
+        except ProcessLookupError:
+            print(f"❌ Processo con PID {pid} non trovato")
+            return None
+        except PermissionError:
+            print(f"❌ Impossibile leggere la memoria del PID {pid} - "
+                  f"servono root, CAP_SYS_PTRACE o kernel.yama.ptrace_scope=0")
+            return None
+        except Exception as e:
+            print(f"❌ Errore durante l'attacco al PID {pid}: {e}")
+            return None
+    
+    def _main_module_base(self) -> Optional[int]:
+        """Indirizzo base del modulo principale (primo modulo con il nome del processo)"""
+        modules = enumerate_modules(self.current_process)
+        for module in modules:
+            if module.name == self.process_name:
+                return module.base
+        return modules[0].base if modules else None
+    
     def close(self):
         """Chiude la connessione al processo"""
         if self.current_process:
@@ -0,0 +1,402 @@
+"""
+Regions - Mappa delle regioni di memoria
+Enumera le regioni committed/leggibili di un processo (VirtualQueryEx su
+Windows, /proc/<pid>/maps su Linux) e ne legge il contenuto a blocchi grandi.
+Enumera anche i moduli (immagini eseguibili e librerie) caricati.
+"""
+
+import os
+import sys
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+
+# Dimensione massima di una singola lettura durante le scansioni (16 MB)
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Granularità delle pagine illeggibili (guard page, pagine non mappate)
+PAGE_SIZE = 4096
+
+# Costanti Windows (winnt.h)
+MEM_COMMIT = 0x1000
+PAGE_NOACCESS = 0x01
+PAGE_GUARD = 0x100
+
+_WIN_PROTECTION = {
+    0x02: "r--",  # PAGE_READONLY
+    0x04: "rw-",  # PAGE_READWRITE
+    0x08: "rw-",  # PAGE_WRITECOPY
+    0x10: "--x",  # PAGE_EXECUTE
+    0x20: "r-x",  # PAGE_EXECUTE_READ
+    0x40: "rwx",  # PAGE_EXECUTE_READWRITE
+    0x80: "rwx",  # PAGE_EXECUTE_WRITECOPY
+}
+
+# Pseudo-mappature Linux che non si possono leggere tramite /proc/<pid>/mem
+_LINUX_SKIP = ("[vvar]", "[vvar_vclock]", "[vsyscall]")
+
+
+class MemoryRegion(NamedTuple):
+    """Regione contigua di memoria con la stessa protezione"""
+
+    base: int
+    size: int
+    protection: str  # formato "rwx", es. "r-x"
+    path: str = ""
+
+    @property
+    def end(self) -> int:
+        return self.base + self.size
+
+    @property
+    def readable(self) -> bool:
+        return self.protection[0] == "r"
+
+    @property
+    def writable(self) -> bool:
+        return self.protection[1] == "w"
+
+    @property
+    def executable(self) -> bool:
+        return self.protection[2] == "x"
+
+
+class ModuleInfo(NamedTuple):
+    """Immagine di un modulo caricato (eseguibile o libreria)"""
+
+    name: str
+    base: int
+    size: int
+    path: str = ""
+
+    @property
+    def end(self) -> int:
+        return self.base + self.size
+
+
+def enumerate_regions(process, readable_only: bool = True, writable_only: bool = False,
+                      start_address: Optional[int] = None,
+                      end_address: Optional[int] = None) -> List[MemoryRegion]:
+    """
+    Restituisce le regioni di memoria committed del processo, ordinate per indirizzo
+
+    Se il processo espone enum_regions() (backends.base.ProcessBackend) la
+    mappa arriva dal backend invece che dal sistema operativo.
+
+    Args:
+        process: Oggetto Pymem (o compatibile) connesso a un processo
+        readable_only: Solo regioni leggibili
+        writable_only: Solo regioni scrivibili
+        start_address: Taglia le regioni sotto questo indirizzo (opzionale)
+        end_address: Taglia le regioni sopra questo indirizzo (opzionale)
+
+    Returns:
+        Lista di MemoryRegion
+    """
+    if hasattr(process, "enum_regions"):
+        regions = process.enum_regions()
+    elif sys.platform == "win32":
+        regions = _enumerate_windows(process.process_handle)
+    else:
+        regions = _enumerate_linux(process.process_id)
+
+    result = []
+    for region in regions:
+        if readable_only and not region.readable:
+            continue
+        if writable_only and not region.writable:
+            continue
+
+        base, end = region.base, region.end
+        if start_address is not None:
+            base = max(base, start_address)
+        if end_address is not None:
+            end = min(end, end_address)
+        if base >= end:
+            continue
+
+        if (base, end) != (region.base, region.end):
+            region = region._replace(base=base, size=end - base)
+        result.append(region)
+
+    return result
+
+
+def enumerate_modules(process) -> List[ModuleInfo]:
+    """
+    Restituisce i moduli caricati dal processo, ordinati per indirizzo
+
+    Su Linux un modulo è l'insieme delle mappature contigue dello stesso file,
+    più l'eventuale mappatura anonima che segue subito (.bss).
+
+    Args:
+        process: Oggetto Pymem (o compatibile) connesso a un processo
+
+    Returns:
+        Lista di ModuleInfo
+    """
+    if hasattr(process, "enum_modules"):
+        return process.enum_modules()
+    if sys.platform == "win32":
+        return _modules_windows(process.process_handle)
+    return _modules_linux(_enumerate_linux(process.process_id))
+
+
+def find_module(modules: List[ModuleInfo], address: int) -> Optional[ModuleInfo]:
+    """
+    Modulo che contiene l'indirizzo
+
+    Returns:
+        ModuleInfo o None se l'indirizzo non appartiene a nessun modulo
+    """
+    for module in modules:
+        if module.base <= address < module.end:
+            return module
+    return None
+
+
+def split_regions(regions: List[MemoryRegion], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  overlap: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Divide le regioni in unità di lettura di al massimo chunk_size bytes
+
+    Ogni unità (tranne l'ultima di una regione) include `overlap` bytes
+    dell'unità successiva, così i match a cavallo di due unità non vanno persi.
+    Un match appartiene all'unità solo se il suo offset è < chunk_size.
+
+    Args:
+        regions: Regioni da dividere
+        chunk_size: Bytes "propri" di ogni unità
+        overlap: Bytes extra letti oltre la fine dell'unità
+
+    Yields:
+        Tuple (indirizzo, bytes da leggere)
+    """
+    for region in regions:
+        address = region.base
+        while address < region.end:
+            yield address, min(chunk_size + overlap, region.end - address)
+            address += chunk_size
+
+
+def iter_region_chunks(process, regions: List[MemoryRegion], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       overlap: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    Legge le regioni a blocchi di al massimo chunk_size bytes (vedi split_regions)
+
+    Args:
+        process: Oggetto Pymem (o compatibile)
+        regions: Regioni da leggere
+        chunk_size: Bytes "propri" di ogni blocco
+        overlap: Bytes extra letti oltre la fine del blocco
+
+    Yields:
+        Tuple (indirizzo, dati)
+    """
+    for address, length in split_regions(regions, chunk_size, overlap):
+        data = read_chunk(process, address, length)
+        if data:
+            yield address, data
+
+
+def read_chunk(process, address: int, length: int) -> Optional[bytes]:
+    """
+    Legge un blocco di una regione senza sollevare eccezioni
+
+    Returns:
+        Bytes letti o None (la regione può essere stata liberata dopo l'enumerazione)
+    """
+    try:
+        return process.read_bytes(address, length)
+    except Exception:
+        return None
+
+
+class PageRead(NamedTuple):
+    """Risultato di read_pages: dati e validità di ogni pagina toccata dal range"""
+
+    address: int
+    data: bytes             # pagine illeggibili riempite di zeri
+    valid: bytearray        # un byte per pagina: 1 = letta, 0 = illeggibile
+    error: Optional[str]    # primo errore incontrato (None se tutto leggibile)
+    page_size: int = PAGE_SIZE
+
+    @property
+    def complete(self) -> bool:
+        """True se tutte le pagine sono state lette"""
+        return all(self.valid)
+
+    @property
+    def readable_bytes(self) -> int:
+        """Bytes letti davvero"""
+        return sum(end - start for start, end in self.runs())
+
+    def runs(self, readable: bool = True) -> List[Tuple[int, int]]:
+        """
+        Sequenze di pagine leggibili (o illeggibili) come offset nei dati
+
+        Returns:
+            Lista di tuple (inizio, fine) relative a data
+        """
+        first_page = self.address // self.page_size
+        result = []
+        for page, flag in enumerate(self.valid):
+            if bool(flag) != readable:
+                continue
+            start = max((first_page + page) * self.page_size, self.address) - self.address
+            end = min((first_page + page + 1) * self.page_size - self.address, len(self.data))
+            if result and result[-1][1] == start:
+                result[-1] = (result[-1][0], end)
+            else:
+                result.append((start, end))
+        return result
+
+
+def read_pages(process, address: int, length: int, page_size: int = PAGE_SIZE) -> PageRead:
+    """
+    Legge un range anche se contiene pagine illeggibili (guard, non mappate)
+
+    Prima prova una lettura unica; se fallisce divide il range a metà (sul
+    confine di pagina) e riprova solo le metà che falliscono, fino alla
+    singola pagina. Con k pagine illeggibili servono circa 2k·log2(pagine)
+    letture invece di una per pagina.
+
+    Args:
+        process: Oggetto Pymem (o compatibile)
+        address: Indirizzo iniziale
+        length: Numero di bytes
+        page_size: Granularità della validità
+
+    Returns:
+        PageRead con i dati (zeri nelle pagine illeggibili) e la validità per pagina
+    """
+    first_page = address // page_size
+    pages = (address + length + page_size - 1) // page_size - first_page
+
+    data, error = _try_read(process, address, length)
+    if data is not None:
+        return PageRead(address, data, bytearray(b"\1") * pages, None, page_size)
+
+    buffer = bytearray(length)
+    valid = bytearray(pages)
+    failing = [(address, address + length)]
+    while failing:
+        low, high = failing.pop()
+        middle = ((low + high) // 2) // page_size * page_size
+        if middle <= low:
+            middle = (low // page_size + 1) * page_size
+        if middle >= high:
+            continue  # singola pagina illeggibile
+
+        for start, end in ((low, middle), (middle, high)):
+            chunk, _ = _try_read(process, start, end - start)
+            if chunk is None:
+                failing.append((start, end))
+                continue
+            buffer[start - address:end - address] = chunk
+            valid[start // page_size - first_page:(end - 1) // page_size - first_page + 1] = \
+                b"\1" * ((end - 1) // page_size - start // page_size + 1)
+
+    return PageRead(address, bytes(buffer), valid, error, page_size)
+
+
+def _try_read(process, address: int, length: int) -> Tuple[Optional[bytes], Optional[str]]:
+    """Lettura che restituisce l'errore invece di sollevarlo"""
+    try:
+        return process.read_bytes(address, length), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _enumerate_windows(handle) -> List[MemoryRegion]:
+    """Percorre lo spazio di indirizzi con VirtualQueryEx"""
+    import ctypes
+    from ctypes import wintypes
+
+    class MEMORY_BASIC_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("BaseAddress", ctypes.c_void_p),
+            ("AllocationBase", ctypes.c_void_p),
+            ("AllocationProtect", wintypes.DWORD),
+            ("RegionSize", ctypes.c_size_t),
+            ("State", wintypes.DWORD),
+            ("Protect", wintypes.DWORD),
+            ("Type", wintypes.DWORD),
+        ]
+
+    virtual_query_ex = ctypes.windll.kernel32.VirtualQueryEx
+    virtual_query_ex.argtypes = [wintypes.HANDLE, ctypes.c_void_p,
+                                 ctypes.POINTER(MEMORY_BASIC_INFORMATION), ctypes.c_size_t]
+    virtual_query_ex.restype = ctypes.c_size_t
+
+    regions = []
+    mbi = MEMORY_BASIC_INFORMATION()
+    address = 0
+
+    while virtual_query_ex(handle, address, ctypes.byref(mbi), ctypes.sizeof(mbi)):
+        base = mbi.BaseAddress or 0
+        size = mbi.RegionSize
+        if size == 0:
+            break
+
+        if mbi.State == MEM_COMMIT and not mbi.Protect & (PAGE_GUARD | PAGE_NOACCESS):
+            protection = _WIN_PROTECTION.get(mbi.Protect & 0xFF, "---")
+            regions.append(MemoryRegion(base, size, protection))
+
+        address = base + size
+
+    return regions
+
+
+def _enumerate_linux(pid: int) -> List[MemoryRegion]:
+    """Legge le mappature da /proc/<pid>/maps"""
+    regions = []
+
+    with open(f"/proc/{pid}/maps", "r") as maps:
+        for line in maps:
+            parts = line.split(None, 5)
+            if len(parts) < 5:
+                continue
+
+            path = parts[5].strip() if len(parts) > 5 else ""
+            if path in _LINUX_SKIP:
+                continue
+
+            start, end = (int(x, 16) for x in parts[0].split("-"))
+            regions.append(MemoryRegion(start, end - start, parts[1][:3], path))
+
+    return regions
+
+
+def _modules_windows(handle) -> List[ModuleInfo]:
+    """Moduli tramite EnumProcessModules (pymem)"""
+    import pymem.process
+
+    modules = [ModuleInfo(module.name, module.lpBaseOfDll, module.SizeOfImage, module.filename)
+               for module in pymem.process.enum_process_module(handle)]
+    return sorted(modules, key=lambda module: module.base)
+
+
+def _modules_linux(regions: List[MemoryRegion]) -> List[ModuleInfo]:
+    """Raggruppa le mappature di /proc/<pid>/maps per file"""
+    modules = []
+    current = None
+
+    for region in regions:
+        if region.path.startswith("/"):
+            if current and current.path == region.path and current.end == region.base:
+                current = current._replace(size=region.end - current.base)
+                continue
+            if current:
+                modules.append(current)
+            current = ModuleInfo(os.path.basename(region.path), region.base, region.size, region.path)
+        elif current and not region.path and current.end == region.base:
+            # .bss: mappatura anonima subito dopo l'immagine
+            modules.append(current._replace(size=region.end - current.base))
+            current = None
+        elif current:
+            modules.append(current)
+            current = None
+
+    if current:
+        modules.append(current)
+    return modules
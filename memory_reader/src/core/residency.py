@@ -0,0 +1,118 @@
+"""
+Residency - Parti delle regioni realmente presenti in memoria
+Le regioni enormi riservate ma mai toccate non hanno pagine fisiche: una
+pagina anonima non presente si legge come zeri. Questo modulo taglia le
+regioni alle sole pagine residenti (/proc/<pid>/pagemap su Linux,
+QueryWorkingSetEx su Windows), così le scansioni non le leggono.
+
+Su Windows il working set non distingue le pagine mai toccate da quelle
+scaricate nel file di paging (entrambe con Valid = 0): saltarle perderebbe
+i valori in memoria paginata, comune nei processi inattivi. Per questo su
+Windows il filtro è disattivato salvo working_set=True (con perdita).
+"""
+
+import sys
+from bisect import bisect_right
+from typing import List, Optional
+
+from core.pagemap import PAGE_SIZE, PM_PRESENT, PM_SWAPPED, pagemap_ranges, zero_pfn
+from core.regions import MemoryRegion
+
+
+# Pagine interrogate per chiamata a QueryWorkingSetEx
+WORKING_SET_BATCH = 64 * 1024
+
+
+def resident_regions(process, regions: List[MemoryRegion],
+                     working_set: bool = False) -> Optional[List[MemoryRegion]]:
+    """
+    Regioni tagliate alle sole pagine residenti
+
+    Se il processo espone resident_regions() (backends.base.ProcessBackend)
+    la risposta arriva dal backend.
+
+    Args:
+        process: Oggetto Pymem (o compatibile)
+        regions: Regioni da filtrare
+        working_set: Su Windows tieni solo le pagine nel working set
+            (QueryWorkingSetEx). Con perdita: salta anche le pagine
+            scaricate nel file di paging, che contengono dati veri
+
+    Returns:
+        Lista ordinata di MemoryRegion (pezzi delle regioni originali) o None
+        se la residenza non è disponibile (tutte le pagine vanno lette)
+    """
+    try:
+        if hasattr(process, "resident_regions"):
+            return process.resident_regions(regions)
+        if sys.platform == "win32" and working_set:
+            return _working_set_windows(process.process_handle, regions)
+    except (OSError, AttributeError):
+        pass
+    return None
+
+
+def resident_linux(pid: int, regions: List[MemoryRegion]) -> List[MemoryRegion]:
+    """
+    Pagine presenti o nello swap secondo /proc/<pid>/pagemap
+
+    Le mappature di file restano intere: una loro pagina non presente ha
+    comunque il contenuto del file, non zeri. Con i PFN visibili, anche le
+    pagine mappate sulla pagina zero del kernel vengono escluse.
+
+    Raises:
+        OSError: Se pagemap non è leggibile
+    """
+    anonymous = sorted(region for region in regions if not region.path.startswith("/"))
+    result = [region for region in regions if region.path.startswith("/")]
+
+    bases = [region.base for region in anonymous]
+    ranges = pagemap_ranges(f"/proc/{pid}/pagemap", anonymous, PM_PRESENT | PM_SWAPPED, zero_pfn())
+    for address, length in ranges:
+        region = anonymous[bisect_right(bases, address) - 1]
+        result.append(region._replace(base=address, size=length))
+    return sorted(result)
+
+
+def _working_set_windows(handle, regions: List[MemoryRegion]) -> List[MemoryRegion]:
+    """Pagine valide nel working set (QueryWorkingSetEx, bit Valid: esclude anche le paginate)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PSAPI_WORKING_SET_EX_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("VirtualAddress", ctypes.c_void_p),
+            ("VirtualAttributes", ctypes.c_size_t),
+        ]
+
+    query = ctypes.windll.psapi.QueryWorkingSetEx
+    result = []
+    for region in sorted(regions):
+        pages = (region.size + PAGE_SIZE - 1) // PAGE_SIZE
+        run_start = None
+        for first in range(0, pages, WORKING_SET_BATCH):
+            count = min(WORKING_SET_BATCH, pages - first)
+            info = (PSAPI_WORKING_SET_EX_INFORMATION * count)()
+            for i in range(count):
+                info[i].VirtualAddress = region.base + (first + i) * PAGE_SIZE
+            if not query(wintypes.HANDLE(handle), info, ctypes.sizeof(info)):
+                raise OSError(f"QueryWorkingSetEx fallita ({ctypes.GetLastError()})")
+
+            for i in range(count):
+                page = first + i
+                if info[i].VirtualAttributes & 1:
+                    if run_start is None:
+                        run_start = page
+                elif run_start is not None:
+                    result.append(_piece(region, run_start, page))
+                    run_start = None
+        if run_start is not None:
+            result.append(_piece(region, run_start, pages))
+    return result
+
+
+def _piece(region: MemoryRegion, first_page: int, end_page: int) -> MemoryRegion:
+    """Parte di una regione tra due indici di pagina"""
+    base = region.base + first_page * PAGE_SIZE
+    end = min(region.base + end_page * PAGE_SIZE, region.end)
+    return region._replace(base=base, size=end - base)
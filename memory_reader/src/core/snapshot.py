@@ -0,0 +1,263 @@
+"""
+Snapshot - Copia su disco delle regioni di memoria
+File unico mappato in memoria (mmap): indice JSON delle regioni seguito dai
+dati grezzi di ogni regione, allineati alla pagina. Processi da molti GB non
+richiedono GB di heap Python: i dati restano nel file e vengono letti a viste.
+L'indice contiene anche la lista dei moduli, così lo snapshot può essere
+analizzato offline (backends.snapshot_backend).
+
+Formato:
+    MAGIC (8 bytes) | lunghezza indice (uint32 LE) | indice JSON | padding | dati
+"""
+
+import bisect
+import json
+import mmap
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+from core.regions import (DEFAULT_CHUNK_SIZE, MemoryRegion, ModuleInfo, enumerate_modules, enumerate_regions,
+                          read_chunk, read_pages, split_regions)
+
+
+SNAPSHOT_MAGIC = b"MRSNAP01"
+PAGE_SIZE = 4096
+
+
+class MemorySnapshot:
+    """
+    Snapshot delle regioni di un processo, mappato in memoria da un file
+    """
+
+    def __init__(self, path: str, writable: bool = False):
+        """
+        Apre uno snapshot esistente
+
+        Args:
+            path: Percorso del file di snapshot
+            writable: Apri in lettura/scrittura (necessario per update)
+
+        Raises:
+            ValueError: Se il file non è uno snapshot valido
+        """
+        self.path = path
+        self.writable = writable
+        self._file = open(path, "r+b" if writable else "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0,
+                               access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+        if self._mmap[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' non è uno snapshot valido")
+
+        index_length = struct.unpack_from("<I", self._mmap, len(SNAPSHOT_MAGIC))[0]
+        index_start = len(SNAPSHOT_MAGIC) + 4
+        self.index = json.loads(self._mmap[index_start:index_start + index_length].decode("utf-8"))
+
+        self.regions: List[MemoryRegion] = []
+        self._offsets: List[int] = []
+        for entry in self.index["regions"]:
+            self.regions.append(MemoryRegion(entry["base"], entry["size"], entry["protection"], entry["path"]))
+            self._offsets.append(entry["offset"])
+        self._bases = [region.base for region in self.regions]
+
+    @classmethod
+    def capture(cls, process, path: str, regions: Optional[List[MemoryRegion]] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE, tracker=None) -> "MemorySnapshot":
+        """
+        Copia le regioni del processo in un nuovo file di snapshot
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            path: Percorso del file da creare (sovrascritto se esiste)
+            regions: Regioni da copiare (default: tutte le regioni scrivibili)
+            chunk_size: Dimensione massima di ogni lettura
+            tracker: SoftDirtyTracker da azzerare prima della copia, per
+                aggiornamenti successivi delle sole pagine modificate
+
+        Returns:
+            MemorySnapshot aperto in scrittura
+        """
+        if regions is None:
+            regions = enumerate_regions(process, writable_only=True)
+
+        try:
+            modules = [list(module) for module in enumerate_modules(process)]
+        except Exception:
+            modules = []
+
+        metadata = {
+            "pid": getattr(process, "process_id", None),
+            "process_name": getattr(process, "process_name", None),
+            "modules": modules,
+        }
+        cls.create(path, regions, metadata)
+        snapshot = cls(path, writable=True)
+        if tracker is not None:
+            tracker.clear()
+        snapshot.update(process, chunk_size)
+        return snapshot
+
+    @classmethod
+    def create(cls, path: str, regions: List[MemoryRegion], metadata: Optional[dict] = None):
+        """
+        Crea un file di snapshot vuoto (dati a zero) con l'indice delle regioni
+
+        Args:
+            path: Percorso del file da creare
+            regions: Regioni da includere
+            metadata: Campi extra da salvare nell'indice
+        """
+        entries = [{"base": r.base, "size": r.size, "protection": r.protection, "path": r.path}
+                   for r in sorted(regions)]
+        index = dict(metadata or {}, regions=entries)
+
+        # L'indice contiene gli offset dei dati, che dipendono dalla lunghezza
+        # dell'indice: si ricalcola finché l'inizio dei dati non è stabile
+        data_start = 0
+        while True:
+            offset = data_start
+            for entry in entries:
+                entry["offset"] = offset
+                offset += _align(entry["size"])
+
+            encoded = json.dumps(index).encode("utf-8")
+            header_length = _align(len(SNAPSHOT_MAGIC) + 4 + len(encoded))
+            if header_length <= data_start:
+                break
+            data_start = header_length
+
+        with open(path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(struct.pack("<I", len(encoded)))
+            f.write(encoded)
+            f.truncate(offset)
+
+    def update(self, process, chunk_size: int = DEFAULT_CHUNK_SIZE, tracker=None) -> int:
+        """
+        Rilegge le regioni dal processo dentro lo snapshot
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            chunk_size: Dimensione massima di ogni lettura
+            tracker: SoftDirtyTracker azzerato alla cattura: si rileggono solo
+                le pagine scritte da allora (None = tutte le regioni)
+
+        Returns:
+            Numero di bytes che non è stato possibile leggere
+        """
+        if tracker is not None:
+            ranges = [MemoryRegion(address, length, "")
+                      for address, length in tracker.collect(self.regions)]
+        else:
+            ranges = self.regions
+
+        failed = 0
+        for address, length in split_regions(ranges, chunk_size):
+            data = read_chunk(process, address, length)
+            if data is not None:
+                self.write(address, data)
+                continue
+            # Pagine illeggibili nel blocco: si aggiornano solo le altre
+            bulk = read_pages(process, address, length)
+            for start, end in bulk.runs():
+                self.write(address + start, bulk.data[start:end])
+            failed += length - bulk.readable_bytes
+        return failed
+
+    def view(self, index: int) -> memoryview:
+        """
+        Vista (senza copia) sui dati della regione
+
+        Args:
+            index: Indice della regione in self.regions
+
+        Returns:
+            memoryview dei dati
+        """
+        offset = self._offsets[index]
+        return memoryview(self._mmap)[offset:offset + self.regions[index].size]
+
+    def find_region(self, address: int) -> Optional[int]:
+        """
+        Indice della regione che contiene l'indirizzo
+
+        Returns:
+            Indice o None se l'indirizzo non è nello snapshot
+        """
+        index = bisect.bisect_right(self._bases, address) - 1
+        if index >= 0 and address < self.regions[index].end:
+            return index
+        return None
+
+    def read(self, address: int, length: int, index: Optional[int] = None) -> Optional[bytes]:
+        """
+        Legge dallo snapshot come se fosse il processo
+
+        Returns:
+            Bytes letti o None se il range non è interamente in una regione
+        """
+        if index is None:
+            index = self.find_region(address)
+        if index is None:
+            return None
+
+        region = self.regions[index]
+        if address + length > region.end:
+            return None
+        start = self._offsets[index] + address - region.base
+        return self._mmap[start:start + length]
+
+    def write(self, address: int, data: bytes, index: Optional[int] = None):
+        """Sovrascrive i dati dello snapshot all'indirizzo indicato"""
+        if index is None:
+            index = self.find_region(address)
+        region = self.regions[index]
+        start = self._offsets[index] + address - region.base
+        self._mmap[start:start + len(data)] = data
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[int, int, int]]:
+        """
+        Divide le regioni in blocchi
+
+        Yields:
+            Tuple (indice regione, indirizzo, lunghezza)
+        """
+        for index, region in enumerate(self.regions):
+            for address, length in split_regions([region], chunk_size):
+                yield index, address, length
+
+    @property
+    def modules(self) -> List[ModuleInfo]:
+        """Moduli caricati al momento della cattura"""
+        return [ModuleInfo(*module) for module in self.index.get("modules", [])]
+
+    @property
+    def total_size(self) -> int:
+        return sum(region.size for region in self.regions)
+
+    def flush(self):
+        """Scrive su disco le modifiche pendenti"""
+        if self.writable:
+            self._mmap.flush()
+
+    def close(self):
+        """Chiude la mappatura e il file"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _align(value: int) -> int:
+    """Arrotonda alla pagina successiva"""
+    return (value + PAGE_SIZE - 1) // PAGE_SIZE * PAGE_SIZE
+
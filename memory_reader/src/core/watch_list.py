@@ -0,0 +1,204 @@
+"""
+Watch List - Monitoraggio continuo di molti valori
+Registra indirizzi tipizzati (anche tramite catene di puntatori), li rilegge
+a frequenza configurabile con poche letture raggruppate (read_many),
+li decodifica con struct.Struct precompilati e notifica i cambiamenti
+"""
+
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.batch_read import read_many
+from core.memory_reader import MemoryReader
+from core.pointer_resolver import PointerChainResolver
+from utils.value_types import VALUE_TYPES
+
+
+# Callback dei cambiamenti: (nome, valore precedente, nuovo valore)
+ChangeCallback = Callable[[str, Any, Any], None]
+
+# Decoder precompilati per i tipi numerici
+_STRUCTS = {name: struct.Struct(value_type.fmt) for name, value_type in VALUE_TYPES.items()}
+_STRUCTS["pointer"] = struct.Struct("<Q")
+
+
+class WatchEntry:
+    """Valore monitorato"""
+
+    def __init__(self, name: str, address: int, value_type: str, offsets: Optional[List[int]],
+                 length: int, callback: Optional[ChangeCallback]):
+        self.name = name
+        self.address = address
+        self.value_type = value_type
+        self.offsets = offsets
+        self.length = length if value_type == "string" else _STRUCTS[value_type].size
+        self.callback = callback
+        self.value = None
+        self.raw: Optional[bytes] = None
+
+    def decode(self, data: Optional[bytes]):
+        """Converte i bytes letti nel valore (None se la lettura è fallita)"""
+        if data is None:
+            return None
+        if self.value_type == "string":
+            return data.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+        return _STRUCTS[self.value_type].unpack(data)[0]
+
+    def changed(self, data: Optional[bytes], value) -> bool:
+        """
+        Il nuovo valore è diverso dall'ultimo letto?
+
+        I numeri si confrontano sui bytes: un float NaN non è uguale a sé
+        stesso e segnalerebbe un cambiamento a ogni lettura.
+        """
+        if self.value_type != "string" and data is not None and self.raw is not None:
+            return data != self.raw
+        return value != self.value
+
+
+class WatchList:
+    """
+    Lista di valori monitorati
+
+    Esempio:
+        watch = WatchList(reader, interval=0.05)
+        watch.add("hp", 0x1A2B3C40, "int")
+        watch.add("pos_x", base + 0x10, "float", offsets=[0x48, 0x90])
+        watch.on_change(lambda name, old, new: print(name, old, "->", new))
+        watch.start()
+    """
+
+    def __init__(self, reader, interval: float = 0.1):
+        """
+        Inizializza la watch list
+
+        Args:
+            reader: MemoryReader (o oggetto Pymem compatibile)
+            interval: Secondi tra due letture in modalità continua (start)
+        """
+        self.process = reader.process if isinstance(reader, MemoryReader) else reader
+        self.interval = interval
+
+        self._entries: Dict[str, WatchEntry] = {}
+        self._resolver = PointerChainResolver(self.process)
+        self._callbacks: List[ChangeCallback] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.poll_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, name: str, address: int, value_type: str = "int", offsets: Optional[List[int]] = None,
+            length: int = 64, callback: Optional[ChangeCallback] = None):
+        """
+        Aggiunge (o sostituisce) un valore da monitorare
+
+        Args:
+            name: Nome del valore
+            address: Indirizzo (o indirizzo base della catena se offsets è indicato)
+            value_type: "int", "long", "float", "double", "string", "pointer", ...
+            offsets: Catena di puntatori da seguire (semantica di read_pointer)
+            length: Bytes letti per le stringhe
+            callback: Chiamata solo per i cambiamenti di questo valore
+
+        Raises:
+            ValueError: Se il tipo non è supportato
+        """
+        if value_type != "string" and value_type not in _STRUCTS:
+            raise ValueError(f"Tipo non supportato: {value_type}")
+
+        with self._lock:
+            self._entries[name] = WatchEntry(name, address, value_type, offsets, length, callback)
+            if offsets is not None:
+                self._resolver.add(name, address, offsets)
+            else:
+                self._resolver.remove(name)
+
+    def remove(self, name: str):
+        """Smette di monitorare un valore"""
+        with self._lock:
+            self._entries.pop(name, None)
+            self._resolver.remove(name)
+
+    def on_change(self, callback: ChangeCallback):
+        """Registra una callback chiamata per ogni valore che cambia"""
+        self._callbacks.append(callback)
+
+    def values(self) -> Dict[str, Any]:
+        """Ultimi valori letti (None = illeggibile)"""
+        with self._lock:
+            return {name: entry.value for name, entry in self._entries.items()}
+
+    def poll(self) -> Dict[str, Any]:
+        """
+        Rilegge tutti i valori una volta e notifica i cambiamenti
+
+        Returns:
+            Dizionario nome -> valore corrente
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._resolver.tick()
+            chains = self._resolver.resolve_all()
+
+            addresses = [chains.get(entry.name) if entry.offsets is not None else entry.address
+                         for entry in entries]
+            readable = [i for i, address in enumerate(addresses) if address is not None]
+            results = read_many(self.process, [(addresses[i], entries[i].length) for i in readable])
+
+            data = [None] * len(entries)
+            for i, result in zip(readable, results):
+                data[i] = result
+
+            changes = []
+            for entry, raw in zip(entries, data):
+                value = entry.decode(raw)
+                if entry.changed(raw, value):
+                    changes.append((entry, entry.value, value))
+                    entry.value = value
+                entry.raw = raw
+            self.poll_count += 1
+
+        for entry, old, new in changes:
+            if entry.callback:
+                entry.callback(entry.name, old, new)
+            for callback in self._callbacks:
+                callback(entry.name, old, new)
+
+        return {entry.name: entry.value for entry in entries}
+
+    def start(self):
+        """Avvia la lettura continua in un thread in background"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="WatchList", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ferma la lettura continua"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _run(self):
+        """Ciclo del thread: poll ogni interval secondi"""
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"❌ Errore durante il monitoraggio: {e}")
+            self._stop.wait(max(0.0, self.interval - (time.perf_counter() - started)))
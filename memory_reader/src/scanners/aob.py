@@ -0,0 +1,161 @@
+"""
+AOB - Motore per pattern di bytes con wildcard
+Compila pattern "AB CD ?? EF" e li cerca ancorandosi al run letterale più lungo
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+
+class CompiledPattern:
+    """
+    Pattern AOB compilato
+
+    La ricerca usa bytes.find (o re su buffer che non hanno .find, come
+    memoryview) sul run di bytes letterali più lungo; la maschera dei
+    wildcard viene verificata solo sulle posizioni candidate.
+    """
+
+    def __init__(self, pattern: str):
+        """
+        Compila il pattern
+
+        Args:
+            pattern: Pattern in formato "AB CD ?? EF" (?? o ? = wildcard)
+
+        Raises:
+            ValueError: Se il pattern è vuoto o contiene bytes non validi
+        """
+        self.pattern = pattern
+        self.length = 0
+        # Run di bytes letterali: (offset nel pattern, bytes)
+        self.runs: List[Tuple[int, bytes]] = []
+
+        current = bytearray()
+        for part in pattern.split():
+            if part in ("??", "?"):
+                if current:
+                    self.runs.append((self.length - len(current), bytes(current)))
+                    current = bytearray()
+            else:
+                if len(part) != 2:
+                    raise ValueError(f"Byte non valido nel pattern: '{part}'")
+                current.append(int(part, 16))
+            self.length += 1
+
+        if current:
+            self.runs.append((self.length - len(current), bytes(current)))
+
+        if self.length == 0:
+            raise ValueError("Pattern vuoto")
+
+        # Ancora = run più lungo, verificato con find; gli altri run sono la maschera
+        if self.runs:
+            anchor_index = max(range(len(self.runs)), key=lambda i: len(self.runs[i][1]))
+            self.anchor_offset, self.anchor = self.runs[anchor_index]
+            self.checks = self.runs[:anchor_index] + self.runs[anchor_index + 1:]
+        else:
+            self.anchor_offset, self.anchor = 0, b""
+            self.checks = []
+
+        self._anchor_re = re.compile(re.escape(self.anchor)) if self.anchor else None
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "CompiledPattern":
+        """
+        Pattern senza wildcard per una sequenza di bytes esatta
+
+        Args:
+            value: Bytes da cercare
+
+        Returns:
+            CompiledPattern equivalente
+        """
+        return cls(" ".join(f"{b:02X}" for b in value))
+
+    def __repr__(self) -> str:
+        return f"CompiledPattern('{self.pattern}')"
+
+    def matches_at(self, data, offset: int) -> bool:
+        """
+        Verifica se il pattern corrisponde a data[offset:]
+
+        Args:
+            data: Buffer (bytes, bytearray, memoryview, mmap)
+            offset: Posizione di inizio
+
+        Returns:
+            True se corrisponde
+        """
+        if offset < 0 or offset + self.length > len(data):
+            return False
+        for run_offset, run in self.runs:
+            start = offset + run_offset
+            if data[start:start + len(run)] != run:
+                return False
+        return True
+
+    def find_all(self, data, limit: Optional[int] = None, start: int = 0) -> Iterator[int]:
+        """
+        Trova tutti i match (anche sovrapposti) nel buffer
+
+        Args:
+            data: Buffer (bytes, bytearray, memoryview, mmap)
+            limit: Considera solo i match che iniziano prima di questo offset
+            start: Considera solo i match che iniziano da questo offset
+
+        Yields:
+            Offset di inizio di ogni match, in ordine crescente
+        """
+        last_start = len(data) - self.length
+        if limit is not None:
+            last_start = min(last_start, limit - 1)
+        if last_start < start:
+            return
+
+        if not self.anchor:
+            # Pattern composto solo da wildcard
+            yield from range(start, last_start + 1)
+            return
+
+        # L'ancora deve stare interamente prima di questo offset
+        end = last_start + self.anchor_offset + len(self.anchor)
+
+        for position in self._iter_anchor(data, start + self.anchor_offset, end):
+            offset = position - self.anchor_offset
+            if all(data[offset + o:offset + o + len(run)] == run for o, run in self.checks):
+                yield offset
+
+    def find_addresses(self, data, base_address: int = 0, limit: Optional[int] = None) -> List[int]:
+        """
+        Tutti i match del buffer come indirizzi (firma dei matcher di ScanExecutor)
+
+        Args:
+            data: Buffer letto dalla memoria
+            base_address: Indirizzo corrispondente a data[0]
+            limit: Considera solo i match che iniziano prima di questo offset
+
+        Returns:
+            Lista di indirizzi in ordine crescente
+        """
+        return [base_address + offset for offset in self.find_all(data, limit)]
+
+    def find(self, data, limit: Optional[int] = None) -> int:
+        """
+        Restituisce l'offset del primo match o -1
+        """
+        return next(self.find_all(data, limit), -1)
+
+    def _iter_anchor(self, data, start: int, end: int) -> Iterator[int]:
+        """Posizioni dell'ancora in data[start:end]"""
+        if hasattr(data, "find"):
+            position = data.find(self.anchor, start, end)
+            while position != -1:
+                yield position
+                position = data.find(self.anchor, position + 1, end)
+        else:
+            # re accetta qualsiasi buffer; search ripetuto per includere i match sovrapposti
+            match = self._anchor_re.search(data, start, end)
+            while match:
+                yield match.start()
+                match = self._anchor_re.search(data, match.start() + 1, end)
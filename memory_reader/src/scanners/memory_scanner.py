@@ -4,22 +4,223 @@ Fornisce funzionalità di scansione e ricerca in memoria
 """
 
 import struct
-from typing import List, Optional
+from itertools import islice
+from typing import Iterator, List, Optional
+
+from core.regions import DEFAULT_CHUNK_SIZE, MemoryRegion, enumerate_regions
+from scanners.aob import CompiledPattern
+from scanners.parallel import ScanExecutor
+from scanners.typed_search import TypedMatcher, np
+from utils.hexdump import HexDumper
 
 
 class MemoryScanner:
     """Scanner per cercare valori specifici in memoria"""
     
-    def __init__(self, process_handler):
+    def __init__(self, process_handler, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 workers: Optional[int] = None, use_processes: bool = False,
+                 skip_paged_out: bool = False):
         """
         Inizializza lo scanner
         
         Args:
-            process_handler: Istanza di ProcessHandler collegata a un processo
+            process_handler: Istanza di ProcessHandler (o oggetto Pymem) collegata a un processo
+            chunk_size: Dimensione massima di ogni lettura durante le scansioni
+            workers: Worker paralleli per le scansioni (None = numero di CPU, 1 = sequenziale)
+            use_processes: Esegui il matching in un pool di processi invece che nei thread
+            skip_paged_out: Su Windows salta le pagine fuori dal working set (con perdita:
+                i valori nelle pagine scaricate su disco non vengono trovati)
         """
         self.process = process_handler
-        self.pm = process_handler.pm
+        self.pm = getattr(process_handler, 'pm', process_handler)
+        self.chunk_size = chunk_size
+        self.executor = ScanExecutor(workers, use_processes, skip_paged_out)
+        
+    def list_regions(self, start_address: int = None, end_address: int = None,
+                     writable_only: bool = False) -> List[MemoryRegion]:
+        """
+        Restituisce le regioni leggibili del processo (opzionalmente in un range)
+        
+        Args:
+            start_address: Indirizzo iniziale (opzionale)
+            end_address: Indirizzo finale (opzionale)
+            writable_only: Solo regioni scrivibili
+            
+        Returns:
+            Lista di MemoryRegion ordinate per indirizzo
+        """
+        return enumerate_regions(self.pm, writable_only=writable_only,
+                                 start_address=start_address, end_address=end_address)
+    
+    def _iter_matches(self, matcher, start_address: int, end_address: int, overlap: int = 0):
+        """
+        Esegue il matcher sulle regioni mappate nel range, tramite l'executor
+        
+        Args:
+            matcher: Funzione (dati, indirizzo, limite) -> lista di indirizzi
+            start_address: Indirizzo iniziale (opzionale)
+            end_address: Indirizzo finale (opzionale)
+            overlap: Bytes extra letti per i match a cavallo tra due blocchi
+            
+        Yields:
+            Lista di indirizzi trovati in ogni blocco, in ordine di indirizzo
+        """
+        regions = self.list_regions(start_address, end_address)
+        total = sum(region.size for region in regions)
+        print(f"📍 {len(regions)} regioni leggibili ({total / (1024 * 1024):.1f} MB)")
+        
+        scanned = 0
+        next_report = 100 * 1024 * 1024
+        for _, size, found in self.executor.imap(self.pm, regions, matcher, self.chunk_size, overlap):
+            yield found
+            
+            scanned += size
+            if scanned >= next_report:
+                print(f"📊 Scansionati {scanned // (1024 * 1024)} MB...")
+                next_report += 100 * 1024 * 1024
+        
+        print(f"📊 {self.executor.stats.summary()}")
+    
+    def _iter_found(self, matcher, overlap: int, start_address: int = None,
+                    end_address: int = None) -> Iterator[int]:
+        """
+        Indirizzi trovati da un matcher, uno alla volta, in ordine di indirizzo
+        
+        Args:
+            matcher: Funzione (dati, indirizzo, limite) -> lista di indirizzi
+            overlap: Bytes extra letti per i match a cavallo tra due blocchi
+            start_address: Indirizzo iniziale (opzionale)
+            end_address: Indirizzo finale (opzionale)
+            
+        Yields:
+            Indirizzi trovati
+        """
+        for found in self._iter_matches(matcher, start_address, end_address, overlap):
+            yield from found
+    
+    def _iter_bytes(self, needle: bytes, start_address: int = None, end_address: int = None) -> Iterator[int]:
+        """
+        Occorrenze di una sequenza di bytes nelle regioni leggibili
+        
+        Args:
+            needle: Bytes da cercare
+            start_address: Indirizzo iniziale (opzionale)
+            end_address: Indirizzo finale (opzionale)
+            
+        Yields:
+            Indirizzi trovati
+        """
+        pattern = CompiledPattern.from_bytes(needle)
+        return self._iter_found(pattern.find_addresses, pattern.length - 1, start_address, end_address)
+    
+    def _search(self, matches: Iterator[int], max_results: int) -> List[int]:
+        """
+        Raccoglie i primi max_results indirizzi di un iter_*; chiudere il
+        generatore ferma la scansione delle regioni rimanenti
+        """
+        try:
+            return list(islice(matches, max_results))
+        finally:
+            matches.close()
+    
+    def iter_integer(self, value: int, start_address: int = None, end_address: int = None) -> Iterator[int]:
+        """
+        Come search_integer, ma restituisce gli indirizzi man mano che le regioni
+        vengono scansionate, senza limite di risultati
+        
+        Yields:
+            Indirizzi dove è stato trovato il valore (int, 4 bytes)
+        """
+        return self._iter_bytes(struct.pack('<i', value), start_address, end_address)
+    
+    def iter_long(self, value: int, start_address: int = None, end_address: int = None) -> Iterator[int]:
+        """
+        Versione generatore di search_long
+        
+        Yields:
+            Indirizzi dove è stato trovato il valore (long, 8 bytes)
+        """
+        return self._iter_bytes(struct.pack('<q', value), start_address, end_address)
+    
+    def iter_float(self, value: float, start_address: int = None, end_address: int = None,
+                   tolerance: float = 0.0001) -> Iterator[int]:
+        """
+        Versione generatore di search_float
+        
+        Yields:
+            Indirizzi dove è stato trovato il valore (float, 4 bytes)
+        """
+        if tolerance and np is not None:
+            return self.iter_typed(value, "float", mode="epsilon", epsilon=tolerance, aligned=False,
+                                   start_address=start_address, end_address=end_address)
+        if tolerance:
+            print("⚠️ NumPy non installato: ricerca esatta senza tolleranza")
+        return self._iter_bytes(struct.pack('<f', value), start_address, end_address)
+    
+    def iter_typed(self, value, value_type: str = "int", value2=None, mode: str = "exact",
+                   epsilon: float = 0.0, aligned: bool = True, start_address: int = None,
+                   end_address: int = None) -> Iterator[int]:
+        """
+        Versione generatore di search_typed
+        
+        Yields:
+            Indirizzi dei valori che soddisfano la condizione
+            
+        Raises:
+            ImportError: Se NumPy non è installato
+            ValueError: Se tipo o modalità non sono validi
+        """
+        matcher = TypedMatcher(value_type, value, value2, mode, epsilon, aligned)
+        return self._iter_found(matcher.find_addresses, matcher.size - 1, start_address, end_address)
+    
+    def iter_string(self, text: str, start_address: int = None, end_address: int = None,
+                    encoding: str = 'utf-8') -> Iterator[int]:
+        """
+        Versione generatore di search_string
+        
+        Yields:
+            Indirizzi dove è stata trovata la stringa
+        """
+        return self._iter_bytes(text.encode(encoding), start_address, end_address)
+    
+    def iter_pattern(self, pattern: str, start_address: int = None, end_address: int = None) -> Iterator[int]:
+        """
+        Tutte le occorrenze di un pattern di bytes (es: "AB CD ?? EF")
+        
+        Yields:
+            Indirizzi dei match
+            
+        Raises:
+            ValueError: Se il pattern non è valido
+        """
+        compiled = CompiledPattern(pattern)
+        return self._iter_found(compiled.find_addresses, compiled.length - 1, start_address, end_address)
+    
+    def iter_value(self, value, value_type: str = "int", **kwargs) -> Iterator[int]:
+        """
+        Versione generatore di search_value
         
+        Args:
+            value: Valore da cercare
+            value_type: Tipo del valore ("int", "long", "float", "string")
+            **kwargs: Parametri aggiuntivi (start_address, end_address)
+            
+        Yields:
+            Indirizzi trovati
+            
+        Raises:
+            ValueError: Se il tipo non è supportato
+        """
+        if value_type == "int":
+            return self.iter_integer(int(value), **kwargs)
+        elif value_type == "long":
+            return self.iter_long(int(value), **kwargs)
+        elif value_type == "float":
+            return self.iter_float(float(value), **kwargs)
+        elif value_type == "string":
+            return self.iter_string(str(value), **kwargs)
+        raise ValueError(f"Tipo non supportato: {value_type}")
+    
     def search_integer(self, value: int, start_address: int = None, end_address: int = None, max_results: int = 100) -> List[int]:
         """
         Cerca un valore intero (4 bytes) in memoria
@@ -36,56 +237,8 @@ class MemoryScanner:
         results = []
         
         try:
-            # Se non specificati, usa range predefinito
-            if start_address is None:
-                start_address = 0x10000
-            if end_address is None:
-                end_address = 0x7FFFFFFF
-            
-            # Converti il valore in bytes (little-endian, 4 bytes)
-            value_bytes = struct.pack('<i', value)
-            
-            # Dimensione del chunk da leggere per volta (1 MB)
-            chunk_size = 1024 * 1024
-            current_address = start_address
-            
             print(f"🔍 Ricerca di {value} in memoria...")
-            print(f"📍 Range: 0x{start_address:X} - 0x{end_address:X}")
-            
-            scanned_mb = 0
-            
-            while current_address < end_address and len(results) < max_results:
-                try:
-                    # Leggi chunk di memoria
-                    data = self.pm.read_bytes(current_address, chunk_size)
-                    
-                    # Cerca il valore nel chunk
-                    offset = 0
-                    while True:
-                        offset = data.find(value_bytes, offset)
-                        if offset == -1:
-                            break
-                        
-                        # Indirizzo trovato
-                        found_address = current_address + offset
-                        results.append(found_address)
-                        
-                        if len(results) >= max_results:
-                            break
-                        
-                        offset += 1
-                    
-                    # Aggiorna progress
-                    scanned_mb += 1
-                    if scanned_mb % 100 == 0:
-                        print(f"📊 Scansionati {scanned_mb} MB... (trovati: {len(results)})")
-                    
-                except:
-                    # Memoria non accessibile, salta al prossimo chunk
-                    pass
-                
-                current_address += chunk_size
-            
+            results = self._search(self.iter_integer(value, start_address, end_address), max_results)
             print(f"✅ Ricerca completata! Trovati {len(results)} risultati")
             
         except Exception as e:
@@ -109,42 +262,8 @@ class MemoryScanner:
         results = []
         
         try:
-            if start_address is None:
-                start_address = 0x10000
-            if end_address is None:
-                end_address = 0x7FFFFFFF
-            
-            # Converti il valore in bytes (little-endian, 8 bytes)
-            value_bytes = struct.pack('<q', value)
-            
-            chunk_size = 1024 * 1024
-            current_address = start_address
-            
             print(f"🔍 Ricerca di {value} (long) in memoria...")
-            
-            while current_address < end_address and len(results) < max_results:
-                try:
-                    data = self.pm.read_bytes(current_address, chunk_size)
-                    
-                    offset = 0
-                    while True:
-                        offset = data.find(value_bytes, offset)
-                        if offset == -1:
-                            break
-                        
-                        found_address = current_address + offset
-                        results.append(found_address)
-                        
-                        if len(results) >= max_results:
-                            break
-                        
-                        offset += 1
-                    
-                except:
-                    pass
-                
-                current_address += chunk_size
-            
+            results = self._search(self.iter_long(value, start_address, end_address), max_results)
             print(f"✅ Trovati {len(results)} risultati")
             
         except Exception as e:
@@ -152,7 +271,8 @@ class MemoryScanner:
         
         return results
     
-    def search_float(self, value: float, start_address: int = None, end_address: int = None, max_results: int = 100) -> List[int]:
+    def search_float(self, value: float, start_address: int = None, end_address: int = None, max_results: int = 100,
+                     tolerance: float = 0.0001) -> List[int]:
         """
         Cerca un valore float (4 bytes) in memoria
         
@@ -161,6 +281,7 @@ class MemoryScanner:
             start_address: Indirizzo iniziale (opzionale)
             end_address: Indirizzo finale (opzionale)
             max_results: Numero massimo di risultati
+            tolerance: Differenza massima accettata (0 = bytes identici)
             
         Returns:
             Lista di indirizzi dove è stato trovato il valore
@@ -168,42 +289,8 @@ class MemoryScanner:
         results = []
         
         try:
-            if start_address is None:
-                start_address = 0x10000
-            if end_address is None:
-                end_address = 0x7FFFFFFF
-            
-            # Converti il valore in bytes (little-endian, 4 bytes float)
-            value_bytes = struct.pack('<f', value)
-            
-            chunk_size = 1024 * 1024
-            current_address = start_address
-            
             print(f"🔍 Ricerca di {value} (float) in memoria...")
-            
-            while current_address < end_address and len(results) < max_results:
-                try:
-                    data = self.pm.read_bytes(current_address, chunk_size)
-                    
-                    offset = 0
-                    while True:
-                        offset = data.find(value_bytes, offset)
-                        if offset == -1:
-                            break
-                        
-                        found_address = current_address + offset
-                        results.append(found_address)
-                        
-                        if len(results) >= max_results:
-                            break
-                        
-                        offset += 1
-                    
-                except:
-                    pass
-                
-                current_address += chunk_size
-            
+            results = self._search(self.iter_float(value, start_address, end_address, tolerance), max_results)
             print(f"✅ Trovati {len(results)} risultati")
             
         except Exception as e:
@@ -211,6 +298,34 @@ class MemoryScanner:
         
         return results
     
+    def search_typed(self, value, value_type: str = "int", value2=None, mode: str = "exact",
+                     epsilon: float = 0.0, aligned: bool = True, start_address: int = None,
+                     end_address: int = None, max_results: int = 100) -> List[int]:
+        """
+        Ricerca vettoriale (NumPy) di un valore tipizzato
+        
+        Args:
+            value: Valore cercato (minimo in modalità "range")
+            value_type: Tipo ("byte", "short", "int", "long", "uint", "float", "double", ...)
+            value2: Massimo in modalità "range"
+            mode: "exact", "range" (value <= x <= value2) o "epsilon" (|x - value| <= epsilon)
+            epsilon: Tolleranza per la modalità "epsilon"
+            aligned: Solo indirizzi allineati alla dimensione del tipo
+            start_address: Indirizzo iniziale (opzionale)
+            end_address: Indirizzo finale (opzionale)
+            max_results: Numero massimo di risultati
+            
+        Returns:
+            Lista di indirizzi trovati
+        """
+        try:
+            matches = self.iter_typed(value, value_type, value2, mode, epsilon, aligned,
+                                      start_address, end_address)
+            return self._search(matches, max_results)
+        except Exception as e:
+            print(f"❌ Errore durante la ricerca: {e}")
+            return []
+    
     def search_string(self, text: str, start_address: int = None, end_address: int = None, max_results: int = 100) -> List[int]:
         """
         Cerca una stringa in memoria
@@ -227,42 +342,8 @@ class MemoryScanner:
         results = []
         
         try:
-            if start_address is None:
-                start_address = 0x10000
-            if end_address is None:
-                end_address = 0x7FFFFFFF
-            
-            # Converti la stringa in bytes (UTF-8)
-            text_bytes = text.encode('utf-8')
-            
-            chunk_size = 1024 * 1024
-            current_address = start_address
-            
             print(f"🔍 Ricerca di '{text}' in memoria...")
-            
-            while current_address < end_address and len(results) < max_results:
-                try:
-                    data = self.pm.read_bytes(current_address, chunk_size)
-                    
-                    offset = 0
-                    while True:
-                        offset = data.find(text_bytes, offset)
-                        if offset == -1:
-                            break
-                        
-                        found_address = current_address + offset
-                        results.append(found_address)
-                        
-                        if len(results) >= max_results:
-                            break
-                        
-                        offset += 1
-                    
-                except:
-                    pass
-                
-                current_address += chunk_size
-            
+            results = self._search(self.iter_string(text, start_address, end_address), max_results)
             print(f"✅ Trovati {len(results)} risultati")
             
         except Exception as e:
@@ -283,50 +364,14 @@ class MemoryScanner:
             Primo indirizzo trovato o None
         """
         try:
-            if start_address is None:
-                start_address = 0x10000
-            if end_address is None:
-                end_address = 0x7FFFFFFF
-            
-            # Converte il pattern in bytes
-            pattern_parts = pattern.split()
-            pattern_bytes = bytearray()
-            mask = bytearray()
-            
-            for part in pattern_parts:
-                if part == "??":
-                    pattern_bytes.append(0)
-                    mask.append(0)
-                else:
-                    pattern_bytes.append(int(part, 16))
-                    mask.append(0xFF)
-            
-            chunk_size = 1024 * 1024
-            current_address = start_address
+            matches = self.iter_pattern(pattern, start_address, end_address)
             
             print(f"🔍 Ricerca pattern: {pattern}")
             
-            while current_address < end_address:
-                try:
-                    data = self.pm.read_bytes(current_address, chunk_size)
-                    
-                    # Cerca il pattern
-                    for i in range(len(data) - len(pattern_bytes) + 1):
-                        match = True
-                        for j in range(len(pattern_bytes)):
-                            if mask[j] != 0 and data[i + j] != pattern_bytes[j]:
-                                match = False
-                                break
-                        
-                        if match:
-                            found_address = current_address + i
-                            print(f"✅ Pattern trovato a: 0x{found_address:X}")
-                            return found_address
-                    
-                except:
-                    pass
-                
-                current_address += chunk_size
+            found = self._search(matches, 1)
+            if found:
+                print(f"✅ Pattern trovato a: 0x{found[0]:X}")
+                return found[0]
             
             print(f"❌ Pattern non trovato")
             return None
@@ -377,35 +422,7 @@ class MemoryScanner:
             output.append(f"\n{'='*60}")
             output.append(f"Hex Dump - Indirizzo: 0x{address:X} - Size: {size} bytes")
             output.append(f"{'='*60}\n")
-            
-            for i in range(0, len(data), 16):
-                # Indirizzo
-                line_addr = address + i
-                hex_part = f"0x{line_addr:08X}  "
-                
-                # Hex bytes
-                hex_bytes = []
-                ascii_part = ""
-                
-                for j in range(16):
-                    if i + j < len(data):
-                        byte = data[i + j]
-                        hex_bytes.append(f"{byte:02X}")
-                        # ASCII (printable chars only)
-                        if 32 <= byte <= 126:
-                            ascii_part += chr(byte)
-                        else:
-                            ascii_part += "."
-                    else:
-                        hex_bytes.append("  ")
-                        ascii_part += " "
-                
-                # Formatta con spazio ogni 8 bytes
-                hex_part += " ".join(hex_bytes[:8]) + "  " + " ".join(hex_bytes[8:])
-                hex_part += f"  |{ascii_part}|"
-                
-                output.append(hex_part)
-            
+            output.append(HexDumper(group=8, bars=True, address_prefix="0x").format(data, address))
             output.append(f"\n{'='*60}\n")
             
             return "\n".join(output)
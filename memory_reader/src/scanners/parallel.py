@@ -0,0 +1,310 @@
+"""
+Parallel - Esecuzione parallela delle scansioni sulle regioni
+Divide la mappa delle regioni in unità di lavoro, le scansiona in parallelo
+e restituisce i risultati in ordine di indirizzo. Se il matcher non trova
+nulla in memoria azzerata, le pagine non residenti non vengono lette e le
+pagine lette tutte a zero non vengono passate al matcher.
+"""
+
+import os
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from core.pagemap import PAGE_SIZE
+from core.regions import DEFAULT_CHUNK_SIZE, MemoryRegion, read_chunk, read_pages, split_regions
+from core.residency import resident_regions
+
+
+# Matcher: funzione (dati, indirizzo, limite) -> risultato dell'unità.
+# In modalità processi deve essere serializzabile (es. metodo di CompiledPattern)
+Matcher = Callable[[bytes, int, int], Any]
+
+# Allineamento dell'inizio dei pezzi non a zero (multiplo di ogni tipo di valore)
+_PIECE_ALIGN = 64
+
+_ZERO_PAGE = bytes(PAGE_SIZE)
+
+
+class ScanStats:
+    """Statistiche dell'ultima scansione di ScanExecutor"""
+
+    def __init__(self):
+        self.total_bytes = 0        # bytes delle regioni richieste
+        self.read_bytes = 0         # bytes letti dal processo
+        self.nonresident_bytes = 0  # saltati: pagine non residenti (non lette)
+        self.zero_bytes = 0         # saltati: pagine lette tutte a zero
+        self.unreadable_bytes = 0   # pagine illeggibili (guard, non mappate, ...)
+        self.last_error: Optional[str] = None  # ultimo errore di lettura
+
+    @property
+    def skipped_bytes(self) -> int:
+        return self.nonresident_bytes + self.zero_bytes
+
+    def summary(self) -> str:
+        """Riepilogo in MB (es. per la stampa a fine scansione)"""
+        mb = 1024 * 1024
+        return (f"Letti {self.read_bytes / mb:.1f} MB su {self.total_bytes / mb:.1f} MB - "
+                f"saltati {self.nonresident_bytes / mb:.1f} MB non residenti, "
+                f"{self.zero_bytes / mb:.1f} MB a zero, {self.unreadable_bytes / mb:.1f} MB illeggibili"
+                + (f" ({self.last_error})" if self.unreadable_bytes and self.last_error else ""))
+
+
+class ScanExecutor:
+    """
+    Esegue un matcher su tutte le regioni con un pool di worker
+
+    In modalità thread (default) ogni worker legge e cerca: la lettura della
+    memoria remota rilascia il GIL, la ricerca no. In modalità processi le
+    letture restano nei thread e la ricerca gira in processi separati, così
+    anche il matching usa più core (al costo di copiare i dati).
+    """
+
+    def __init__(self, workers: Optional[int] = None, use_processes: bool = False,
+                 skip_paged_out: bool = False):
+        """
+        Inizializza l'executor
+
+        Args:
+            workers: Numero di worker (None = numero di CPU, 1 = sequenziale)
+            use_processes: Esegui il matching in un pool di processi
+            skip_paged_out: Su Windows salta anche le pagine fuori dal working set
+                (più veloce, ma i valori nelle pagine scaricate su disco vanno persi)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.skip_paged_out = skip_paged_out
+        self.stats = ScanStats()
+
+    def imap(self, process, regions: List[MemoryRegion], matcher: Matcher,
+             chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = 0,
+             skip_zero: bool = True) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Esegue il matcher su ogni unità di lavoro
+
+        I risultati arrivano in ordine di indirizzo man mano che le unità
+        finiscono; al massimo 2 * workers unità sono in volo, quindi chiudere
+        il generatore presto ferma la scansione senza leggere il resto.
+
+        Con skip_zero il matcher viene prima provato su un buffer a zero: se
+        non trova nulla, le pagine non residenti (core.residency) non vengono
+        lette e le pagine lette tutte a zero non vengono cercate. Le
+        statistiche sono in self.stats.
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            regions: Regioni da scansionare
+            matcher: Funzione (dati, indirizzo, limite) -> risultato
+            chunk_size: Bytes "propri" di ogni unità (il limite passato al matcher)
+            overlap: Bytes extra letti per i match a cavallo tra due unità
+            skip_zero: Salta le pagine a zero o non residenti se il matcher lo consente
+
+        Yields:
+            Tuple (indirizzo, bytes propri dell'unità, risultato); un'unità con
+            pagine a zero produce un risultato per ogni pezzo non a zero
+        """
+        self.stats = stats = ScanStats()
+        stats.total_bytes = sum(region.size for region in regions)
+
+        zero_pad = None
+        if skip_zero and 2 * overlap + _PIECE_ALIGN <= PAGE_SIZE and not _matches_zero(matcher, overlap):
+            zero_pad = overlap
+            resident = resident_regions(process, regions, self.skip_paged_out)
+            if resident is not None:
+                resident = _pad_regions(regions, resident, overlap)
+                stats.nonresident_bytes = stats.total_bytes - sum(region.size for region in resident)
+                regions = resident
+
+        units = split_regions(regions, chunk_size, overlap)
+
+        def collect(address, length, scanned):
+            """Aggiorna le statistiche e restituisce i pezzi con un risultato"""
+            pieces, zero_bytes, unreadable, error = scanned
+            stats.read_bytes += min(length, chunk_size) - unreadable
+            stats.zero_bytes += zero_bytes
+            stats.unreadable_bytes += unreadable
+            if error:
+                stats.last_error = error
+            return pieces
+
+        if self.workers == 1 and not self.use_processes:
+            for address, length in units:
+                scanned = _scan_unit(process, address, length, matcher, chunk_size, None, zero_pad)
+                yield from collect(address, length, scanned)
+            return
+
+        processes = ProcessPoolExecutor(self.workers) if self.use_processes else nullcontext()
+        with ThreadPoolExecutor(self.workers) as threads, processes as pool:
+            pending = deque()
+
+            def submit(unit):
+                address, length = unit
+                future = threads.submit(_scan_unit, process, address, length, matcher, chunk_size,
+                                        pool, zero_pad)
+                pending.append((address, length, future))
+
+            for unit in units:
+                submit(unit)
+                if len(pending) >= self.workers * 2:
+                    break
+
+            try:
+                while pending:
+                    address, length, future = pending.popleft()
+                    scanned = future.result()
+
+                    unit = next(units, None)
+                    if unit is not None:
+                        submit(unit)
+
+                    yield from collect(address, length, scanned)
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    def scan(self, process, regions: List[MemoryRegion], matcher: Matcher,
+             chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = 0) -> List[Any]:
+        """
+        Come imap, ma concatena i risultati (liste) di tutte le unità
+
+        Returns:
+            Lista unica in ordine di indirizzo
+        """
+        results = []
+        for _, _, result in self.imap(process, regions, matcher, chunk_size, overlap):
+            results.extend(result)
+        return results
+
+
+def _scan_unit(process, address: int, length: int, matcher: Matcher, limit: int, pool,
+               zero_pad: Optional[int] = None):
+    """
+    Legge un'unità e ci esegue il matcher (nel pool di processi se presente)
+
+    Se la lettura unica fallisce, l'unità viene riletta con read_pages e il
+    matcher gira solo sulle sequenze di pagine leggibili.
+
+    Args:
+        zero_pad: Overlap del matcher se le pagine a zero vanno saltate (None = no)
+
+    Returns:
+        Tuple (lista di (indirizzo, bytes propri, risultato), bytes propri a zero,
+        bytes propri illeggibili, errore di lettura o None)
+    """
+    owned = min(length, limit)
+    data = read_chunk(process, address, length)
+    if data:
+        runs, unreadable, error = [(0, len(data))], 0, None
+    else:
+        bulk = read_pages(process, address, length)
+        data, runs, error = bulk.data, bulk.runs(), bulk.error
+        unreadable = sum(min(end, owned) - min(start, owned) for start, end in bulk.runs(False))
+
+    pieces = []
+    for run_start, run_end in runs:
+        if run_start >= limit:
+            break  # pagine dell'overlap: appartengono all'unità successiva
+        if zero_pad is None:
+            pieces.append((run_start, run_end, min(run_end, limit) - run_start))
+            continue
+        run = data if (run_start, run_end) == (0, len(data)) else data[run_start:run_end]
+        for start, end, piece_limit in _nonzero_pieces(run, limit - run_start, zero_pad):
+            pieces.append((run_start + start, run_start + end, piece_limit))
+
+    results = []
+    scanned = 0
+    for start, end, piece_limit in pieces:
+        piece = data if (start, end) == (0, len(data)) else data[start:end]
+        if pool is None:
+            result = matcher(piece, address + start, piece_limit)
+        else:
+            result = pool.submit(matcher, piece, address + start, piece_limit).result()
+        results.append((address + start, piece_limit, result))
+        scanned += piece_limit
+    return results, max(owned - unreadable - scanned, 0), unreadable, error
+
+
+def _nonzero_pieces(data, limit: int, overlap: int) -> List[Tuple[int, int, int]]:
+    """
+    Pezzi di un'unità che contengono pagine non a zero
+
+    Ogni pezzo parte fino a `overlap` bytes (allineati) prima della prima pagina
+    non a zero e finisce `overlap` bytes dopo l'ultima, così i match a cavallo
+    con le pagine a zero restano interi; possiede i match che iniziano prima
+    della fine della sua ultima pagina non a zero.
+
+    Returns:
+        Lista di tuple (inizio, fine, limite per il matcher relativo all'inizio)
+    """
+    if not hasattr(data, "startswith"):
+        data = bytes(data)
+
+    pieces = []
+    run_start = None
+    length = len(data)
+    for offset in range(0, length + PAGE_SIZE, PAGE_SIZE):
+        end = min(offset + PAGE_SIZE, length)
+        zero = offset >= length or data.startswith(_ZERO_PAGE[:end - offset], offset)
+        if not zero:
+            if run_start is None:
+                run_start = offset
+            continue
+        if run_start is None:
+            continue
+
+        start = max(0, (run_start - overlap) // _PIECE_ALIGN * _PIECE_ALIGN)
+        owned_end = min(offset, limit)
+        if owned_end > start:
+            pieces.append((start, min(length, offset + overlap), owned_end - start))
+        run_start = None
+    return pieces
+
+
+def _matches_zero(matcher: Matcher, overlap: int) -> bool:
+    """Il matcher trova qualcosa in memoria azzerata? (nel dubbio sì)"""
+    data = bytes(2 * PAGE_SIZE + overlap)
+    try:
+        return _has_results(matcher(data, 0, 2 * PAGE_SIZE))
+    except Exception:
+        return True
+
+
+def _has_results(result) -> bool:
+    """Vero se il risultato di un matcher non è vuoto (lista, array, tuple, dizionario)"""
+    if result is None:
+        return False
+    if isinstance(result, tuple):
+        return any(_has_results(part) for part in result)
+    if isinstance(result, dict):
+        return any(_has_results(part) for part in result.values())
+    return len(result) > 0
+
+
+def _pad_regions(regions: List[MemoryRegion], resident: List[MemoryRegion],
+                 overlap: int) -> List[MemoryRegion]:
+    """
+    Estende i pezzi residenti di `overlap` bytes per lato (dentro la regione
+    originale) e unisce quelli che si toccano: i match a cavallo con le
+    pagine non residenti (lette come zeri) non vanno persi
+    """
+    if not overlap:
+        return resident
+
+    originals = sorted(regions)
+    bases = [region.base for region in originals]
+    pad = (overlap + _PIECE_ALIGN - 1) // _PIECE_ALIGN * _PIECE_ALIGN
+
+    padded = []  # (indice della regione originale, pezzo esteso)
+    for piece in sorted(resident):
+        index = max(bisect_right(bases, piece.base) - 1, 0)
+        original = originals[index]
+        base = max(original.base, piece.base - pad)
+        end = min(original.end, piece.end + overlap)
+        if padded and padded[-1][0] == index and padded[-1][1].end >= base:
+            last = padded[-1][1]
+            padded[-1] = (index, last._replace(size=max(last.end, end) - last.base))
+        else:
+            padded.append((index, piece._replace(base=base, size=end - base)))
+    return [piece for _, piece in padded]
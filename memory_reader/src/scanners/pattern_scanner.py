@@ -3,24 +3,41 @@ Pattern Scanner - Ricerca pattern in memoria
 Trova sequenze di bytes e pattern nella memoria del processo
 """
 
-import pymem
-from typing import List, Optional, Tuple
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import re
 
+from core.module_index import ModuleIndex
+from core.regions import DEFAULT_CHUNK_SIZE, MemoryRegion, ModuleInfo, enumerate_regions
+from scanners.aob import CompiledPattern
+from scanners.parallel import ScanExecutor
+from scanners.signature_cache import SignatureCache
+from scanners.signatures import SignatureSet
+from scanners.typed_search import TypedMatcher
+
 
 class PatternScanner:
     """
     Scanner per trovare pattern di bytes in memoria
     """
     
-    def __init__(self, process: pymem.Pymem):
+    def __init__(self, process, workers: Optional[int] = None, use_processes: bool = False,
+                 signature_cache: Optional[SignatureCache] = None, skip_paged_out: bool = False):
         """
         Inizializza lo scanner
         
         Args:
-            process: Oggetto Pymem connesso a un processo
+            process: Oggetto Pymem (o backend compatibile) connesso a un processo
+            workers: Worker paralleli per le scansioni (None = numero di CPU, 1 = sequenziale)
+            use_processes: Esegui il matching in un pool di processi invece che nei thread
+            signature_cache: Cache degli RVA usata da pattern_scan con module_name (opzionale)
+            skip_paged_out: Su Windows salta le pagine fuori dal working set (con perdita:
+                i valori nelle pagine scaricate su disco non vengono trovati)
         """
         self.process = process
+        self.executor = ScanExecutor(workers, use_processes, skip_paged_out)
+        self.signature_cache = signature_cache
+        self.modules = ModuleIndex(process)
         
     def pattern_scan(self, pattern: str, module_name: Optional[str] = None) -> Optional[int]:
         """
@@ -34,93 +51,203 @@ class PatternScanner:
             Indirizzo del primo match o None
         """
         try:
-            if module_name:
-                module = pymem.process.module_from_name(
-                    self.process.process_handle, 
-                    module_name
-                )
-                return pymem.pattern.pattern_scan_module(
-                    self.process.process_handle,
-                    module,
-                    pattern
-                )
-            else:
-                return pymem.pattern.pattern_scan_all(
-                    self.process.process_handle,
-                    pattern
-                )
+            if self.signature_cache is not None and module_name:
+                return self._cached_pattern_scan(CompiledPattern(pattern), module_name)
+            
+            matches = self.iter_pattern_scan(pattern, module_name)
+            try:
+                return next(matches, None)
+            finally:
+                matches.close()
         except Exception as e:
             print(f"❌ Errore durante il pattern scan: {e}")
             return None
     
-    def scan_for_value(self, value: int, value_type: str = 'int') -> List[int]:
+    def _cached_pattern_scan(self, compiled: CompiledPattern, module_name: str) -> Optional[int]:
+        """
+        pattern_scan passando dalla cache delle firme
+        
+        Un RVA in cache costa una lettura di verifica; la scansione del
+        modulo parte solo se manca o se la verifica fallisce.
+        """
+        module = self._find_module(module_name)
+        if module is None:
+            print(f"❌ Modulo non trovato: {module_name}")
+            return None
+        
+        address = self.signature_cache.lookup(self.process, module, compiled)
+        if address is not None:
+            return address
+        
+        matches = self._iter_found(compiled.find_addresses, compiled.length - 1, module_name)
+        try:
+            address = next(matches, None)
+        finally:
+            matches.close()
+        if address is not None:
+            self.signature_cache.store(self.process, module, compiled, address)
+        return address
+    
+    def iter_pattern_scan(self, pattern: str, module_name: Optional[str] = None) -> Iterator[int]:
         """
-        Cerca un valore specifico in memoria
+        Tutti i match di un pattern, restituiti man mano che le regioni vengono scansionate
         
         Args:
-            value: Valore da cercare
-            value_type: Tipo di dato ('int', 'float', 'long')
+            pattern: Pattern in formato "AB CD ?? EF" (?? = wildcard)
+            module_name: Nome del modulo dove cercare (None = tutte le regioni leggibili)
             
-        Returns:
-            Lista di indirizzi dove è stato trovato il valore
+        Yields:
+            Indirizzi dei match in ordine crescente
+            
+        Raises:
+            ValueError: Se il pattern non è valido
+        """
+        compiled = CompiledPattern(pattern)
+        return self._iter_found(compiled.find_addresses, compiled.length - 1, module_name)
+    
+    def iter_value(self, value, value_type: str = 'int', value2=None, mode: str = 'exact',
+                   epsilon: float = 0.0, aligned: bool = False,
+                   module_name: Optional[str] = None) -> Iterator[int]:
         """
-        addresses = []
+        Versione generatore di scan_for_value, senza limite di risultati
         
+        Yields:
+            Indirizzi dove è stato trovato il valore
+            
+        Raises:
+            ImportError: Se NumPy non è installato
+            ValueError: Se tipo o modalità non sono validi
+        """
+        matcher = TypedMatcher(value_type, value, value2, mode, epsilon, aligned)
+        return self._iter_found(matcher.find_addresses, matcher.size - 1, module_name)
+    
+    def iter_string(self, text: str, encoding: str = 'utf-8',
+                    module_name: Optional[str] = None) -> Iterator[int]:
+        """
+        Versione generatore di scan_string
+        
+        Yields:
+            Indirizzi dove è stata trovata la stringa
+        """
+        compiled = CompiledPattern.from_bytes(text.encode(encoding))
+        return self._iter_found(compiled.find_addresses, compiled.length - 1, module_name)
+    
+    def scan_signatures(self, signatures: Union[SignatureSet, Dict[str, str]],
+                        module_name: Optional[str] = None) -> Dict[str, List[int]]:
+        """
+        Cerca molte firme con un solo passaggio di lettura della memoria
+        
+        Args:
+            signatures: SignatureSet o dizionario nome -> pattern "AB CD ?? EF"
+            module_name: Limita la ricerca a un modulo (None = tutte le regioni leggibili)
+            
+        Returns:
+            Dizionario nome -> lista di indirizzi trovati
+        """
         try:
-            # Converti il valore in bytes secondo il tipo
-            if value_type == 'int':
-                byte_pattern = value.to_bytes(4, byteorder='little', signed=True)
-            elif value_type == 'long':
-                byte_pattern = value.to_bytes(8, byteorder='little', signed=True)
-            elif value_type == 'float':
-                import struct
-                byte_pattern = struct.pack('f', value)
-            else:
-                print(f"❌ Tipo non supportato: {value_type}")
-                return addresses
+            if not isinstance(signatures, SignatureSet):
+                signatures = SignatureSet(signatures)
             
-            # Converti in pattern string
-            pattern = " ".join(f"{b:02X}" for b in byte_pattern)
+            regions = self._scan_regions(module_name)
+            if regions is None:
+                return {}
             
-            # Cerca nella memoria
-            address = self.pattern_scan(pattern)
-            if address:
-                addresses.append(address)
-                
+            return signatures.scan(self.process, regions, executor=self.executor)
         except Exception as e:
-            print(f"❌ Errore durante la ricerca del valore: {e}")
+            print(f"❌ Errore durante la scansione delle firme: {e}")
+            return {}
+    
+    def scan_for_value(self, value, value_type: str = 'int', value2=None, mode: str = 'exact',
+                       epsilon: float = 0.0, aligned: bool = False, module_name: Optional[str] = None,
+                       max_results: int = 1000) -> List[int]:
+        """
+        Cerca un valore tipizzato in memoria (confronto vettoriale NumPy)
+        
+        Args:
+            value: Valore da cercare (minimo in modalità "range")
+            value_type: Tipo di dato ('byte', 'short', 'int', 'long', 'uint', 'float', 'double', ...)
+            value2: Massimo in modalità "range"
+            mode: "exact", "range" o "epsilon"
+            epsilon: Tolleranza per la modalità "epsilon"
+            aligned: Solo indirizzi allineati alla dimensione del tipo
+            module_name: Limita la ricerca a un modulo (None = tutte le regioni leggibili)
+            max_results: Numero massimo di risultati
             
-        return addresses
+        Returns:
+            Lista di indirizzi dove è stato trovato il valore
+        """
+        try:
+            matches = self.iter_value(value, value_type, value2, mode, epsilon, aligned, module_name)
+            return self._take(matches, max_results)
+        except Exception as e:
+            print(f"❌ Errore durante la ricerca del valore: {e}")
+            return []
     
-    def scan_string(self, text: str, encoding: str = 'utf-8') -> List[int]:
+    def scan_string(self, text: str, encoding: str = 'utf-8', module_name: Optional[str] = None,
+                    max_results: int = 1000) -> List[int]:
         """
         Cerca una stringa in memoria
         
         Args:
             text: Testo da cercare
             encoding: Encoding della stringa
+            module_name: Limita la ricerca a un modulo (None = tutte le regioni leggibili)
+            max_results: Numero massimo di risultati
             
         Returns:
             Lista di indirizzi dove è stata trovata la stringa
         """
-        addresses = []
-        
         try:
-            # Converti la stringa in bytes
-            byte_pattern = text.encode(encoding)
-            
-            # Converti in pattern string
-            pattern = " ".join(f"{b:02X}" for b in byte_pattern)
-            
-            # Cerca nella memoria
-            address = self.pattern_scan(pattern)
-            if address:
-                addresses.append(address)
-                
+            return self._take(self.iter_string(text, encoding, module_name), max_results)
         except Exception as e:
             print(f"❌ Errore durante la ricerca della stringa: {e}")
+            return []
+    
+    def _iter_found(self, matcher, overlap: int, module_name: Optional[str] = None) -> Iterator[int]:
+        """
+        Esegue il matcher sulle regioni da scansionare e restituisce gli indirizzi uno alla volta
+        
+        Args:
+            matcher: Funzione (dati, indirizzo, limite) -> lista di indirizzi
+            overlap: Bytes extra letti per i match a cavallo tra due blocchi
+            module_name: Limita la ricerca a un modulo (None = tutte le regioni leggibili)
             
-        return addresses
+        Yields:
+            Indirizzi trovati in ordine crescente (nessuno se il modulo non esiste)
+        """
+        regions = self._scan_regions(module_name)
+        if regions is None:
+            return
+        
+        for _, _, found in self.executor.imap(self.process, regions, matcher, DEFAULT_CHUNK_SIZE, overlap):
+            yield from found
+    
+    @staticmethod
+    def _take(matches: Iterator[int], max_results: int) -> List[int]:
+        """Primi max_results indirizzi di un generatore, poi lo chiude (ferma la scansione)"""
+        try:
+            return list(islice(matches, max_results))
+        finally:
+            matches.close()
+    
+    def _scan_regions(self, module_name: Optional[str] = None) -> Optional[List[MemoryRegion]]:
+        """
+        Regioni leggibili da scansionare: tutto il processo o solo il range di un modulo
+        
+        Returns:
+            Lista di regioni o None se il modulo non esiste
+        """
+        if not module_name:
+            return enumerate_regions(self.process)
+        
+        module = self.get_module_info(module_name)
+        if not module:
+            return None
+        return enumerate_regions(
+            self.process,
+            start_address=module['base_address'],
+            end_address=module['base_address'] + module['size']
+        )
     
     def get_module_info(self, module_name: str) -> Optional[dict]:
         """
@@ -133,21 +260,25 @@ class PatternScanner:
             Dizionario con informazioni sul modulo
         """
         try:
-            module = pymem.process.module_from_name(
-                self.process.process_handle,
-                module_name
-            )
+            module = self._find_module(module_name)
+            if module:
+                return {
+                    'name': module.name,
+                    'base_address': module.base,
+                    'size': module.size,
+                    'path': module.path
+                }
             
-            return {
-                'name': module.name,
-                'base_address': module.lpBaseOfDll,
-                'size': module.SizeOfImage,
-                'entry_point': module.EntryPoint
-            }
+            print(f"❌ Modulo non trovato: {module_name}")
+            return None
         except Exception as e:
             print(f"❌ Errore nel recupero info modulo: {e}")
             return None
     
+    def _find_module(self, module_name: str) -> Optional[ModuleInfo]:
+        """Modulo caricato con questo nome (confronto senza maiuscole)"""
+        return self.modules.get(module_name)
+    
     def list_modules(self) -> List[dict]:
         """
         Lista tutti i moduli caricati dal processo
@@ -158,15 +289,12 @@ class PatternScanner:
         modules = []
         
         try:
-            module_list = list(pymem.process.enum_process_module(
-                self.process.process_handle
-            ))
-            
-            for module in module_list:
+            self.modules.refresh_if_changed()
+            for module in self.modules:
                 modules.append({
                     'name': module.name,
-                    'base_address': module.lpBaseOfDll,
-                    'size': module.SizeOfImage
+                    'base_address': module.base,
+                    'size': module.size
                 })
                 
         except Exception as e:
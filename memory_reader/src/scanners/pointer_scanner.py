@@ -0,0 +1,504 @@
+"""
+Pointer Scanner - Ricerca di catene di puntatori stabili verso un indirizzo
+Costruisce in un solo passaggio parallelo la mappa inversa dei puntatori
+(valore -> posizioni) in array NumPy ordinati, poi risale a ritroso dal
+target livello per livello (BFS) con ricerca binaria, tenendo solo le catene
+che partono dall'immagine statica di un modulo.
+
+Mappa e catene si salvano in file compatti (array uint64 allineati alla
+pagina, caricati con mmap) per rivalidarle dopo un riavvio del processo.
+
+Formato dei file:
+    MAGIC (8 bytes) | lunghezza header (uint32 LE) | header JSON | padding | array
+"""
+
+import json
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: richiesto solo da PointerMap e PointerScanner
+    np = None
+
+from core.batch_read import read_values
+from core.memory_reader import MemoryReader
+from core.regions import (DEFAULT_CHUNK_SIZE, MemoryRegion, ModuleInfo, enumerate_modules,
+                          enumerate_regions, find_module)
+from core.snapshot import PAGE_SIZE
+from scanners.parallel import ScanExecutor
+from utils.value_types import get_value_type
+
+
+# Dimensione di un puntatore (processi a 64 bit, come read_pointer)
+POINTER_SIZE = 8
+
+POINTER_MAP_MAGIC = b"MRPMAP01"
+POINTER_CHAINS_MAGIC = b"MRPCHN01"
+
+
+class PointerChain(NamedTuple):
+    """
+    Catena di puntatori con radice statica: modulo+offset seguito dagli offsets
+
+    Gli offsets seguono la semantica di MemoryReader.read_pointer: a ogni
+    livello si legge il puntatore e si somma l'offset.
+    """
+
+    module: str
+    module_offset: int
+    offsets: Tuple[int, ...]
+
+    def __str__(self) -> str:
+        chain = f'"{self.module}"+0x{self.module_offset:X}'
+        return chain + "".join(f" -> 0x{offset:X}" for offset in self.offsets)
+
+
+class PointerMap:
+    """
+    Mappa inversa dei puntatori del processo
+
+    values[i] è un puntatore valido (punta dentro una regione leggibile)
+    memorizzato all'indirizzo locations[i]; gli array sono ordinati per valore.
+    """
+
+    def __init__(self, locations: "np.ndarray", values: "np.ndarray",
+                 modules: Optional[List[ModuleInfo]] = None):
+        """
+        Args:
+            locations: Indirizzi dei puntatori (uint64, ordinati per valore)
+            values: Valori dei puntatori (uint64, ordinati)
+            modules: Moduli caricati quando la mappa è stata costruita
+        """
+        self.locations = locations
+        self.values = values
+        self.modules = modules or []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def build(cls, process, regions: Optional[List[MemoryRegion]] = None,
+              executor: Optional[ScanExecutor] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> "PointerMap":
+        """
+        Legge tutte le regioni e raccoglie i valori allineati che sono puntatori validi
+        (insieme alla lista dei moduli caricati)
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            regions: Regioni da leggere (default: tutte le regioni leggibili)
+            executor: ScanExecutor da usare (default: uno nuovo con un worker per CPU)
+            chunk_size: Dimensione massima di ogni lettura
+
+        Returns:
+            PointerMap
+
+        Raises:
+            ImportError: Se NumPy non è installato
+        """
+        if np is None:
+            raise ImportError("PointerMap richiede NumPy: pip install numpy")
+        if regions is None:
+            regions = enumerate_regions(process)
+        executor = executor or ScanExecutor()
+        modules = enumerate_modules(process)
+
+        matcher = _PointerMatcher(regions)
+        chunk_size = max(POINTER_SIZE, chunk_size // POINTER_SIZE * POINTER_SIZE)
+
+        locations, values = [], []
+        for _, _, (found_locations, found_values) in executor.imap(process, regions, matcher, chunk_size):
+            if len(found_values):
+                locations.append(found_locations)
+                values.append(found_values)
+
+        if not values:
+            return cls(np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.uint64), modules)
+
+        locations = np.concatenate(locations)
+        values = np.concatenate(values)
+        order = np.argsort(values, kind="stable")
+        return cls(locations[order], values[order], modules)
+
+    def save(self, path: str, metadata: Optional[dict] = None):
+        """
+        Salva la mappa su file (array uint64 caricabili con mmap)
+
+        Args:
+            path: Percorso del file (sovrascritto se esiste)
+            metadata: Campi extra da salvare nell'header
+        """
+        header = dict(metadata or {}, modules=[list(module) for module in self.modules])
+        _save_arrays(path, POINTER_MAP_MAGIC, header, {"locations": self.locations, "values": self.values})
+
+    @classmethod
+    def load(cls, path: str) -> "PointerMap":
+        """
+        Carica una mappa salvata con save (gli array restano mappati sul file)
+
+        Raises:
+            ImportError: Se NumPy non è installato
+            ValueError: Se il file non è una mappa di puntatori valida
+        """
+        if np is None:
+            raise ImportError("PointerMap richiede NumPy: pip install numpy")
+        header, arrays = _load_arrays(path, POINTER_MAP_MAGIC)
+        modules = [ModuleInfo(*module) for module in header["modules"]]
+        return cls(arrays["locations"], arrays["values"], modules)
+
+    def lookup(self, targets: "np.ndarray", max_offset: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Tutti i puntatori con valore in [target - max_offset, target] per ogni target
+
+        Args:
+            targets: Indirizzi cercati (uint64)
+            max_offset: Offset massimo tra il valore del puntatore e il target
+
+        Returns:
+            Tuple (indice del target, posizione del puntatore, offset) per ogni coppia
+        """
+        targets = np.asarray(targets, dtype=np.uint64)
+        low = np.where(targets > max_offset, targets - np.uint64(max_offset), np.uint64(0))
+        first = np.searchsorted(self.values, low, side="left")
+        last = np.searchsorted(self.values, targets, side="right")
+
+        counts = last - first
+        total = int(counts.sum())
+        target_index = np.repeat(np.arange(len(targets)), counts)
+        starts = np.repeat(first - (np.cumsum(counts) - counts), counts)
+        index = starts + np.arange(total)
+
+        offsets = targets[target_index] - self.values[index]
+        return target_index, self.locations[index], offsets.astype(np.int64)
+
+
+class PointerScanner:
+    """
+    Scanner di catene di puntatori
+
+    Esempio:
+        scanner = PointerScanner(process)
+        chains = scanner.scan(0x1F2A3B40, max_depth=5, max_offset=0x800)
+        for chain in chains[:10]:
+            print(chain, hex(scanner.resolve(chain)))
+    """
+
+    def __init__(self, process, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Inizializza lo scanner
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            workers: Worker paralleli per la costruzione della mappa (None = numero di CPU)
+            chunk_size: Dimensione massima di ogni lettura
+
+        Raises:
+            ImportError: Se NumPy non è installato
+        """
+        if np is None:
+            raise ImportError("PointerScanner richiede NumPy: pip install numpy")
+
+        self.process = process
+        self.chunk_size = chunk_size
+        self.executor = ScanExecutor(workers)
+        self.pointer_map: Optional[PointerMap] = None
+        self.modules: List[ModuleInfo] = []
+
+    def build_map(self, regions: Optional[List[MemoryRegion]] = None) -> PointerMap:
+        """
+        Costruisce (o ricostruisce) la mappa dei puntatori e la lista dei moduli
+
+        Args:
+            regions: Regioni da leggere (default: tutte le regioni leggibili)
+
+        Returns:
+            PointerMap costruita
+        """
+        self.pointer_map = PointerMap.build(self.process, regions, self.executor, self.chunk_size)
+        self.modules = self.pointer_map.modules
+        return self.pointer_map
+
+    def save_map(self, path: str):
+        """Salva la mappa corrente (vedi PointerMap.save)"""
+        if self.pointer_map is None:
+            raise ValueError("Nessuna mappa da salvare: chiama build_map()")
+        self.pointer_map.save(path, {"pid": getattr(self.process, "process_id", None)})
+
+    def load_map(self, path: str) -> PointerMap:
+        """
+        Usa una mappa salvata invece di rileggere il processo
+
+        Le catene trovate hanno radice nei moduli salvati con la mappa.
+        """
+        self.pointer_map = PointerMap.load(path)
+        self.modules = self.pointer_map.modules
+        return self.pointer_map
+
+    def scan(self, target: int, max_depth: int = 5, max_offset: int = 0x1000,
+             max_results: int = 10000) -> List[PointerChain]:
+        """
+        Cerca le catene statiche che portano al target
+
+        Args:
+            target: Indirizzo da raggiungere
+            max_depth: Numero massimo di puntatori nella catena
+            max_offset: Offset massimo a ogni livello
+            max_results: Numero massimo di catene
+
+        Returns:
+            Lista di PointerChain, dalle più corte
+        """
+        chains = []
+        for chain in self.iter_chains(target, max_depth, max_offset):
+            chains.append(chain)
+            if len(chains) >= max_results:
+                break
+        return chains
+
+    def iter_chains(self, target: int, max_depth: int = 5, max_offset: int = 0x1000) -> Iterator[PointerChain]:
+        """
+        Versione generatore di scan (costruisce la mappa se manca)
+
+        Yields:
+            PointerChain in ordine di lunghezza
+        """
+        if self.pointer_map is None:
+            self.build_map()
+
+        module_bases = np.array([module.base for module in self.modules], dtype=np.uint64)
+        module_ends = np.array([module.end for module in self.modules], dtype=np.uint64)
+
+        # links[d]: (posizioni ordinate, indirizzi raggiunti, offsets) al livello d
+        links = []
+        frontier = np.array([target], dtype=np.uint64)
+        visited = frontier
+
+        for depth in range(max_depth):
+            target_index, locations, offsets = self.pointer_map.lookup(frontier, max_offset)
+            if len(locations) == 0:
+                break
+
+            order = np.argsort(locations)
+            locations = locations[order]
+            links.append((locations, frontier[target_index][order], offsets[order]))
+
+            unique = locations[np.concatenate(([True], locations[1:] != locations[:-1]))]
+            if len(self.modules):
+                index = np.searchsorted(module_bases, unique, side="right") - 1
+                static = (index >= 0) & (unique < module_ends[np.maximum(index, 0)])
+            else:
+                static = np.zeros(len(unique), dtype=bool)
+
+            # Le radici statiche chiudono le catene, il resto diventa il nuovo livello
+            for root in unique[static].tolist():
+                module = find_module(self.modules, root)
+                for chain_offsets in self._walk(links, depth, root):
+                    yield PointerChain(module.name, root - module.base, chain_offsets)
+
+            frontier = np.setdiff1d(unique[~static], visited, assume_unique=True)
+            visited = np.union1d(visited, frontier)
+            if len(frontier) == 0:
+                break
+
+    def resolve(self, chain: PointerChain) -> Optional[int]:
+        """
+        Segue la catena con MemoryReader.read_pointer
+
+        Returns:
+            Indirizzo finale o None se il modulo non è caricato o la lettura fallisce
+        """
+        if not self.modules:
+            self.modules = enumerate_modules(self.process)
+
+        for module in self.modules:
+            if module.name == chain.module:
+                base = module.base + chain.module_offset
+                return MemoryReader(self.process).read_pointer(base, list(chain.offsets))
+        return None
+
+    def validate(self, chains: List[PointerChain], target: Optional[int] = None,
+                 value=None, value_type: str = "int") -> List[PointerChain]:
+        """
+        Rivaluta molte catene nel processo corrente (es. dopo un riavvio)
+
+        Ogni livello viene risolto per tutte le catene insieme, con letture
+        raggruppate; la semantica è quella di MemoryReader.read_pointer
+        (un puntatore nullo interrompe la catena).
+
+        Args:
+            chains: Catene da verificare
+            target: Tieni solo le catene che arrivano a questo indirizzo
+            value: Tieni solo le catene il cui indirizzo finale contiene questo valore
+            value_type: Tipo di value ("int", "float", "long", ...)
+
+        Returns:
+            Catene ancora valide, nello stesso ordine
+        """
+        if not chains:
+            return []
+
+        modules = {module.name: module for module in enumerate_modules(self.process)}
+        depth = max(len(chain.offsets) for chain in chains)
+
+        addresses = np.zeros(len(chains), dtype=np.uint64)
+        alive = np.zeros(len(chains), dtype=bool)
+        lengths = np.zeros(len(chains), dtype=np.int64)
+        offsets = np.zeros((len(chains), depth), dtype=np.uint64)
+        for i, chain in enumerate(chains):
+            module = modules.get(chain.module)
+            if module is not None:
+                addresses[i] = module.base + chain.module_offset
+                alive[i] = True
+            lengths[i] = len(chain.offsets)
+            offsets[i, :len(chain.offsets)] = chain.offsets
+
+        for level in range(depth):
+            active = np.flatnonzero(alive & (lengths > level))
+            pointers, valid = read_values(self.process, addresses[active], "<u8", self.chunk_size)
+            alive[active] = valid & (pointers != 0)
+            addresses[active] = pointers + offsets[active, level]
+
+        if target is not None:
+            alive &= addresses == np.uint64(target)
+        if value is not None:
+            vtype = get_value_type(value_type)
+            active = np.flatnonzero(alive)
+            current, valid = read_values(self.process, addresses[active], vtype.dtype, self.chunk_size)
+            if vtype.is_float:
+                valid &= np.isclose(current, value)
+            else:
+                valid &= current == np.array(value, dtype=current.dtype)
+            alive[active] = valid
+
+        return [chain for chain, ok in zip(chains, alive.tolist()) if ok]
+
+    def _walk(self, links, depth: int, location: int) -> Iterator[Tuple[int, ...]]:
+        """Offsets di tutte le catene che partono da location al livello depth"""
+        locations, reached, offsets = links[depth]
+        first = int(np.searchsorted(locations, np.uint64(location), side="left"))
+        last = int(np.searchsorted(locations, np.uint64(location), side="right"))
+
+        for next_address, offset in zip(reached[first:last].tolist(), offsets[first:last].tolist()):
+            if depth == 0:
+                yield (offset,)
+            else:
+                for rest in self._walk(links, depth - 1, next_address):
+                    yield (offset,) + rest
+
+
+def save_chains(path: str, chains: List[PointerChain], metadata: Optional[dict] = None):
+    """
+    Salva le catene su file (array uint64 caricabili con mmap)
+
+    Args:
+        path: Percorso del file (sovrascritto se esiste)
+        chains: Catene da salvare
+        metadata: Campi extra da salvare nell'header (es. target e valore atteso)
+    """
+    names = sorted({chain.module for chain in chains})
+    module_index = {name: i for i, name in enumerate(names)}
+    depth = max((len(chain.offsets) for chain in chains), default=0)
+
+    offsets = np.zeros((len(chains), depth), dtype=np.uint64)
+    for i, chain in enumerate(chains):
+        offsets[i, :len(chain.offsets)] = chain.offsets
+
+    arrays = {
+        "module": np.array([module_index[chain.module] for chain in chains], dtype=np.uint64),
+        "module_offset": np.array([chain.module_offset for chain in chains], dtype=np.uint64),
+        "length": np.array([len(chain.offsets) for chain in chains], dtype=np.uint64),
+        "offsets": offsets.ravel(),
+    }
+    header = dict(metadata or {}, modules=names, depth=depth)
+    _save_arrays(path, POINTER_CHAINS_MAGIC, header, arrays)
+
+
+def load_chains(path: str) -> Tuple[List[PointerChain], dict]:
+    """
+    Carica le catene salvate con save_chains
+
+    Returns:
+        Tuple (catene, header con i metadati salvati)
+
+    Raises:
+        ImportError: Se NumPy non è installato
+        ValueError: Se il file non contiene catene valide
+    """
+    if np is None:
+        raise ImportError("load_chains richiede NumPy: pip install numpy")
+    header, arrays = _load_arrays(path, POINTER_CHAINS_MAGIC)
+
+    names = header["modules"]
+    offsets = arrays["offsets"].reshape(-1, header["depth"]) if header["depth"] else None
+    chains = []
+    for i, (module, module_offset, length) in enumerate(zip(arrays["module"].tolist(),
+                                                            arrays["module_offset"].tolist(),
+                                                            arrays["length"].tolist())):
+        chain_offsets = tuple(offsets[i, :length].tolist()) if length else ()
+        chains.append(PointerChain(names[module], module_offset, chain_offsets))
+    return chains, header
+
+
+def _save_arrays(path: str, magic: bytes, header: dict, arrays: Dict[str, "np.ndarray"]):
+    """Scrive header JSON e array uint64, ognuno allineato alla pagina"""
+    offset = 0
+    layout = {}
+    for name, array in arrays.items():
+        layout[name] = [offset, len(array)]
+        offset += _align(len(array) * 8)
+
+    encoded = json.dumps(dict(header, arrays=layout)).encode("utf-8")
+    data_start = _align(len(magic) + 4 + len(encoded))
+
+    with open(path, "wb") as f:
+        f.write(magic)
+        f.write(struct.pack("<I", len(encoded)))
+        f.write(encoded)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name][0])
+            f.write(np.ascontiguousarray(array, dtype="<u8").tobytes())
+        f.truncate(data_start + offset)
+
+
+def _load_arrays(path: str, magic: bytes) -> Tuple[dict, Dict[str, "np.ndarray"]]:
+    """Legge l'header e mappa gli array con np.memmap (sola lettura)"""
+    with open(path, "rb") as f:
+        if f.read(len(magic)) != magic:
+            raise ValueError(f"'{path}' non è un file valido ({magic.decode()})")
+        header_length = struct.unpack("<I", f.read(4))[0]
+        header = json.loads(f.read(header_length).decode("utf-8"))
+
+    data_start = _align(len(magic) + 4 + header_length)
+    arrays = {}
+    for name, (offset, count) in header["arrays"].items():
+        if count == 0:
+            arrays[name] = np.empty(0, dtype=np.uint64)
+        else:
+            arrays[name] = np.memmap(path, dtype="<u8", mode="r", offset=data_start + offset, shape=(count,))
+    return header, arrays
+
+
+def _align(value: int) -> int:
+    """Arrotonda alla pagina successiva"""
+    return (value + PAGE_SIZE - 1) // PAGE_SIZE * PAGE_SIZE
+
+
+class _PointerMatcher:
+    """Matcher per ScanExecutor: valori allineati che puntano dentro una regione"""
+
+    def __init__(self, regions: List[MemoryRegion]):
+        regions = sorted(regions)
+        self.starts = np.array([region.base for region in regions], dtype=np.uint64)
+        self.ends = np.array([region.end for region in regions], dtype=np.uint64)
+
+    def __call__(self, data, address: int, limit: int):
+        count = min(len(data), limit) // POINTER_SIZE
+        values = np.frombuffer(data, dtype="<u8", count=count)
+
+        index = np.searchsorted(self.starts, values, side="right") - 1
+        valid = (index >= 0) & (values < self.ends[np.maximum(index, 0)])
+
+        hits = np.flatnonzero(valid)
+        locations = hits.astype(np.uint64) * np.uint64(POINTER_SIZE) + np.uint64(address)
+        return locations, values[hits]
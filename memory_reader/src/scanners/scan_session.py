@@ -0,0 +1,219 @@
+"""
+Scan Session - Scansione iniziale e scansioni successive di affinamento
+Mantiene i candidati in array NumPy compatti (uint64 per gli indirizzi)
+e rilegge solo i candidati sopravvissuti a ogni passaggio
+"""
+
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: richiesto solo da ScanSession
+    np = None
+
+from core.batch_read import read_values
+from core.regions import DEFAULT_CHUNK_SIZE, enumerate_regions
+from scanners.parallel import ScanExecutor
+from scanners.typed_search import TypedMatcher
+from utils.value_types import ValueType, get_value_type
+
+
+# Modalità delle scansioni successive
+SCAN_MODES = (
+    "equal", "not_equal", "changed", "unchanged",
+    "increased", "decreased", "increased_by", "decreased_by", "between",
+)
+
+
+class ScanSession:
+    """
+    Sessione di scansione stile "first scan / next scan"
+
+    Esempio:
+        session = ScanSession(process, "int")
+        session.first_scan(100)
+        # ... il valore nel processo cambia ...
+        session.next_scan("decreased")
+        session.next_scan("equal", 95)
+    """
+
+    def __init__(self, process, value_type: str = "int", aligned: bool = True,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: Optional[int] = None):
+        """
+        Inizializza la sessione
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            value_type: Tipo del valore ("int", "long", "float", "double", ...)
+            aligned: Considera solo indirizzi allineati alla dimensione del tipo
+            chunk_size: Dimensione massima di ogni lettura
+            workers: Worker paralleli per la scansione iniziale (None = numero di CPU)
+
+        Raises:
+            ImportError: Se NumPy non è installato
+            ValueError: Se il tipo non è supportato
+        """
+        if np is None:
+            raise ImportError("ScanSession richiede NumPy: pip install numpy")
+
+        self.process = process
+        self.value_type = get_value_type(value_type)
+        self.dtype = np.dtype(self.value_type.dtype)
+        self.aligned = aligned
+        self.chunk_size = chunk_size
+        self.executor = ScanExecutor(workers)
+
+        self.addresses = np.empty(0, dtype=np.uint64)
+        self.values = np.empty(0, dtype=self.dtype)
+        self.scan_count = 0
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def first_scan(self, value, value2=None, tolerance: Optional[float] = None) -> int:
+        """
+        Scansione iniziale: cerca il valore in tutte le regioni scrivibili
+
+        Args:
+            value: Valore da cercare (minimo se value2 è indicato)
+            value2: Massimo: cerca i valori nell'intervallo [value, value2]
+            tolerance: Accetta i valori con |x - value| <= tolerance (utile per i float)
+
+        Returns:
+            Numero di candidati trovati
+        """
+        if value2 is not None:
+            matcher = TypedMatcher(self.value_type.name, value, value2, "range", aligned=self.aligned)
+        elif tolerance is not None:
+            matcher = TypedMatcher(self.value_type.name, value, mode="epsilon",
+                                   epsilon=tolerance, aligned=self.aligned)
+        else:
+            matcher = TypedMatcher(self.value_type.name, value, aligned=self.aligned)
+        regions = enumerate_regions(self.process, writable_only=True)
+
+        chunks = []
+        for _, _, found in self.executor.imap(self.process, regions, matcher.find_array,
+                                              self.chunk_size, matcher.size - 1):
+            if len(found):
+                chunks.append(found)
+
+        self.addresses = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.uint64)
+        if matcher.mode == "exact":
+            self.values = np.full(len(self.addresses), value, dtype=self.dtype)
+        else:
+            self.refresh()
+        self.scan_count = 1
+        return len(self.addresses)
+
+    def next_scan(self, mode: str, value=None, value2=None) -> int:
+        """
+        Scansione di affinamento: rilegge i candidati e tiene quelli che soddisfano la condizione
+
+        Args:
+            mode: Una di SCAN_MODES
+            value: Valore per equal/not_equal/increased_by/decreased_by, minimo per between
+            value2: Massimo per between
+
+        Returns:
+            Numero di candidati rimasti
+
+        Raises:
+            ValueError: Se la modalità non è valida o manca un valore
+        """
+        check_scan_mode(mode, value, value2)
+
+        current, valid = self._read_values(self.addresses)
+        keep = valid & compare_values(mode, current, self.values, self.value_type, value, value2)
+
+        self.addresses = self.addresses[keep]
+        self.values = current[keep]
+        self.scan_count += 1
+        return len(self.addresses)
+
+    def refresh(self):
+        """Rilegge i valori correnti dei candidati senza filtrarli"""
+        current, valid = self._read_values(self.addresses)
+        self.addresses = self.addresses[valid]
+        self.values = current[valid]
+
+    def results(self, limit: int = 100) -> List[Tuple[int, object]]:
+        """
+        Restituisce i primi candidati con l'ultimo valore letto
+
+        Args:
+            limit: Numero massimo di risultati
+
+        Returns:
+            Lista di tuple (indirizzo, valore)
+        """
+        return list(zip(self.addresses[:limit].tolist(), self.values[:limit].tolist()))
+
+    def reset(self):
+        """Svuota la sessione"""
+        self.addresses = np.empty(0, dtype=np.uint64)
+        self.values = np.empty(0, dtype=self.dtype)
+        self.scan_count = 0
+
+    def _read_values(self, addresses):
+        """
+        Legge i valori correnti, raggruppando i candidati vicini in poche letture
+
+        Returns:
+            Tuple (valori, maschera dei candidati letti con successo)
+        """
+        return read_values(self.process, addresses, self.dtype, self.chunk_size)
+
+
+def check_scan_mode(mode: str, value=None, value2=None):
+    """
+    Verifica che la modalità esista e che abbia i valori richiesti
+
+    Raises:
+        ValueError: Se la modalità non è valida o manca un valore
+    """
+    if mode not in SCAN_MODES:
+        raise ValueError(f"Modalità non valida: {mode}")
+    if mode in ("equal", "not_equal", "increased_by", "decreased_by", "between") and value is None:
+        raise ValueError(f"La modalità '{mode}' richiede un valore")
+    if mode == "between" and value2 is None:
+        raise ValueError("La modalità 'between' richiede value e value2")
+
+
+def compare_values(mode: str, current, previous, value_type: ValueType, value=None, value2=None):
+    """
+    Confronto vettoriale tra valori correnti e precedenti
+
+    Args:
+        mode: Una di SCAN_MODES
+        current: Array NumPy dei valori correnti
+        previous: Array NumPy dei valori precedenti (stessa forma)
+        value_type: Tipo dei valori
+        value: Valore per equal/not_equal/increased_by/decreased_by, minimo per between
+        value2: Massimo per between
+
+    Returns:
+        Maschera booleana dei valori che soddisfano la condizione
+    """
+    dtype = current.dtype
+
+    if mode == "equal":
+        return current == np.array(value, dtype=dtype)
+    if mode == "not_equal":
+        return current != np.array(value, dtype=dtype)
+    if mode == "changed":
+        return current != previous
+    if mode == "unchanged":
+        return current == previous
+    if mode == "increased":
+        return current > previous
+    if mode == "decreased":
+        return current < previous
+    if mode == "between":
+        return (current >= value) & (current <= value2)
+
+    # increased_by / decreased_by (gli interi seguono l'overflow del processo)
+    with np.errstate(invalid="ignore", over="ignore"):  # NaN/inf nei float letti
+        delta = current - previous if mode == "increased_by" else previous - current
+    if value_type.is_float:
+        return np.isclose(delta, value)
+    return delta == np.array(value).astype(dtype)
@@ -0,0 +1,174 @@
+"""
+Signature Cache - Cache persistente delle firme risolte
+Ricorda l'RVA (offset dalla base del modulo) trovato per ogni pattern,
+indicizzato per identità del modulo: nome, dimensione e hash degli header.
+Al collegamento successivo l'RVA viene verificato con una sola lettura a
+base + RVA; la scansione completa serve solo se il modulo è cambiato.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from typing import Dict, Optional
+
+from core.regions import ModuleInfo, read_chunk
+from scanners.aob import CompiledPattern
+
+
+# Bytes iniziali del modulo usati come impronta (header PE/ELF, timestamp di build)
+HEADER_SIZE = 4096
+
+
+class SignatureCache:
+    """
+    Cache modulo -> pattern -> RVA, salvata in un file JSON
+
+    Esempio:
+        cache = SignatureCache("cache/signatures.json")
+        scanner = PatternScanner(process, signature_cache=cache)
+        scanner.pattern_scan("48 8B 05 ?? ?? ?? ??", "game.exe")  # scansione + salvataggio
+        # al collegamento successivo: una lettura di verifica invece della scansione
+
+        with cache:                                 # molte firme: un solo salvataggio
+            for pattern in patterns:
+                scanner.pattern_scan(pattern, "game.exe")
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Inizializza la cache
+
+        Args:
+            path: File JSON della cache (None = solo in memoria). Un file
+                mancante o illeggibile equivale a una cache vuota.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        # "nome|dimensione|impronta" -> pattern -> RVA
+        self._entries: Dict[str, Dict[str, int]] = {}
+        self._fingerprints: Dict[tuple, str] = {}
+
+        # Dentro un blocco "with cache:" le modifiche si salvano all'uscita
+        self._dirty = False
+        self._batch_depth = 0
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def __len__(self) -> int:
+        return sum(len(patterns) for patterns in self._entries.values())
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *args):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def lookup(self, process, module: ModuleInfo, pattern: CompiledPattern) -> Optional[int]:
+        """
+        Indirizzo in cache del pattern, verificato leggendo la memoria
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            module: Modulo in cui è stato cercato il pattern
+            pattern: Pattern compilato
+
+        Returns:
+            Indirizzo assoluto o None (non in cache o verifica fallita)
+        """
+        key = self._module_key(process, module)
+        rva = self._entries.get(key, {}).get(pattern.pattern) if key else None
+        if rva is not None and rva + pattern.length <= module.size:
+            data = read_chunk(process, module.base + rva, pattern.length)
+            if data is not None and pattern.matches_at(data, 0):
+                self.hits += 1
+                return module.base + rva
+
+        self.misses += 1
+        return None
+
+    def store(self, process, module: ModuleInfo, pattern: CompiledPattern, address: int):
+        """
+        Memorizza l'indirizzo trovato per un pattern
+
+        Il file viene salvato subito, oppure una volta sola all'uscita dal
+        blocco "with cache:" in corso.
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            module: Modulo in cui è stato cercato il pattern
+            pattern: Pattern compilato
+            address: Indirizzo assoluto del match
+        """
+        key = self._module_key(process, module)
+        if key is None or not module.base <= address < module.end:
+            return
+
+        patterns = self._entries.setdefault(key, {})
+        if patterns.get(pattern.pattern) == address - module.base:
+            return
+        patterns[pattern.pattern] = address - module.base
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def clear(self):
+        """Svuota la cache (e il file)"""
+        self._entries.clear()
+        self.save()
+
+    def flush(self):
+        """Salva il file se ci sono modifiche non ancora scritte"""
+        if self._dirty:
+            self.save()
+
+    def save(self):
+        """Scrive la cache su file (sostituzione atomica)"""
+        self._dirty = False
+        if not self.path:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    def _module_key(self, process, module: ModuleInfo) -> Optional[str]:
+        """Identità del modulo: nome, dimensione e hash degli header (None se illeggibili)"""
+        identity = (module.name.lower(), module.base, module.size)
+        fingerprint = self._fingerprints.get(identity)
+        if fingerprint is None:
+            header = read_chunk(process, module.base, min(module.size, HEADER_SIZE))
+            if header is None:
+                return None
+            fingerprint = hashlib.sha1(_identity_bytes(header)).hexdigest()[:16]
+            self._fingerprints[identity] = fingerprint
+        return f"{module.name.lower()}|{module.size}|{fingerprint}"
+
+
+def _identity_bytes(header: bytes) -> bytes:
+    """
+    Parte degli header che identifica il binario
+
+    Per un PE si usa il COFF header (macchina, numero di sezioni, TimeDateStamp):
+    il loader riscrive ImageBase nell'optional header quando il modulo viene
+    rilocato. Per gli altri formati (ELF) si usa l'intero header.
+    """
+    if header[:2] == b"MZ" and len(header) >= 0x40:
+        pe_offset = struct.unpack_from("<I", header, 0x3C)[0]
+        if header[pe_offset:pe_offset + 4] == b"PE\0\0":
+            return header[pe_offset:pe_offset + 24]
+    return header
@@ -0,0 +1,131 @@
+"""
+Signatures - Ricerca di molte firme AOB in un solo passaggio
+Ogni blocco di memoria viene letto una sola volta e tutte le firme vengono
+cercate sui dati già letti, a finestre piccole che restano nella cache della CPU
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from core.regions import DEFAULT_CHUNK_SIZE, MemoryRegion, enumerate_regions
+from scanners.aob import CompiledPattern
+from scanners.parallel import ScanExecutor
+
+
+# Finestra su cui girano tutte le firme prima di passare alla successiva
+WINDOW_SIZE = 256 * 1024
+
+
+class SignatureSet:
+    """
+    Insieme di firme AOB con nome, cercate tutte insieme in un solo passaggio
+    """
+
+    def __init__(self, signatures: Optional[Dict[str, str]] = None):
+        """
+        Inizializza l'insieme
+
+        Args:
+            signatures: Dizionario nome -> pattern "AB CD ?? EF" (opzionale)
+        """
+        self.patterns: Dict[str, CompiledPattern] = {}
+
+        for name, pattern in (signatures or {}).items():
+            self.add(name, pattern)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SignatureSet":
+        """
+        Carica le firme da un file JSON {"nome": "AB CD ?? EF", ...}
+
+        Args:
+            path: Percorso del file
+
+        Returns:
+            SignatureSet con le firme caricate
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def add(self, name: str, pattern: str):
+        """
+        Aggiunge (o sostituisce) una firma
+
+        Args:
+            name: Nome della firma
+            pattern: Pattern in formato "AB CD ?? EF"
+
+        Raises:
+            ValueError: Se il pattern non è valido o non ha bytes letterali
+        """
+        compiled = CompiledPattern(pattern)
+        if not compiled.anchor:
+            raise ValueError(f"La firma '{name}' non contiene bytes letterali")
+        self.patterns[name] = compiled
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    @property
+    def max_length(self) -> int:
+        """Lunghezza della firma più lunga (overlap necessario tra i blocchi)"""
+        return max((p.length for p in self.patterns.values()), default=0)
+
+    def find_all(self, data, base_address: int = 0, limit: Optional[int] = None,
+                 results: Optional[Dict[str, List[int]]] = None) -> Dict[str, List[int]]:
+        """
+        Cerca tutte le firme in un buffer
+
+        Args:
+            data: Buffer (bytes, bytearray, memoryview, mmap)
+            base_address: Indirizzo corrispondente a data[0]
+            limit: Considera solo i match che iniziano prima di questo offset
+            results: Dizionario da aggiornare (opzionale)
+
+        Returns:
+            Dizionario nome -> lista di indirizzi
+        """
+        if results is None:
+            results = {name: [] for name in self.patterns}
+
+        last_start = len(data) if limit is None else min(len(data), limit)
+
+        # Una finestra alla volta per tutte le firme: con bytes.find i dati
+        # restano in cache invece di ripercorrere l'intero blocco N volte
+        for window in range(0, last_start, WINDOW_SIZE):
+            window_end = min(window + WINDOW_SIZE, last_start)
+            for name, pattern in self.patterns.items():
+                for offset in pattern.find_all(data, window_end, window):
+                    results[name].append(base_address + offset)
+
+        return results
+
+    def scan(self, process, regions: Optional[List[MemoryRegion]] = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             executor: Optional[ScanExecutor] = None) -> Dict[str, List[int]]:
+        """
+        Cerca tutte le firme nelle regioni leggibili con un solo passaggio di lettura
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            regions: Regioni da scansionare (default: tutte le regioni leggibili)
+            chunk_size: Dimensione massima di ogni lettura
+            executor: ScanExecutor per scansionare le regioni in parallelo (default: sequenziale)
+
+        Returns:
+            Dizionario nome -> lista di indirizzi ordinati
+        """
+        if regions is None:
+            regions = enumerate_regions(process)
+
+        results = {name: [] for name in self.patterns}
+        overlap = max(self.max_length - 1, 0)
+
+        executor = executor or ScanExecutor(workers=1)
+
+        # Le unità arrivano in ordine di indirizzo: le liste restano ordinate
+        for _, _, found in executor.imap(process, regions, self.find_all, chunk_size, overlap):
+            for name, addresses in found.items():
+                results[name].extend(addresses)
+
+        return results
@@ -0,0 +1,129 @@
+"""
+Typed Search - Ricerca vettoriale di valori tipizzati
+Interpreta ogni blocco come array NumPy (int8..int64, uint, float32, float64)
+e confronta tutti i valori in una volta: uguaglianza, intervallo o tolleranza
+"""
+
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: richiesto solo da TypedMatcher
+    np = None
+
+from utils.value_types import get_value_type
+
+
+# Modalità di confronto
+MATCH_MODES = ("exact", "range", "epsilon")
+
+
+class TypedMatcher:
+    """
+    Matcher tipizzato per ScanExecutor
+
+    Esempio:
+        matcher = TypedMatcher("float", 3.14, mode="epsilon", epsilon=0.001)
+        offsets = matcher.find_offsets(data)
+    """
+
+    def __init__(self, value_type: str, value, value2=None, mode: str = "exact",
+                 epsilon: float = 0.0, aligned: bool = True):
+        """
+        Inizializza il matcher
+
+        Args:
+            value_type: Tipo del valore ("int", "uint", "float", "double", ...)
+            value: Valore cercato (minimo in modalità "range")
+            value2: Massimo in modalità "range"
+            mode: "exact" (x == value), "range" (value <= x <= value2)
+                  o "epsilon" (|x - value| <= epsilon)
+            epsilon: Tolleranza per la modalità "epsilon"
+            aligned: Considera solo indirizzi allineati alla dimensione del tipo
+
+        Raises:
+            ImportError: Se NumPy non è installato
+            ValueError: Se tipo o modalità non sono validi
+        """
+        if np is None:
+            raise ImportError("TypedMatcher richiede NumPy: pip install numpy")
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Modalità non valida: {mode}")
+        if mode == "range" and value2 is None:
+            raise ValueError("La modalità 'range' richiede value e value2")
+
+        self.value_type = get_value_type(value_type)
+        self.dtype = np.dtype(self.value_type.dtype)
+        self.value = value
+        self.value2 = value2
+        self.mode = mode
+        self.epsilon = epsilon
+        self.aligned = aligned
+
+    @property
+    def size(self) -> int:
+        return self.value_type.size
+
+    def find_offsets(self, data, limit: Optional[int] = None, base_address: int = 0) -> "np.ndarray":
+        """
+        Offset di tutti i valori che soddisfano la condizione
+
+        Args:
+            data: Buffer (bytes, bytearray, memoryview, mmap)
+            limit: Considera solo i valori che iniziano prima di questo offset
+            base_address: Indirizzo di data[0] (serve per l'allineamento)
+
+        Returns:
+            Array di offset (int64) in ordine crescente
+        """
+        size = self.size
+        end = len(data) if limit is None else min(len(data), limit + size - 1)
+
+        if self.aligned:
+            shifts = [(-base_address) % size]
+        else:
+            shifts = range(size)
+
+        found = []
+        for shift in shifts:
+            count = (end - shift) // size
+            if count <= 0:
+                continue
+            values = np.frombuffer(data, dtype=self.dtype, count=count, offset=shift)
+            found.append(np.flatnonzero(self._compare(values)) * size + shift)
+
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        offsets = found[0] if len(found) == 1 else np.sort(np.concatenate(found))
+        return offsets.astype(np.int64, copy=False)
+
+    def find_array(self, data, base_address: int = 0, limit: Optional[int] = None) -> "np.ndarray":
+        """
+        Come find_offsets, ma restituisce indirizzi uint64 (matcher di ScanExecutor)
+        """
+        offsets = self.find_offsets(data, limit, base_address)
+        return offsets.astype(np.uint64) + np.uint64(base_address)
+
+    def find_addresses(self, data, base_address: int = 0, limit: Optional[int] = None) -> List[int]:
+        """
+        Come find_array, ma restituisce una lista di int (matcher di ScanExecutor)
+        """
+        return self.find_array(data, base_address, limit).tolist()
+
+    def _compare(self, values):
+        """Maschera booleana dei valori che soddisfano la condizione"""
+        if self.mode == "exact":
+            return values == np.array(self.value, dtype=self.dtype)
+        if self.mode == "range":
+            return (values >= self.value) & (values <= self.value2)
+        if self.dtype.kind != "f":
+            with np.errstate(over="ignore"):
+                return np.abs(values.astype(np.float64) - self.value) <= self.epsilon
+
+        # Il valore cercato si arrotonda al tipo in memoria: un float32 grande
+        # (es. 123456.7) dista dal float64 più di epsilon anche se è lo stesso
+        target = np.array(self.value, dtype=self.dtype)
+        bits = np.dtype(f"<u{self.dtype.itemsize}")
+        with np.errstate(invalid="ignore", over="ignore"):  # NaN/inf nei float letti
+            close = np.abs(values.astype(np.float64) - target.astype(np.float64)) <= self.epsilon
+        return close | (values.view(bits) == target.view(bits))
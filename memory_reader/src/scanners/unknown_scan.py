@@ -0,0 +1,368 @@
+"""
+Unknown Scan - Ricerca di un valore con valore iniziale sconosciuto
+La scansione iniziale copia tutte le regioni scrivibili in uno snapshot su
+disco (mmap); ogni passaggio successivo confronta la memoria viva (o un altro
+snapshot) con lo snapshot, a blocchi e con viste NumPy tipizzate. I candidati
+sono una bitmap compatta (1 bit per posizione), non una lista di indirizzi.
+Su Linux, con dirty_tracking, si rileggono solo le pagine scritte dal
+processo dopo il passaggio precedente (bit soft-dirty del kernel).
+"""
+
+import os
+import tempfile
+from bisect import bisect_right
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: richiesto solo da UnknownValueScan
+    np = None
+
+from core.regions import DEFAULT_CHUNK_SIZE, enumerate_regions, read_pages
+from core.snapshot import PAGE_SIZE, MemorySnapshot
+from core.soft_dirty import SoftDirtyTracker
+from scanners.scan_session import ScanSession, check_scan_mode, compare_values
+from utils.value_types import get_value_type
+
+
+class UnknownValueScan:
+    """
+    Scansione "valore iniziale sconosciuto"
+
+    Esempio:
+        scan = UnknownValueScan(process, "int")
+        scan.start()
+        # ... il valore nel processo cambia ...
+        scan.next_scan("increased")
+        scan.next_scan("unchanged")
+        session = scan.to_session()  # quando i candidati sono pochi
+    """
+
+    def __init__(self, process, value_type: str = "int", aligned: bool = True,
+                 path: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 dirty_tracking: bool = False):
+        """
+        Inizializza la scansione
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            value_type: Tipo del valore ("int", "long", "float", "double", ...)
+            aligned: Considera solo indirizzi allineati alla dimensione del tipo
+            path: File dello snapshot (default: file temporaneo eliminato da close)
+            chunk_size: Dimensione di ogni blocco confrontato (arrotondata alla pagina)
+            dirty_tracking: Rileggi solo le pagine modificate (Linux, soft-dirty);
+                se non disponibile si torna alla rilettura completa
+
+        Raises:
+            ImportError: Se NumPy non è installato
+            ValueError: Se il tipo non è supportato
+        """
+        if np is None:
+            raise ImportError("UnknownValueScan richiede NumPy: pip install numpy")
+
+        self.process = process
+        self.value_type = get_value_type(value_type)
+        self.dtype = np.dtype(self.value_type.dtype)
+        self.aligned = aligned
+        self.chunk_size = max(PAGE_SIZE, chunk_size // PAGE_SIZE * PAGE_SIZE)
+        self.dirty_tracking = dirty_tracking
+        self.tracker: Optional[SoftDirtyTracker] = None
+
+        self._temporary = path is None
+        self.path = path
+        self.snapshot: Optional[MemorySnapshot] = None
+
+        # Bitmap dei candidati per regione (np.packbits, 1 bit per posizione)
+        self.masks = []
+        self.count = 0
+        self.scan_count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def start(self) -> int:
+        """
+        Scansione iniziale: copia le regioni scrivibili nello snapshot
+
+        Returns:
+            Numero di posizioni candidate
+        """
+        self.close()
+        if self._temporary:
+            fd, self.path = tempfile.mkstemp(suffix=".snap")
+            os.close(fd)
+
+        regions = enumerate_regions(self.process, writable_only=True)
+        self.tracker = self._create_tracker() if self.dirty_tracking else None
+        self.snapshot = MemorySnapshot.capture(self.process, self.path, regions, self.chunk_size,
+                                               self.tracker)
+
+        self.masks = [self._initial_mask(region.size) for region in self.snapshot.regions]
+        self.count = sum(self._valid_slots(region.size) for region in self.snapshot.regions)
+        self.scan_count = 1
+        return self.count
+
+    def next_scan(self, mode: str, value=None, value2=None,
+                  against: Optional[MemorySnapshot] = None) -> int:
+        """
+        Confronta i valori correnti con quelli dello snapshot e filtra i candidati
+
+        Dopo il confronto lo snapshot contiene i valori correnti, pronti per
+        il passaggio successivo.
+
+        Args:
+            mode: Una di SCAN_MODES (changed, unchanged, increased, decreased, ...)
+            value: Valore per equal/not_equal/increased_by/decreased_by, minimo per between
+            value2: Massimo per between
+            against: Confronta con questo snapshot invece che con la memoria viva
+
+        Returns:
+            Numero di candidati rimasti
+
+        Raises:
+            ValueError: Se la modalità non è valida o start non è stato chiamato
+        """
+        check_scan_mode(mode, value, value2)
+        if self.snapshot is None:
+            raise ValueError("Chiama start() prima di next_scan()")
+
+        size = self.value_type.size
+        self.count = 0
+
+        dirty = None
+        if against is not None:
+            # Lo snapshot conterrà i valori di `against`, non più quelli del processo
+            self.tracker = None
+        elif self.tracker is not None:
+            dirty = self.tracker.collect(self.snapshot.regions)
+            dirty_starts = [start for start, _ in dirty]
+
+        for index, address, length in self.snapshot.iter_chunks(self.chunk_size):
+            region = self.snapshot.regions[index]
+            first, slots = self._chunk_slots(region.base, address, length)
+            mask = self._get_mask(index, first, slots)
+            if not mask.any():
+                continue
+
+            # In modalità non allineata servono size-1 bytes del blocco successivo
+            extra = 0 if self.aligned else min(size - 1, region.end - address - length)
+            if against is not None:
+                current = against.read(address, length + extra)
+            elif dirty is not None:
+                runs = _overlapping(dirty, dirty_starts, address, length + extra)
+                if not runs and mode in _CLEAN_RESULTS:
+                    # Nessuna pagina scritta: i valori sono quelli dello snapshot
+                    if not _CLEAN_RESULTS[mode]:
+                        mask[:] = False
+                        self._set_mask(index, first, mask)
+                    self.count += int(mask.sum())
+                    continue
+                current, unreadable = self._read_dirty(index, address, length + extra, runs)
+            else:
+                bulk = read_pages(self.process, address, length + extra)
+                current, unreadable = bulk.data, bulk.runs(False)
+
+            if current is None:
+                mask[:] = False
+            else:
+                start = address - region.base
+                previous = self.snapshot.view(index)[start:start + length + extra]
+                mask &= self._compare_chunk(mode, current, previous, slots, value, value2)
+                del previous
+                if unreadable:
+                    self._drop_unreadable(mask, unreadable)
+                self.snapshot.write(address, current[:length], index)
+
+            self._set_mask(index, first, mask)
+            self.count += int(mask.sum())
+
+        self.scan_count += 1
+        return self.count
+
+    def iter_candidates(self) -> Iterator[Tuple["np.ndarray", "np.ndarray"]]:
+        """
+        Candidati di ogni blocco con l'ultimo valore letto
+
+        Yields:
+            Tuple (indirizzi uint64, valori) per ogni blocco con candidati
+        """
+        size = self.value_type.size
+        step = size if self.aligned else 1
+
+        for index, address, length in self.snapshot.iter_chunks(self.chunk_size):
+            region = self.snapshot.regions[index]
+            first, slots = self._chunk_slots(region.base, address, length)
+            mask = self._get_mask(index, first, slots)
+            hits = np.flatnonzero(mask)
+            if len(hits) == 0:
+                continue
+
+            offsets = (first + hits) * step
+            view = np.frombuffer(self.snapshot.view(index), dtype=np.uint8)
+            raw = view[offsets[:, None] + np.arange(size)]
+            values = raw.view(self.dtype).ravel()
+            del view
+
+            yield offsets.astype(np.uint64) + np.uint64(region.base), values
+
+    def results(self, limit: int = 100) -> List[Tuple[int, object]]:
+        """
+        Restituisce i primi candidati con l'ultimo valore letto
+
+        Args:
+            limit: Numero massimo di risultati
+
+        Returns:
+            Lista di tuple (indirizzo, valore)
+        """
+        results = []
+        for addresses, values in self.iter_candidates():
+            results.extend(zip(addresses[:limit - len(results)].tolist(),
+                               values[:limit - len(results)].tolist()))
+            if len(results) >= limit:
+                break
+        return results
+
+    def to_session(self) -> ScanSession:
+        """
+        Converte i candidati in una ScanSession (conviene quando sono pochi)
+
+        Returns:
+            ScanSession con indirizzi e ultimi valori
+        """
+        session = ScanSession(self.process, self.value_type.name, self.aligned, self.chunk_size)
+        chunks = list(self.iter_candidates())
+        if chunks:
+            session.addresses = np.concatenate([a for a, _ in chunks])
+            session.values = np.concatenate([v for _, v in chunks])
+        session.scan_count = self.scan_count
+        return session
+
+    def _create_tracker(self) -> Optional[SoftDirtyTracker]:
+        """Tracker delle pagine modificate, o None se non disponibile"""
+        try:
+            return SoftDirtyTracker(self.process.process_id)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️ Pagine modificate non tracciabili ({e}): rilettura completa")
+            return None
+
+    def _read_dirty(self, index: int, address: int, length: int,
+                    runs: List[Tuple[int, int]]) -> Tuple[bytearray, List[Tuple[int, int]]]:
+        """
+        Valori correnti di un blocco: snapshot + pagine modificate rilette
+
+        Returns:
+            Tuple (bytes del blocco, range (inizio, fine) illeggibili relativi al blocco)
+        """
+        start = address - self.snapshot.regions[index].base
+        previous = self.snapshot.view(index)[start:start + length]
+        current = bytearray(previous)
+        del previous
+
+        unreadable = []
+        for run_address, run_length in runs:
+            low = max(run_address, address)
+            high = min(run_address + run_length, address + length)
+            bulk = read_pages(self.process, low, high - low)
+            for run_start, run_end in bulk.runs():
+                current[low - address + run_start:low - address + run_end] = bulk.data[run_start:run_end]
+            unreadable.extend((low - address + run_start, low - address + run_end)
+                              for run_start, run_end in bulk.runs(False))
+        return current, unreadable
+
+    def _drop_unreadable(self, mask: "np.ndarray", unreadable: List[Tuple[int, int]]):
+        """Scarta i candidati che toccano bytes illeggibili (offset relativi al blocco)"""
+        size = self.value_type.size
+        step = size if self.aligned else 1
+        for start, end in unreadable:
+            low = max(0, (start - size) // step + 1)
+            high = min(len(mask), (end + step - 1) // step)
+            mask[low:high] = False
+
+    def close(self):
+        """Chiude lo snapshot (e lo elimina se temporaneo)"""
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+            if self._temporary and self.path:
+                os.remove(self.path)
+                self.path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _slot_count(self, region_size: int) -> int:
+        """Numero di posizioni candidate in una regione"""
+        return region_size // self.value_type.size if self.aligned else region_size
+
+    def _chunk_slots(self, base: int, address: int, length: int) -> Tuple[int, int]:
+        """Prima posizione e numero di posizioni di un blocco"""
+        if self.aligned:
+            return (address - base) // self.value_type.size, length // self.value_type.size
+        return address - base, length
+
+    def _valid_slots(self, region_size: int) -> int:
+        """Posizioni con spazio per un valore intero dentro la regione"""
+        if self.aligned:
+            return region_size // self.value_type.size
+        return max(region_size - self.value_type.size + 1, 0)
+
+    def _initial_mask(self, region_size: int) -> "np.ndarray":
+        """Bitmap con tutte le posizioni valide candidate"""
+        mask = np.zeros(self._slot_count(region_size), dtype=bool)
+        mask[:self._valid_slots(region_size)] = True
+        return np.packbits(mask)
+
+    def _get_mask(self, index: int, first: int, slots: int) -> "np.ndarray":
+        """Bitmap di un blocco come array booleano (first è multiplo di 8)"""
+        packed = self.masks[index][first // 8:(first + slots + 7) // 8]
+        return np.unpackbits(packed, count=slots).astype(bool)
+
+    def _set_mask(self, index: int, first: int, mask: "np.ndarray"):
+        """Salva la bitmap di un blocco"""
+        self.masks[index][first // 8:(first + len(mask) + 7) // 8] = np.packbits(mask)
+
+    def _compare_chunk(self, mode: str, current, previous, slots: int, value, value2) -> "np.ndarray":
+        """Confronto vettoriale di tutte le posizioni di un blocco"""
+        size = self.value_type.size
+
+        if self.aligned:
+            new = np.frombuffer(current, dtype=self.dtype, count=slots)
+            old = np.frombuffer(previous, dtype=self.dtype, count=slots)
+            return compare_values(mode, new, old, self.value_type, value, value2)
+
+        # Non allineato: una vista per ognuno degli spostamenti 0..size-1
+        result = np.zeros(slots, dtype=bool)
+        available = min(len(current), len(previous))
+        for shift in range(size):
+            count = min((available - shift) // size, len(range(shift, slots, size)))
+            if count <= 0:
+                continue
+            new = np.frombuffer(current, dtype=self.dtype, count=count, offset=shift)
+            old = np.frombuffer(previous, dtype=self.dtype, count=count, offset=shift)
+            result[shift:shift + count * size:size] = compare_values(
+                mode, new, old, self.value_type, value, value2
+            )
+        return result
+
+
+# Risultato di una modalità su un blocco senza pagine modificate
+# (valori uguali allo snapshot): True = candidati invariati, False = scartati
+_CLEAN_RESULTS = {"unchanged": True, "changed": False, "increased": False, "decreased": False}
+
+
+def _overlapping(ranges: List[Tuple[int, int]], starts: List[int], address: int,
+                 length: int) -> List[Tuple[int, int]]:
+    """Range (ordinati, disgiunti) che si sovrappongono a [address, address + length)"""
+    end = address + length
+    index = max(bisect_right(starts, address) - 1, 0)
+    result = []
+    for run_address, run_length in ranges[index:]:
+        if run_address >= end:
+            break
+        if run_address + run_length > address:
+            result.append((run_address, run_length))
+    return result
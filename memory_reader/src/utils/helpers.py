@@ -6,16 +6,22 @@ Funzioni helper varie per l'applicazione
 from typing import Any
 
 
-def format_address(address: int) -> str:
+def format_address(address: int, modules=None) -> str:
     """
     Formatta un indirizzo in esadecimale
     
     Args:
         address: Indirizzo numerico
+        modules: ModuleIndex per aggiungere "modulo+0xOFFSET" (opzionale)
         
     Returns:
-        Stringa formattata (es. "0x12345678")
+        Stringa formattata (es. "0x12345678" o "0x7FF6A1B21234 (game.exe+0x1234)")
     """
+    if modules is not None:
+        found = modules.find(address)
+        if found is not None:
+            module, offset = found
+            return f"0x{address:X} ({module.name}+0x{offset:X})"
     return f"0x{address:X}"
 
 
@@ -0,0 +1,341 @@
+"""
+Hex Dump - Formattazione hex dump a blocchi
+Ogni blocco viene formattato in una volta: con NumPy le righe (a larghezza
+fissa) si compongono in una matrice di caratteri, senza NumPy con un solo
+bytes.hex(" ") e un solo translate per blocco. Il dump di un range del
+processo è letto e scritto a blocchi, come generatore di righe o
+direttamente su file, con righe ripetute compresse opzionalmente ("*").
+"""
+
+from typing import IO, Iterator, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # opzionale: senza NumPy si formatta riga per riga
+    np = None
+
+from core.regions import read_chunk
+
+
+# Byte -> carattere mostrato nella colonna ASCII (non stampabili = ".")
+ASCII_TABLE = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+# Bytes letti (e formattati) per blocco durante il dump di un range
+DUMP_CHUNK_SIZE = 1024 * 1024
+
+# Cifre hex minuscole -> maiuscole (bytes.hex produce minuscole)
+_UPPERCASE = bytes.maketrans(b"abcdef", b"ABCDEF")
+
+# Tabella byte -> cifre hex per gli indirizzi con NumPy (creata al primo uso)
+_HEX_PAIRS = None
+
+
+class HexDumper:
+    """
+    Formattatore di hex dump
+
+    Formato di una riga (default):
+        00001A20  48 65 6C 6C 6F 00 00 00 00 00 00 00 00 00 00 00  Hello...........
+
+    Esempio:
+        dumper = HexDumper(collapse=True)
+        for line in dumper.iter_process(process, 0x1A2B0000, 4096):
+            print(line)
+        dumper.write(process, base, 200 * 1024 * 1024, "dump.txt")
+    """
+
+    def __init__(self, width: int = 16, group: int = 0, ascii: bool = True, bars: bool = False,
+                 address_prefix: str = "", collapse: bool = False, ascii_gap: int = 2):
+        """
+        Inizializza il formattatore
+
+        Args:
+            width: Bytes per riga
+            group: Spazio doppio ogni group bytes (0 = nessun raggruppamento)
+            ascii: Mostra la colonna ASCII
+            bars: Racchiudi la colonna ASCII tra "|"
+            address_prefix: Prefisso degli indirizzi (es. "0x")
+            collapse: Sostituisci le righe uguali alla precedente con un solo "*"
+            ascii_gap: Spazi tra la colonna hex e la colonna ASCII
+
+        Raises:
+            ValueError: Se width non è positivo
+        """
+        if width <= 0:
+            raise ValueError("width deve essere positivo")
+        self.width = width
+        self.group = group if 0 < group < width else 0
+        self.ascii = ascii
+        self.bars = bars
+        self.address_prefix = address_prefix
+        self.collapse = collapse
+        self.ascii_gap = max(1, ascii_gap)
+
+        # Larghezza della colonna hex: "XX " per byte, più uno spazio tra i gruppi
+        groups = -(-width // self.group) if self.group else 1
+        self.hex_width = width * 3 - 1 + groups - 1
+
+    def format(self, data: bytes, address: int = 0) -> str:
+        """Hex dump di un buffer come un'unica stringa"""
+        return "\n".join(self.iter_lines(data, address))
+
+    def iter_lines(self, data: bytes, address: int = 0) -> Iterator[str]:
+        """
+        Righe dell'hex dump di un buffer
+
+        Args:
+            data: Bytes da formattare
+            address: Indirizzo di data[0]
+
+        Yields:
+            Righe formattate
+        """
+        state = [None, False]
+        view = memoryview(data)
+        digits = _address_digits(address + len(view))
+        step = self._block_size(DUMP_CHUNK_SIZE)
+        for offset in range(0, len(view), step):
+            block = self._render(view[offset:offset + step], address + offset, digits, state)
+            yield from block.decode("ascii").splitlines()
+
+    def iter_process(self, process, address: int, size: int,
+                     chunk_size: int = DUMP_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Righe dell'hex dump di un range del processo, lette a blocchi
+
+        Un blocco illeggibile diventa una sola riga "?? illeggibile".
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            address: Indirizzo iniziale
+            size: Numero di bytes
+            chunk_size: Bytes letti per blocco
+
+        Yields:
+            Righe formattate
+        """
+        for block in self._iter_blocks(process, address, size, chunk_size):
+            yield from block.decode("ascii").splitlines()
+
+    def write(self, process, address: int, size: int, output: Union[str, IO[str]],
+              chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+        """
+        Scrive l'hex dump di un range su file, un blocco alla volta
+
+        Args:
+            process: Oggetto Pymem (o compatibile)
+            address: Indirizzo iniziale
+            size: Numero di bytes
+            output: Percorso del file o file già aperto (testo o binario)
+            chunk_size: Bytes letti per blocco
+
+        Returns:
+            Numero di caratteri scritti
+        """
+        if isinstance(output, str):
+            with open(output, "wb") as f:
+                return self.write(process, address, size, f, chunk_size)
+
+        binary = "b" in getattr(output, "mode", "")
+        written = 0
+        for block in self._iter_blocks(process, address, size, chunk_size):
+            output.write(block if binary else block.decode("ascii"))
+            written += len(block)
+        return written
+
+    def _block_size(self, chunk_size: int) -> int:
+        """Dimensione di un blocco: multiplo di width, così le righe non si spezzano"""
+        return max(self.width, chunk_size - chunk_size % self.width)
+
+    def _iter_blocks(self, process, address: int, size: int, chunk_size: int) -> Iterator[bytes]:
+        """Testo ASCII di ogni blocco letto (righe terminate da "\\n")"""
+        chunk_size = self._block_size(chunk_size)
+        digits = _address_digits(address + size)
+        state = [None, False]
+        end = address + size
+        current = address
+        while current < end:
+            length = min(chunk_size, end - current)
+            data = read_chunk(process, current, length)
+            if data is None:
+                state[:] = [None, False]
+                yield f"{self.address_prefix}{current:0{digits}X}  ?? illeggibile ({length} bytes)\n".encode("ascii")
+            else:
+                yield self._render(data, current, digits, state)
+            current += length
+
+    def _render(self, data, address: int, digits: int, state: list) -> bytes:
+        """
+        Formatta un blocco in testo ASCII (righe terminate da "\\n")
+
+        state = [ultima riga mostrata, riga "*" già emessa] per collapse,
+        condiviso tra i blocchi dello stesso dump.
+        """
+        data = bytes(data)
+        full = len(data) - len(data) % self.width
+        if np is None or not full:
+            return self._render_rows(data, address, digits, state)
+
+        text = self._render_matrix(data[:full], address, digits, state)
+        if full < len(data):
+            text += self._render_rows(data[full:], address + full, digits, state)
+        return text
+
+    def _render_rows(self, data: bytes, address: int, digits: int, state: list) -> bytes:
+        """Una riga alla volta, tagliando un unico hex() e un unico translate del blocco"""
+        width = self.width
+        group = self.group
+        gap = " " * self.ascii_gap
+        hex_all = data.hex(" ").upper()
+        text = data.translate(ASCII_TABLE).decode("ascii") if self.ascii else ""
+
+        lines = []
+        previous, collapsed = state
+        for offset in range(0, len(data), width):
+            row = data[offset:offset + width]
+            if self.collapse:
+                if row == previous:
+                    if not collapsed:
+                        lines.append("*")
+                        collapsed = True
+                    continue
+                previous = row
+                collapsed = False
+
+            hex_part = hex_all[offset * 3:offset * 3 + width * 3 - 1]
+            if group:
+                hex_part = "  ".join(hex_part[i:i + group * 3 - 1] for i in range(0, len(hex_part), group * 3))
+            if len(row) < width:
+                hex_part = hex_part.ljust(self.hex_width)
+
+            line = f"{self.address_prefix}{address + offset:0{digits}X}  {hex_part}"
+            if self.ascii:
+                ascii_part = text[offset:offset + width]
+                if self.bars:
+                    line += f"{gap}|{ascii_part.ljust(width)}|"
+                else:
+                    line += f"{gap}{ascii_part}"
+            lines.append(line)
+
+        state[:] = [previous, collapsed]
+        return "".join(line + "\n" for line in lines).encode("ascii")
+
+    def _render_matrix(self, data: bytes, address: int, digits: int, state: list) -> bytes:
+        """Righe complete formattate con NumPy; con collapse si formattano solo le righe mostrate"""
+        width = self.width
+        count = len(data) // width
+        if not self.collapse:
+            offsets = np.arange(count, dtype=np.uint64) * np.uint64(width)
+            return self._matrix(data, np.uint64(address) + offsets, digits).tobytes()
+
+        # Righe uguali alla precedente: la prima di ogni serie diventa "*", le altre spariscono
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(count, width)
+        previous, collapsed = state
+        same = np.empty(count, dtype=bool)
+        same[0] = previous is not None and data[:width] == previous
+        same[1:] = (rows[1:] == rows[:-1]).all(axis=1)
+        starts = same.copy()
+        starts[1:] &= ~same[:-1]
+        starts[0] &= not collapsed
+        state[:] = [data[-width:], bool(same[-1])]
+
+        kept = np.flatnonzero(~same)
+        text = b""
+        if len(kept):
+            selected = data if len(kept) == count else rows[kept].tobytes()
+            addresses = np.uint64(address) + kept.astype(np.uint64) * np.uint64(width)
+            text = self._matrix(selected, addresses, digits).tobytes()
+        if not starts.any():
+            return text
+
+        # Posizione di ogni "*" nel testo: dopo le righe mostrate che la precedono
+        line_length = len(text) // len(kept) if len(kept) else 0
+        parts = []
+        last = 0
+        for position in np.searchsorted(kept, np.flatnonzero(starts)).tolist():
+            parts.append(text[last:position * line_length])
+            parts.append(b"*\n")
+            last = position * line_length
+        parts.append(text[last:])
+        return b"".join(parts)
+
+    def _matrix(self, data: bytes, addresses: "np.ndarray", digits: int) -> "np.ndarray":
+        """
+        Matrice di caratteri: una riga del dump per ogni riga di data
+
+        Le colonne hex e ASCII arrivano da un unico bytes.hex(" ") e un unico
+        translate del blocco, copiati nella matrice a blocchi contigui.
+        """
+        width = self.width
+        count = len(addresses)
+        template, hex_start, ascii_start = self._layout(digits)
+
+        out = np.empty((count, len(template)), dtype=np.uint8)
+        out[:] = template
+
+        # Indirizzi: 8 bytes big-endian -> 16 cifre, di cui si tengono le ultime digits
+        address_bytes = addresses.astype(">u8").view(np.uint8).reshape(count, 8)
+        address_chars = _hex_pairs()[address_bytes].view(np.uint8).reshape(count, 16)
+        column = len(self.address_prefix)
+        out[:, column:column + digits] = address_chars[:, 16 - digits:]
+
+        # Hex: "xx xx ... xx" del blocco intero, 3 caratteri per byte (manca solo l'ultimo spazio)
+        hex_text = np.frombuffer(data.hex(" ").encode("ascii").translate(_UPPERCASE), dtype=np.uint8)
+        body = hex_text[:(count - 1) * width * 3].reshape(count - 1, width * 3)
+        tail = hex_text[(count - 1) * width * 3:]
+        group = self.group or width
+        for first in range(0, width, group):
+            last = min(first + group, width)
+            column = hex_start + 3 * first + first // group
+            length = 3 * (last - first) - 1
+            out[:count - 1, column:column + length] = body[:, 3 * first:3 * first + length]
+            out[count - 1, column:column + length] = tail[3 * first:3 * first + length]
+
+        if self.ascii:
+            text = np.frombuffer(data.translate(ASCII_TABLE), dtype=np.uint8).reshape(count, width)
+            out[:, ascii_start:ascii_start + width] = text
+        return out
+
+    def _layout(self, digits: int) -> Tuple["np.ndarray", int, int]:
+        """Riga modello (spazi, prefisso, barre, "\\n") e colonne iniziali di hex e ASCII"""
+        prefix = self.address_prefix
+        hex_start = len(prefix) + digits + 2
+
+        line = prefix + " " * (digits + 2 + self.hex_width)
+        gap = " " * self.ascii_gap
+        ascii_start = len(line) + len(gap) + (1 if self.bars else 0)
+        if self.ascii:
+            line += gap + "|" + " " * self.width + "|" if self.bars else gap + " " * self.width
+        line += "\n"
+
+        template = np.frombuffer(line.encode("ascii"), dtype=np.uint8)
+        return template, hex_start, ascii_start
+
+
+def _hex_pairs() -> "np.ndarray":
+    """Tabella byte -> 2 cifre hex maiuscole (uint16)"""
+    global _HEX_PAIRS
+    if _HEX_PAIRS is None:
+        text = "".join(f"{b:02X}" for b in range(256)).encode("ascii")
+        _HEX_PAIRS = np.frombuffer(text, dtype=np.uint16)
+    return _HEX_PAIRS
+
+
+def _address_digits(end: int) -> int:
+    """Cifre hex degli indirizzi di un dump (almeno 8, uguali per tutte le righe)"""
+    return max(8, len(f"{max(end - 1, 0):X}"))
+
+
+def hexdump(data: bytes, address: int = 0, width: int = 16) -> str:
+    """
+    Hex dump di un buffer con il formato di default
+
+    Args:
+        data: Bytes da formattare
+        address: Indirizzo di data[0]
+        width: Bytes per riga
+
+    Returns:
+        Stringa con una riga ogni width bytes
+    """
+    return HexDumper(width).format(data, address)
@@ -0,0 +1,60 @@
+"""
+Value Types - Tipi di valore supportati da scanner e reader
+Associa ogni nome di tipo al formato struct, al typecode di array e al dtype NumPy
+"""
+
+import struct
+from typing import NamedTuple
+
+
+class ValueType(NamedTuple):
+    """Descrizione di un tipo numerico little-endian"""
+
+    name: str
+    fmt: str        # formato struct (es. "<i")
+    typecode: str   # typecode del modulo array
+    dtype: str      # dtype NumPy (es. "<i4")
+    is_float: bool
+
+    @property
+    def size(self) -> int:
+        return struct.calcsize(self.fmt)
+
+    def pack(self, value) -> bytes:
+        return struct.pack(self.fmt, value)
+
+    def unpack(self, data: bytes):
+        return struct.unpack(self.fmt, data)[0]
+
+
+VALUE_TYPES = {
+    "byte": ValueType("byte", "<b", "b", "<i1", False),
+    "ubyte": ValueType("ubyte", "<B", "B", "<u1", False),
+    "short": ValueType("short", "<h", "h", "<i2", False),
+    "ushort": ValueType("ushort", "<H", "H", "<u2", False),
+    "int": ValueType("int", "<i", "i", "<i4", False),
+    "uint": ValueType("uint", "<I", "I", "<u4", False),
+    "long": ValueType("long", "<q", "q", "<i8", False),
+    "ulong": ValueType("ulong", "<Q", "Q", "<u8", False),
+    "float": ValueType("float", "<f", "f", "<f4", True),
+    "double": ValueType("double", "<d", "d", "<f8", True),
+}
+
+
+def get_value_type(name: str) -> ValueType:
+    """
+    Restituisce il ValueType corrispondente al nome
+
+    Args:
+        name: Nome del tipo ("int", "long", "float", ...)
+
+    Returns:
+        ValueType
+
+    Raises:
+        ValueError: Se il tipo non è supportato
+    """
+    try:
+        return VALUE_TYPES[name]
+    except KeyError:
+        raise ValueError(f"Tipo non supportato: {name}") from None
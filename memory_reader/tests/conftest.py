@@ -0,0 +1,74 @@
+"""
+Configurazione dei test: rende importabili i moduli di src/ e fornisce
+un processo finto (fixture `process`) con la stessa interfaccia di Pymem
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+PAGE_SIZE = 4096
+
+
+class FakeProcess:
+    """
+    Processo finto con memoria a pagine
+
+    Esistono solo le pagine scritte con poke(); le pagine in `bad` (indirizzi
+    di pagina) sollevano OSError come una guard page. reads e writes contano
+    le chiamate a read_bytes e write_bytes.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.bad = set()
+        self.reads = 0
+        self.writes = 0
+
+    def poke(self, address, data):
+        """Scrive bytes mappando le pagine mancanti (non conta come scrittura)"""
+        for page in self._pages_of(address, len(data)):
+            self.pages.setdefault(page, bytearray(PAGE_SIZE))
+        self._copy(address, data)
+
+    def read_bytes(self, address, length):
+        self.reads += 1
+        self._check(address, length)
+        out = bytearray()
+        for page in self._pages_of(address, length):
+            start = max(address, page) - page
+            end = min(address + length, page + PAGE_SIZE) - page
+            out += self.pages[page][start:end]
+        return bytes(out)
+
+    def write_bytes(self, address, data, length):
+        self.writes += 1
+        self._check(address, length)
+        self._copy(address, data[:length])
+
+    def _check(self, address, length):
+        for page in self._pages_of(address, length):
+            if page not in self.pages or page in self.bad:
+                raise OSError(f"Impossibile accedere a 0x{address:X}+{length}")
+
+    def _copy(self, address, data):
+        for page in self._pages_of(address, len(data)):
+            start = max(address, page)
+            end = min(address + len(data), page + PAGE_SIZE)
+            self.pages[page][start - page:end - page] = data[start - address:end - address]
+
+    @staticmethod
+    def _pages_of(address, length):
+        first = address - address % PAGE_SIZE
+        return range(first, address + max(length, 1), PAGE_SIZE)
+
+
+@pytest.fixture
+def process():
+    """Processo finto vuoto (la memoria si mappa con process.poke)"""
+    return FakeProcess()
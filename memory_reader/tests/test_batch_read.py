@@ -0,0 +1,57 @@
+"""
+Test delle letture raggruppate con pagine illeggibili
+"""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.batch_read import coalesce, read_many, read_values
+from core.regions import PAGE_SIZE
+
+
+BASE = 0x100000
+PAGES = 8
+BAD_PAGE = BASE + 3 * PAGE_SIZE
+
+
+@pytest.fixture
+def memory(process):
+    """8 pagine di uint32 (valore = indice) con la pagina 3 illeggibile"""
+    count = PAGES * PAGE_SIZE // 4
+    process.poke(BASE, struct.pack(f"<{count}I", *range(count)))
+    process.bad.add(BAD_PAGE)
+    return process
+
+
+def test_read_values_keeps_readable_pages(memory):
+    # Un indirizzo ogni 256 bytes, in ordine sparso: un solo gruppo che attraversa la pagina 3
+    addresses = np.arange(BASE, BASE + PAGES * PAGE_SIZE, 256, dtype=np.uint64)[::-1]
+    assert len(coalesce([(int(address), 4) for address in addresses])) == 1
+
+    values, valid = read_values(memory, addresses, "<u4")
+
+    on_bad_page = (addresses >= BAD_PAGE) & (addresses < BAD_PAGE + PAGE_SIZE)
+    assert valid.tolist() == (~on_bad_page).tolist()
+    assert values[valid].tolist() == ((addresses[valid] - BASE) // 4).tolist()
+
+
+def test_read_values_value_across_bad_page(memory):
+    addresses = np.array([BAD_PAGE - 2, BAD_PAGE - 8, BAD_PAGE + PAGE_SIZE], dtype=np.uint64)
+    values, valid = read_values(memory, addresses, "<u4")
+
+    assert valid.tolist() == [False, True, True]
+    assert values[1:].tolist() == [(BAD_PAGE - 8 - BASE) // 4, (BAD_PAGE + PAGE_SIZE - BASE) // 4]
+
+
+def test_read_many_same_span(memory):
+    requests = [(BAD_PAGE - 4, 4), (BAD_PAGE + 16, 4), (BAD_PAGE + PAGE_SIZE, 4)]
+    assert len(coalesce(requests)) == 1
+
+    results = read_many(memory, requests)
+
+    assert results[1] is None
+    assert results[0] == struct.pack("<I", (BAD_PAGE - 4 - BASE) // 4)
+    assert results[2] == struct.pack("<I", (BAD_PAGE + PAGE_SIZE - BASE) // 4)
@@ -0,0 +1,67 @@
+"""
+Test del blocco dei valori
+"""
+
+import struct
+
+from core.freezer import ValueFreezer
+from core.memory_reader import MemoryReader
+
+
+BASE = 0x10000
+
+
+def test_rewrites_only_changed_values(process):
+    process.poke(BASE, struct.pack("<ii", 999, 5))
+
+    freezer = ValueFreezer(process)
+    freezer.freeze(BASE, 999, "int")
+    freezer.freeze(BASE + 4, 100, "int")
+
+    assert freezer.apply() == 1
+    assert process.read_bytes(BASE, 8) == struct.pack("<ii", 999, 100)
+    assert freezer.apply() == 0
+
+    stats = freezer.stats()
+    assert stats[BASE]["writes"] == 0 and stats[BASE]["skipped"] == 2
+    assert stats[BASE + 4]["writes"] == 1 and stats[BASE + 4]["skipped"] == 1
+
+
+def test_adjacent_entries_share_one_write(process):
+    process.poke(BASE, bytes(16))
+    process.poke(BASE + 0x1000, bytes(4))
+
+    freezer = ValueFreezer(process)
+    freezer.freeze(BASE, 1, "int")
+    freezer.freeze(BASE + 4, 2.5, "float")
+    freezer.freeze(BASE + 8, b"\xAA\xBB", "bytes")
+    freezer.freeze(BASE + 0x1000, 3, "int")
+
+    assert freezer.apply() == 2
+    assert process.writes == 2
+    assert process.read_bytes(BASE, 10) == struct.pack("<if", 1, 2.5) + b"\xAA\xBB"
+
+
+def test_failures_are_counted(process):
+    process.poke(BASE, bytes(4))
+    process.bad.add(BASE)
+
+    freezer = ValueFreezer(process)
+    freezer.freeze(BASE, 1, "int")
+    freezer.apply()
+    freezer.apply()
+
+    stats = freezer.stats()[BASE]
+    assert stats["failures"] == 2 and stats["writes"] == 0
+    assert "0x10000" in stats["last_error"]
+
+
+def test_freeze_invalidates_reader_cache(process):
+    process.poke(BASE, struct.pack("<i", 5))
+    reader = MemoryReader(process, cache_pages=4)
+    assert reader.read_int(BASE) == 5
+
+    freezer = ValueFreezer(reader)
+    freezer.freeze(BASE, 999, "int")
+    assert freezer.apply() == 1
+    assert reader.read_int(BASE) == 999
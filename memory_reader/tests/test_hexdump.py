@@ -0,0 +1,38 @@
+"""
+Test del formato dell'hex dump
+"""
+
+import pytest
+
+import utils.hexdump as hexdump
+from core.memory_reader import MemoryReader
+from utils.hexdump import HexDumper
+
+
+DATA = b"Hello, world!\0\x01\x02" + b"ABC"
+
+EXPECTED = [
+    "1A2B3C40  48 65 6C 6C 6F 2C 20 77 6F 72 6C 64 21 00 01 02   Hello, world!...",
+    "1A2B3C50  41 42 43                                          ABC",
+]
+
+
+@pytest.fixture(params=["numpy", "rows"])
+def renderer(request, monkeypatch):
+    """Esegue il test con e senza NumPy"""
+    if request.param == "rows":
+        monkeypatch.setattr(hexdump, "np", None)
+    elif hexdump.np is None:
+        pytest.skip("NumPy non installato")
+
+
+def test_dump_memory_keeps_historic_format(process, renderer):
+    process.poke(0x1A2B3C40, DATA)
+    dump = MemoryReader(process).dump_memory(0x1A2B3C40, len(DATA))
+    assert dump.split("\n")[3:] == EXPECTED
+
+
+def test_default_ascii_gap(renderer):
+    lines = HexDumper().format(DATA, 0x1A2B3C40).split("\n")
+    assert lines[0].endswith("01 02  Hello, world!...")
+    assert lines[1] == "1A2B3C50  41 42 43" + " " * 41 + "ABC"
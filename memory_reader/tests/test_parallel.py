@@ -0,0 +1,66 @@
+"""
+Test della scansione parallela con pagine illeggibili
+"""
+
+import pytest
+
+from core.regions import PAGE_SIZE, MemoryRegion
+from scanners.parallel import ScanExecutor
+
+
+BASE = 0x100000
+NEEDLE = b"NEEDLE"
+
+
+def find_needles(data, base_address, limit):
+    """Matcher di prova: indirizzi di NEEDLE che iniziano prima di limit"""
+    found = []
+    start = data.find(NEEDLE)
+    while 0 <= start < limit:
+        found.append(base_address + start)
+        start = data.find(NEEDLE, start + 1)
+    return found
+
+
+def scan(process, pages, chunk_pages, skip_zero=True):
+    executor = ScanExecutor(workers=1)
+    region = MemoryRegion(BASE, pages * PAGE_SIZE, "rw-")
+    found = []
+    for _, _, result in executor.imap(process, [region], find_needles,
+                                      chunk_size=chunk_pages * PAGE_SIZE,
+                                      overlap=len(NEEDLE) - 1, skip_zero=skip_zero):
+        found.extend(result)
+    return found, executor.stats
+
+
+@pytest.mark.parametrize("skip_zero", [True, False])
+def test_matches_around_an_unreadable_page(process, skip_zero):
+    process.poke(BASE, bytes(16 * PAGE_SIZE))
+    expected = [
+        BASE + 2 * PAGE_SIZE + 10,          # prima della pagina illeggibile
+        BASE + 4 * PAGE_SIZE - 3,           # a cavallo con la pagina illeggibile: perso
+        BASE + 4 * PAGE_SIZE,               # subito dopo la pagina illeggibile
+        BASE + 8 * PAGE_SIZE - 2,           # a cavallo tra le due unità
+        BASE + 12 * PAGE_SIZE + 7,
+    ]
+    for address in expected:
+        process.poke(address, NEEDLE)
+    process.bad.add(BASE + 3 * PAGE_SIZE)
+
+    found, stats = scan(process, 16, 8, skip_zero)
+
+    assert found == [address for address in expected if address != BASE + 4 * PAGE_SIZE - 3]
+    assert stats.unreadable_bytes == PAGE_SIZE
+    assert stats.read_bytes == 15 * PAGE_SIZE
+    assert "OSError" in stats.last_error
+
+
+def test_unreadable_overlap_page(process):
+    process.poke(BASE, bytes(16 * PAGE_SIZE))
+    process.poke(BASE + 8 * PAGE_SIZE - 6, NEEDLE)  # finisce prima della pagina illeggibile
+    process.bad.add(BASE + 8 * PAGE_SIZE)           # prima pagina della seconda unità
+
+    found, stats = scan(process, 16, 8)
+
+    assert found == [BASE + 8 * PAGE_SIZE - 6]
+    assert stats.unreadable_bytes == PAGE_SIZE
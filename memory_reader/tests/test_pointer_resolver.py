@@ -0,0 +1,93 @@
+"""
+Test del resolver di catene di puntatori
+"""
+
+import struct
+
+from core.pointer_resolver import PointerChainResolver
+
+
+BASE = 0x10000
+
+
+def poke_pointer(process, address, value):
+    process.poke(address, struct.pack("<Q", value))
+
+
+def far_chains(process, count):
+    """Una catena a due livelli per nome, su pagine lontane (nessuna lettura raggruppata)"""
+    chains = {}
+    for i in range(count):
+        base = 0x100000 * (i + 1)
+        poke_pointer(process, base, base + 0x10000)
+        poke_pointer(process, base + 0x10000 + 0x48, base + 0x20000)
+        chains[f"chain{i}"] = (base, [0x48, 0x20])
+    return chains
+
+
+def test_shared_prefix_read_once(process):
+    poke_pointer(process, BASE, 0x20000)
+    poke_pointer(process, 0x20000 + 0x48, 0x30000)
+
+    resolver = PointerChainResolver(process, {
+        "hp": (BASE, [0x48, 0x20]),
+        "mp": (BASE, [0x48, 0x24]),
+    })
+    assert resolver.resolve_all() == {"hp": 0x30020, "mp": 0x30024}
+    assert process.reads == 2  # un puntatore per livello, condiviso dalle due catene
+
+
+def test_cache_until_tick(process):
+    poke_pointer(process, BASE, 0x20000)
+    resolver = PointerChainResolver(process, {"hp": (BASE, [0x10])})
+
+    assert resolver.resolve("hp") == 0x20010
+    assert resolver.resolve_all() == {"hp": 0x20010}
+    assert process.reads == 1
+
+    poke_pointer(process, BASE, 0x40000)
+    assert resolver.resolve("hp") == 0x20010
+    resolver.tick()
+    assert resolver.resolve("hp") == 0x40010
+
+
+def test_broken_chains(process):
+    poke_pointer(process, BASE, 0)              # puntatore nullo
+    poke_pointer(process, BASE + 8, 0x900000)   # punta a memoria non mappata
+
+    resolver = PointerChainResolver(process, {
+        "null": (BASE, [0x10, 0x20]),
+        "unmapped": (BASE + 8, [0x10, 0x20]),
+    })
+    assert resolver.resolve_all() == {"null": None, "unmapped": None}
+    assert resolver.resolve("unmapped") is None
+    assert resolver.resolve("missing") is None
+
+
+def test_remove_drops_reads(process):
+    resolver = PointerChainResolver(process, far_chains(process, 4))
+
+    resolver.resolve_all()
+    assert process.reads == 8
+
+    resolver.remove("chain0")
+    resolver.remove("chain1")
+    resolver.tick()
+    process.reads = 0
+    result = resolver.resolve_all()
+
+    assert process.reads == 4
+    assert result == {"chain2": 0x300000 + 0x20000 + 0x20, "chain3": 0x400000 + 0x20000 + 0x20}
+
+
+def test_add_remove_cycles_do_not_grow_tree(process):
+    resolver = PointerChainResolver(process, far_chains(process, 2))
+    nodes = len(resolver._nodes)
+
+    for _ in range(10):
+        resolver.add("temp", 0x100000, [0x48, 0x30])
+        resolver.add("temp", 0x200000, [0x48, 0x30])  # sostituzione
+        resolver.remove("temp")
+
+    assert len(resolver._nodes) == nodes
+    assert resolver.resolve("chain1") == 0x200000 + 0x20000 + 0x20
@@ -0,0 +1,55 @@
+"""
+Test della lettura tollerante a pagine illeggibili
+"""
+
+from core.regions import PAGE_SIZE, read_pages
+
+
+BASE = 0x100000
+
+
+def fill(process, pages):
+    """Mappa `pages` pagine con un byte diverso per pagina"""
+    for page in range(pages):
+        process.poke(BASE + page * PAGE_SIZE, bytes([page + 1]) * PAGE_SIZE)
+
+
+def test_complete_read_is_one_call(process):
+    fill(process, 4)
+    result = read_pages(process, BASE, 4 * PAGE_SIZE)
+
+    assert result.complete and result.error is None
+    assert result.runs(False) == []
+    assert result.readable_bytes == 4 * PAGE_SIZE
+    assert process.reads == 1
+
+
+def test_bisects_down_to_the_bad_page(process):
+    fill(process, 16)
+    process.bad.add(BASE + 5 * PAGE_SIZE)
+
+    result = read_pages(process, BASE, 16 * PAGE_SIZE)
+
+    assert not result.complete
+    assert list(result.valid) == [1] * 5 + [0] + [1] * 10
+    assert result.runs() == [(0, 5 * PAGE_SIZE), (6 * PAGE_SIZE, 16 * PAGE_SIZE)]
+    assert result.runs(False) == [(5 * PAGE_SIZE, 6 * PAGE_SIZE)]
+    assert result.readable_bytes == 15 * PAGE_SIZE
+    assert result.error.startswith("OSError")
+    assert process.reads < 16  # meno di una lettura per pagina
+
+    assert result.data[4 * PAGE_SIZE:5 * PAGE_SIZE] == bytes([5]) * PAGE_SIZE
+    assert result.data[5 * PAGE_SIZE:6 * PAGE_SIZE] == bytes(PAGE_SIZE)
+    assert result.data[6 * PAGE_SIZE:7 * PAGE_SIZE] == bytes([7]) * PAGE_SIZE
+
+
+def test_unaligned_range(process):
+    fill(process, 4)
+    process.bad.add(BASE + PAGE_SIZE)
+
+    result = read_pages(process, BASE + 100, 3 * PAGE_SIZE)
+
+    assert list(result.valid) == [1, 0, 1, 1]
+    assert result.runs(False) == [(PAGE_SIZE - 100, 2 * PAGE_SIZE - 100)]
+    assert result.runs() == [(0, PAGE_SIZE - 100), (2 * PAGE_SIZE - 100, 3 * PAGE_SIZE)]
+    assert result.readable_bytes == 2 * PAGE_SIZE
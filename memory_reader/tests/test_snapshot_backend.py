@@ -0,0 +1,45 @@
+"""
+Test del backend basato su snapshot
+"""
+
+import pytest
+
+from backends.snapshot_backend import SnapshotBackend
+from core.regions import MemoryRegion
+from core.snapshot import MemorySnapshot
+
+
+BASE = 0x10000
+
+
+@pytest.fixture
+def backend(tmp_path):
+    """Due regioni contigue e una separata"""
+    regions = [
+        MemoryRegion(BASE, 0x1000, "rw-"),
+        MemoryRegion(BASE + 0x1000, 0x1000, "r--"),
+        MemoryRegion(BASE + 0x10000, 0x1000, "rw-"),
+    ]
+    path = str(tmp_path / "test.snap")
+    MemorySnapshot.create(path, regions)
+    snapshot = MemorySnapshot(path, writable=True)
+    snapshot.write(BASE + 0xFFE, b"ABCD")
+    snapshot.close()
+
+    backend = SnapshotBackend(path)
+    yield backend
+    backend.close()
+
+
+def test_read_across_contiguous_regions(backend):
+    assert backend.read_bytes(BASE + 0xFFE, 4) == b"ABCD"
+
+
+def test_zero_length_read(backend):
+    assert backend.read_bytes(BASE, 0) == b""
+    assert backend.read_bytes(0x900000, 0) == b""
+
+
+def test_read_outside_snapshot(backend):
+    with pytest.raises(OSError):
+        backend.read_bytes(BASE + 0x1FFE, 4)
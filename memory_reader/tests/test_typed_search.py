@@ -0,0 +1,89 @@
+"""
+Test della ricerca tipizzata vettoriale
+"""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backends.snapshot_backend import SnapshotBackend
+from core.regions import MemoryRegion
+from core.snapshot import MemorySnapshot
+from scanners.memory_scanner import MemoryScanner
+from scanners.typed_search import TypedMatcher
+
+
+BASE = 0x10000
+
+# Valori che arrotondati a float32 si spostano più della tolleranza di default
+LARGE_FLOATS = [123456.7, 1e9 + 0.5, -3.4e38]
+
+
+def test_exact_aligned():
+    data = struct.pack("<6i", 7, 100, 3, 100, -1, 100)
+    matcher = TypedMatcher("int", 100)
+    assert matcher.find_offsets(data).tolist() == [4, 12, 20]
+
+
+def test_exact_unaligned_and_base_address():
+    data = b"\0" + struct.pack("<i", 100) + b"\0\0\0"
+    assert TypedMatcher("int", 100).find_offsets(data).tolist() == []
+    assert TypedMatcher("int", 100, aligned=False).find_offsets(data).tolist() == [1]
+    # Con base_address dispari l'offset 1 è allineato
+    assert TypedMatcher("int", 100).find_offsets(data, base_address=3).tolist() == [1]
+
+
+def test_range_mode():
+    data = struct.pack("<5i", 1, 10, 15, 20, 21)
+    matcher = TypedMatcher("int", 10, 20, mode="range")
+    assert matcher.find_offsets(data).tolist() == [4, 8, 12]
+
+
+def test_epsilon_mode():
+    data = struct.pack("<3f", 1.0, 1.0005, 1.01)
+    matcher = TypedMatcher("float", 1.0, mode="epsilon", epsilon=0.001)
+    assert matcher.find_offsets(data).tolist() == [0, 4]
+
+
+def test_limit_and_addresses():
+    data = struct.pack("<4i", 5, 5, 5, 5)
+    matcher = TypedMatcher("int", 5)
+    assert matcher.find_offsets(data, limit=8).tolist() == [0, 4]
+    assert matcher.find_addresses(data, 0x1000, 8) == [0x1000, 0x1004]
+
+
+def test_epsilon_accepts_exact_bits():
+    data = struct.pack("<3f", 1.0, float("nan"), 2.5)
+    nan = TypedMatcher("float", float("nan"), mode="epsilon", epsilon=1e-4)
+    assert nan.find_offsets(data).tolist() == [4]
+
+    near = TypedMatcher("float", 1.00005, mode="epsilon", epsilon=1e-4)
+    assert near.find_offsets(data).tolist() == [0]
+
+
+@pytest.fixture
+def backend(tmp_path):
+    """Snapshot con i float grandi scritti a offset non allineati"""
+    data = bytearray(4096)
+    for i, value in enumerate(LARGE_FLOATS):
+        struct.pack_into("<f", data, 0x100 * (i + 1) + 1, value)
+
+    path = str(tmp_path / "floats.snap")
+    MemorySnapshot.create(path, [MemoryRegion(BASE, len(data), "rw-")])
+    snapshot = MemorySnapshot(path, writable=True)
+    snapshot.write(BASE, bytes(data))
+    snapshot.close()
+
+    backend = SnapshotBackend(path)
+    yield backend
+    backend.close()
+
+
+@pytest.mark.parametrize("index,value", list(enumerate(LARGE_FLOATS)))
+def test_search_float_large_magnitude(backend, index, value):
+    scanner = MemoryScanner(backend, workers=1)
+    expected = [BASE + 0x100 * (index + 1) + 1]
+    assert scanner.search_float(value) == expected
+    assert scanner.search_float(value, tolerance=0) == expected
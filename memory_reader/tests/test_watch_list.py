@@ -0,0 +1,78 @@
+"""
+Test della watch list
+"""
+
+import struct
+
+from core.watch_list import WatchList
+
+
+BASE = 0x10000
+
+
+def test_poll_reports_changes(process):
+    process.poke(BASE, struct.pack("<if", 100, 2.5) + b"player\0")
+    changes, hp_changes = [], []
+
+    watch = WatchList(process)
+    watch.add("hp", BASE, "int", callback=lambda *change: hp_changes.append(change))
+    watch.add("speed", BASE + 4, "float")
+    watch.add("name", BASE + 8, "string", length=16)
+    watch.on_change(lambda *change: changes.append(change))
+
+    assert watch.poll() == {"hp": 100, "speed": 2.5, "name": "player"}
+    assert len(changes) == 3
+
+    changes.clear()
+    assert watch.poll()["hp"] == 100
+    assert changes == []
+
+    process.poke(BASE, struct.pack("<i", 90))
+    watch.poll()
+    assert changes == [("hp", 100, 90)]
+    assert hp_changes == [("hp", None, 100), ("hp", 100, 90)]
+
+
+def test_pointer_chain_and_unreadable(process):
+    process.poke(BASE, struct.pack("<Q", 0x20000))
+    process.poke(0x20000 + 0x10, struct.pack("<i", 7))
+
+    watch = WatchList(process)
+    watch.add("chained", BASE, "int", offsets=[0x10])
+    watch.add("unmapped", 0x900000, "int")
+
+    assert watch.poll() == {"chained": 7, "unmapped": None}
+    assert watch.poll_count == 1
+
+
+def test_nan_is_not_a_change(process):
+    process.poke(BASE, struct.pack("<f", float("nan")))
+    changes = []
+
+    watch = WatchList(process)
+    watch.add("speed", BASE, "float")
+    watch.on_change(lambda name, old, new: changes.append(name))
+
+    watch.poll()
+    watch.poll()
+    watch.poll()
+    assert changes == ["speed"]
+
+    process.poke(BASE, struct.pack("<f", 1.5))
+    watch.poll()
+    assert changes == ["speed", "speed"]
+    assert watch.values() == {"speed": 1.5}
+
+
+def test_string_garbage_after_terminator_is_not_a_change(process):
+    process.poke(BASE, b"abc\0xyz")
+    changes = []
+
+    watch = WatchList(process)
+    watch.add("name", BASE, "string", length=8)
+    watch.on_change(lambda name, old, new: changes.append(new))
+
+    watch.poll()
+    process.poke(BASE + 4, b"123")
+    watch.poll()
+    assert changes == ["abc"]